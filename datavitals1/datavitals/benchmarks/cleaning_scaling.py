@@ -0,0 +1,72 @@
+"""
+datavitals - clean_dataframe parallel scaling benchmark
+
+Times clean_dataframe on a synthetic frame for an increasing number
+of workers, for both the thread and the process executor, and checks
+that every run matches the serial output.
+
+Usage:
+    python benchmarks/cleaning_scaling.py --rows 1000000 --max-workers 8
+
+Author: Kamaleshkumar.K
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datavitals.cleaning import clean_dataframe  # noqa: E402
+
+
+def make_frame(rows: int, text_columns: int, numeric_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(text_columns):
+        data[f"text_{i}"] = pd.Series(
+            rng.choice([" alpha ", "beta", " gamma", "delta "], rows), dtype=object
+        )
+        data[f"numstr_{i}"] = pd.Series(
+            rng.integers(0, 1000, rows).astype(str), dtype=object
+        )
+    for i in range(numeric_columns):
+        data[f"num_{i}"] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--text-columns", type=int, default=8)
+    parser.add_argument("--numeric-columns", type=int, default=8)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.text_columns, args.numeric_columns)
+
+    start = time.perf_counter()
+    expected = clean_dataframe(df, drop_duplicates=False)
+    serial = time.perf_counter() - start
+    print(f"rows={args.rows} columns={df.shape[1]} serial={serial:.3f}s")
+    print(f"{'executor':<10}{'workers':>8}{'seconds':>10}{'speedup':>9}")
+
+    workers = 1
+    while workers <= args.max_workers:
+        for executor in ("thread", "process"):
+            start = time.perf_counter()
+            result = clean_dataframe(
+                df, drop_duplicates=False, workers=workers, executor=executor
+            )
+            elapsed = time.perf_counter() - start
+            pd.testing.assert_frame_equal(result, expected)
+            print(f"{executor:<10}{workers:>8}{elapsed:>10.3f}{serial / elapsed:>9.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+datavitals - synthetic benchmark data
+
+Deterministic, offline generators for "dirty" tables that exercise every
+cleaning step: padded strings, numbers stored as strings, nulls and
+duplicate rows. Two schemas are available: "narrow" (6 columns) and
+"wide" (6 + 58 columns).
+
+Author: Kamaleshkumar.K
+"""
+
+from typing import Dict, Any, List
+
+import numpy as np
+import pandas as pd
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+SCHEMAS = ("narrow", "wide")
+
+_WIDE_EXTRA = 58
+_NULL_RATE = 0.01
+_DUPLICATE_RATE = 0.05
+
+
+def _padded_choice(rng: np.random.Generator, rows: int, values: List[str]) -> np.ndarray:
+    padded = np.array([value for base in values for value in (base, f" {base}", f"{base} ")],
+                      dtype=object)
+    return padded[rng.integers(0, len(padded), rows)]
+
+
+def _with_nulls(rng: np.random.Generator, column: np.ndarray) -> np.ndarray:
+    column = column.astype(object)
+    column[rng.random(len(column)) < _NULL_RATE] = None
+    return column
+
+
+def make_frame(rows: int, schema: str = "narrow", seed: int = 42) -> pd.DataFrame:
+    """Build a dirty DataFrame with ``rows`` rows and the given schema."""
+    if schema not in SCHEMAS:
+        raise ValueError(f"Unknown schema: {schema}")
+
+    rng = np.random.default_rng(seed)
+    # About _DUPLICATE_RATE of the rows repeat the id of another row
+    ids = np.arange(rows)
+    repeated = rng.random(rows) < _DUPLICATE_RATE
+    ids[repeated] = rng.integers(0, max(1, rows), int(repeated.sum()))
+
+    def per_id(column: np.ndarray) -> np.ndarray:
+        # Values depend on the id only, so equal ids give identical rows
+        return column[ids % len(column)]
+
+    base = max(1, rows)
+    data: Dict[str, Any] = {
+        "id": ids,
+        "name": per_id(_padded_choice(rng, base, ["alice", "bob", "carol", "dave"])),
+        "amount": per_id(rng.integers(0, 100_000, base).astype(str).astype(object)),
+        "score": per_id(np.round(rng.random(base) * 100, 2)),
+        "status": per_id(_with_nulls(rng, _padded_choice(rng, base, ["active", "inactive"]))),
+        "city": per_id(_padded_choice(rng, base, ["paris", "chennai", "lima", "oslo"])),
+    }
+
+    if schema == "wide":
+        for i in range(_WIDE_EXTRA):
+            kind = i % 3
+            if kind == 0:
+                column = _padded_choice(rng, base, [f"v{j}" for j in range(8)])
+            elif kind == 1:
+                column = rng.integers(0, 1000, base).astype(str).astype(object)
+            else:
+                column = rng.random(base)
+            data[f"extra_{i}"] = per_id(column)
+
+    return pd.DataFrame(data)
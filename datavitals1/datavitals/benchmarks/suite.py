@@ -0,0 +1,374 @@
+"""
+datavitals - benchmark suite with regression baselines
+
+Runs every benchmark case (cleaning, profiling, ETL, SQL building) on synthetic
+data (see datagen.py) and reports throughput and peak memory. Results
+are compared with benchmarks/baselines.json; a case that is slower or
+uses more memory than its baseline allows fails the run (exit code 1).
+Runs offline on a plain Linux box, with no extra dependencies.
+
+Usage:
+    python benchmarks/suite.py                      # 10k rows, both schemas
+    python benchmarks/suite.py --size 1m --schema narrow -k clean
+    python benchmarks/suite.py --size 10k --record  # refresh baselines
+    python benchmarks/suite.py --size 10m -k clean  # no baselines: reported only
+
+Timings are the median of at least --repeat runs, and the interquartile
+range (IQR) of those runs is stored with each baseline. A case only
+regresses when its median exceeds the baseline by more than the tolerance
+plus the run-to-run noise of either measurement. Peak memory is measured in a
+separate run under tracemalloc (Python and NumPy allocations) and is
+reported as the peak above the memory held before the case started.
+Baselines are only comparable on the machine that recorded them.
+
+Author: Kamaleshkumar.K
+"""
+
+from typing import List, Dict, Any, Callable, Optional, NamedTuple
+import argparse
+import copy
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+# Make both datagen and the datavitals package importable when the suite is
+# run as a script from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datagen import SIZES, SCHEMAS, make_frame  # noqa: E402
+
+from datavitals.cleaning import clean_dataframe, clean_chunks  # noqa: E402
+from datavitals.destinations import SQLDestination  # noqa: E402
+from datavitals.etl import run_etl_pipeline, stream_etl_pipeline, batch_transform  # noqa: E402
+from datavitals.pipeline import Pipeline  # noqa: E402
+from datavitals.sources import DataFrameSource  # noqa: E402
+from datavitals.sql_builder import build_select_query, build_batch_lookup, QueryBuilder  # noqa: E402
+from datavitals.vitals import profile_dataframe, profile_chunks  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# Number of queries (or lookup keys) built per run by the SQL cases
+_SQL_QUERIES = 20_000
+
+
+class Case(NamedTuple):
+    name: str
+    data: str                       # "frame", "records" or "none"
+    prepare: Callable[[Any], Any]   # untimed, called before every run
+    run: Callable[[Any], Any]
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, data: str = "frame", prepare: Callable[[Any], Any] = lambda data: data):
+    def register(run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        CASES.append(Case(name, data, prepare, run))
+        return run
+    return register
+
+
+def _copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return df.copy()
+
+
+def _chunks(df: pd.DataFrame, size: int = 100_000) -> List[pd.DataFrame]:
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def _bonus(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {**record, "bonus": record["score"] * 0.1}
+
+
+@batch_transform
+def _bonus_batch(df: pd.DataFrame) -> pd.DataFrame:
+    df["bonus"] = df["score"] * 0.1
+    return df
+
+
+# -------------------------
+# Cleaning
+# -------------------------
+@case("clean_dataframe")
+def _clean_default(df):
+    clean_dataframe(df)
+
+
+@case("clean_dataframe[inplace]", prepare=_copy_frame)
+def _clean_inplace(df):
+    clean_dataframe(df, inplace=True)
+
+
+@case("clean_dataframe[hash_dedup]")
+def _clean_hash(df):
+    clean_dataframe(df, dedup_method="hash")
+
+
+@case("clean_dataframe[optimize_memory]")
+def _clean_optimize(df):
+    clean_dataframe(df, optimize_memory=True)
+
+
+@case("clean_dataframe[workers=2]")
+def _clean_threads(df):
+    clean_dataframe(df, workers=2)
+
+
+@case("clean_chunks", prepare=_chunks)
+def _clean_chunks(chunks):
+    for _ in clean_chunks(chunks):
+        pass
+
+
+# -------------------------
+# Profiling
+# -------------------------
+@case("profile_dataframe")
+def _profile(df):
+    profile_dataframe(df).report()
+
+
+@case("profile_chunks", prepare=_chunks)
+def _profile_chunks(chunks):
+    profile_chunks(chunks).report()
+
+
+# -------------------------
+# ETL
+# -------------------------
+@case("run_etl_pipeline[none]", data="records")
+def _etl_none(records):
+    run_etl_pipeline(source=records)
+
+
+# Lists of records stay on the per-record path; this baseline guards
+# against list inputs drifting back onto the columnar batch path. ("double"
+# touches every value, so it is slower than [custom] on the wide schema.)
+@case("run_etl_pipeline[double]", data="records")
+def _etl_double(records):
+    run_etl_pipeline(source=records, transform_type="double")
+
+
+@case("run_etl_pipeline[custom]", data="records")
+def _etl_custom(records):
+    run_etl_pipeline(source=records, custom_transform=_bonus)
+
+
+@case("run_etl_pipeline[batch_transform]", data="records")
+def _etl_batch(records):
+    run_etl_pipeline(source=records, custom_transform=_bonus_batch, chunksize=10_000)
+
+
+@case("run_etl_pipeline[thread]", data="records")
+def _etl_thread(records):
+    run_etl_pipeline(source=records, custom_transform=_bonus, executor="thread", max_workers=2)
+
+
+@case("run_etl_pipeline[dataframe_source->csv]")
+def _etl_csv(df):
+    with tempfile.TemporaryDirectory() as tmp:
+        run_etl_pipeline(
+            source=DataFrameSource(df, chunksize=50_000),
+            transform_type="double",
+            destination="csv",
+            destination_options={"path": os.path.join(tmp, "out.csv")},
+        )
+
+
+@case("run_etl_pipeline[sql bulk load]", data="records")
+def _etl_sql(records):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(f"CREATE TABLE t ({', '.join(records[0])})")
+    run_etl_pipeline(source=records, chunksize=10_000,
+                     destination=SQLDestination(conn, "t", paramstyle="qmark"))
+    conn.close()
+
+
+@case("stream_etl_pipeline", data="records")
+def _etl_stream(records):
+    for _ in stream_etl_pipeline(source=iter(records), custom_transform=_bonus):
+        pass
+
+
+@case("Pipeline[map,filter,clean,double]", data="records")
+def _pipeline(records):
+    Pipeline(records).map(_bonus).filter(lambda r: r["score"] > 10) \
+        .clean().map("double").run(chunksize=50_000)
+
+
+# -------------------------
+# SQL building
+# -------------------------
+@case("build_select_query[simple]", data="none")
+def _sql_simple(_):
+    for i in range(_SQL_QUERIES):
+        build_select_query(table="orders", where={"id": i}, limit=10)
+
+
+@case("build_select_query[wide]", data="none")
+def _sql_wide(_):
+    columns = [f"col_{j}" for j in range(50)]
+    where = {f"col_{j}": f"value_{j}" for j in range(20)}
+    for _ in range(_SQL_QUERIES):
+        build_select_query(table="events", columns=columns, where=where, limit=100)
+
+
+@case("build_select_query[wide,qmark]", data="none")
+def _sql_wide_params(_):
+    columns = [f"col_{j}" for j in range(50)]
+    where = {f"col_{j}": f"value_{j}" for j in range(20)}
+    for _ in range(_SQL_QUERIES):
+        build_select_query(table="events", columns=columns, where=where, limit=100,
+                           paramstyle="qmark")
+
+
+@case("build_batch_lookup[composite]", data="none")
+def _sql_batch_lookup(_):
+    keys = [{"region": f"r{i % 10}", "id": i} for i in range(_SQL_QUERIES)]
+    build_batch_lookup(table="orders", keys=keys, columns=["id", "amount"])
+
+
+@case("QueryBuilder[keyset page,qmark]", data="none")
+def _sql_keyset(_):
+    page = QueryBuilder("events").where(kind="click").order_by("created DESC", "id").limit(500)
+    for i in range(_SQL_QUERIES):
+        page.after((i, i)).build(paramstyle="qmark")
+
+
+# -------------------------
+# Runner
+# -------------------------
+def _measure(bench: Case, data: Any, repeat: int) -> Dict[str, float]:
+    # One untimed warm-up run (imports, caches), then at least ``repeat``
+    # runs, more for fast cases (up to ~0.5s in total)
+    bench.run(bench.prepare(data))
+    timings: List[float] = []
+    while len(timings) < repeat or (sum(timings) < 0.5 and len(timings) < 50):
+        args = bench.prepare(data)
+        start = time.perf_counter()
+        bench.run(args)
+        timings.append(time.perf_counter() - start)
+
+    if len(timings) >= 2:
+        quartiles = statistics.quantiles(timings, n=4)
+        iqr = quartiles[2] - quartiles[0]
+    else:
+        iqr = 0.0
+
+    args = bench.prepare(data)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        bench.run(args)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "iqr": iqr, "peak_bytes": peak}
+
+
+def _machine() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def _load_baselines(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"machine": {}, "results": {}}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _check(result: Dict[str, float], baseline: Optional[Dict[str, float]],
+           time_tolerance: float, memory_tolerance: float) -> List[str]:
+    if baseline is None:
+        return []
+    problems = []
+    # Allow for the run-to-run spread of either measurement, plus a small
+    # absolute slack that keeps millisecond-scale cases from flapping
+    noise = 2 * max(result["iqr"], baseline.get("iqr", 0.0)) + 0.005
+    if result["seconds"] > baseline["seconds"] * (1 + time_tolerance) + noise:
+        problems.append(f"time {result['seconds']:.4f}s > baseline {baseline['seconds']:.4f}s")
+    if result["peak_bytes"] > baseline["peak_bytes"] * (1 + memory_tolerance) + 64 * 1024:
+        problems.append(f"memory {result['peak_bytes']} B > baseline {baseline['peak_bytes']} B")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", choices=sorted(SIZES), default="10k")
+    parser.add_argument("--schema", choices=SCHEMAS + ("all",), default="all")
+    parser.add_argument("-k", dest="keyword", default="",
+                        help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--record", action="store_true",
+                        help="store the results as the new baselines")
+    parser.add_argument("--baselines", default=BASELINE_PATH)
+    parser.add_argument("--time-tolerance", type=float, default=0.50)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    schemas = SCHEMAS if args.schema == "all" else (args.schema,)
+    rows = SIZES[args.size]
+    stored = _load_baselines(args.baselines)
+    if stored["machine"] and stored["machine"] != _machine() and not args.record:
+        print(f"warning: baselines were recorded on {stored['machine']}")
+
+    failures = 0
+    print(f"{'case':<56}{'seconds':>10}{'rows/s':>14}{'peak MB':>10}  status")
+    for schema in schemas:
+        df = make_frame(rows, schema)
+        records = df.to_dict(orient="records")
+        for bench in CASES:
+            if args.keyword not in bench.name:
+                continue
+            if bench.data == "none" and schema != schemas[0]:
+                continue
+
+            data = {"frame": df, "records": records, "none": None}[bench.data]
+            key = bench.name if bench.data == "none" else f"{bench.name}@{args.size}/{schema}"
+            result = _measure(bench, copy.copy(data), args.repeat)
+            units = _SQL_QUERIES if bench.data == "none" else rows
+            result["per_second"] = units / result["seconds"]
+
+            baseline = stored["results"].get(key)
+            problems = _check(result, baseline, args.time_tolerance, args.memory_tolerance)
+            if problems:
+                status = "REGRESSION: " + "; ".join(problems)
+            else:
+                status = "ok" if baseline is not None else "no baseline"
+            failures += bool(problems)
+            print(f"{key:<56}{result['seconds']:>10.4f}{result['per_second']:>14,.0f}"
+                  f"{result['peak_bytes'] / 1e6:>10.1f}  {status}")
+
+            if args.record:
+                stored["results"][key] = {k: round(v, 6) for k, v in result.items()}
+
+    if args.record:
+        stored["machine"] = _machine()
+        with open(args.baselines, "w", encoding="utf-8", newline="\r\n") as fh:
+            json.dump(stored, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"baselines written to {args.baselines}")
+        return 0
+
+    if failures:
+        print(f"{failures} benchmark(s) regressed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
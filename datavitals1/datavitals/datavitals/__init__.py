@@ -2,7 +2,8 @@
 datavitals
 
 A reusable data engineering helper library that standardizes
-data cleaning, ETL pipelines, and SQL query building.
+data cleaning, ETL pipelines, SQL query building and
+data quality profiling.
 
 Project Name : datavitals
 Author       : Kamaleshkumar.K
@@ -20,17 +21,110 @@ __license__ = "MIT"
 # -------------------------
 # Public API Imports
 # -------------------------
-from .cleaning import clean_dataframe
-from .etl import run_etl_pipeline
-from .sql_builder import build_select_query
+# Submodules are imported on first attribute access (PEP 562), so
+# ``import datavitals`` stays cheap: pandas and NumPy are only loaded
+# when the cleaning APIs (or a DataFrame code path) are used.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+_EXPORTS = {
+    "cleaning": ("clean_dataframe", "clean_chunks", "clean_csv", "SchemaCache"),
+    "etl": ("run_etl_pipeline", "stream_etl_pipeline", "batch_transform", "DeadLetterQueue"),
+    "async_etl": ("arun_etl_pipeline",),
+    "pipeline": ("Pipeline",),
+    "checkpoint": ("Checkpoint", "FileCheckpoint", "SQLiteCheckpoint"),
+    "metrics": ("RunMetrics",),
+    "connections": ("ConnectionPool",),
+    "destinations": ("Destination", "register_destination"),
+    "sources": (
+        "Source",
+        "CSVSource",
+        "JSONLinesSource",
+        "ParquetSource",
+        "SQLiteSource",
+        "SQLSource",
+        "DataFrameSource",
+    ),
+    "sql_builder": ("build_select_query", "build_batch_lookup", "QueryBuilder"),
+    "vitals": ("profile_dataframe", "profile_chunks", "DataProfile"),
+}
+_EXPORT_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache it, so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
+
+
+if TYPE_CHECKING:
+    from .cleaning import clean_dataframe, clean_chunks, clean_csv, SchemaCache
+    from .etl import (
+        run_etl_pipeline,
+        stream_etl_pipeline,
+        batch_transform,
+        DeadLetterQueue,
+    )
+    from .async_etl import arun_etl_pipeline
+    from .pipeline import Pipeline
+    from .checkpoint import Checkpoint, FileCheckpoint, SQLiteCheckpoint
+    from .metrics import RunMetrics
+    from .connections import ConnectionPool
+    from .destinations import Destination, register_destination
+    from .sources import (
+        Source,
+        CSVSource,
+        JSONLinesSource,
+        ParquetSource,
+        SQLiteSource,
+        SQLSource,
+        DataFrameSource,
+    )
+    from .sql_builder import build_select_query, build_batch_lookup, QueryBuilder
+    from .vitals import profile_dataframe, profile_chunks, DataProfile
 
 # -------------------------
 # What this package exposes
 # -------------------------
 __all__ = [
     "clean_dataframe",
+    "clean_chunks",
+    "clean_csv",
+    "SchemaCache",
     "run_etl_pipeline",
+    "stream_etl_pipeline",
+    "batch_transform",
+    "DeadLetterQueue",
+    "arun_etl_pipeline",
+    "Pipeline",
+    "Checkpoint",
+    "FileCheckpoint",
+    "SQLiteCheckpoint",
+    "RunMetrics",
+    "ConnectionPool",
+    "Destination",
+    "register_destination",
+    "Source",
+    "CSVSource",
+    "JSONLinesSource",
+    "ParquetSource",
+    "SQLiteSource",
+    "SQLSource",
+    "DataFrameSource",
     "build_select_query",
+    "build_batch_lookup",
+    "QueryBuilder",
+    "profile_dataframe",
+    "profile_chunks",
+    "DataProfile",
     "__project_name__",
     "__author__",
     "__version__",
@@ -0,0 +1,232 @@
+"""
+datavitals.async_etl
+
+Provides an asyncio counterpart of run_etl_pipeline for I/O-bound
+transforms, with bounded concurrency and backpressure between the
+extract, transform and load stages.
+
+Author: Kamaleshkumar.K
+"""
+
+from typing import List, Dict, Any, Callable, Optional
+import asyncio
+import inspect
+
+from .etl import (
+    ETLError,
+    _BATCH_FORMAT_ATTR,
+    _batch_to_records,
+    _double_numeric_values,
+    _identity_transform,
+    _is_batch_source,
+)
+
+_DONE = object()
+
+
+class _ExtractFailed:
+    """Queue marker carrying an exception raised by the extract stage."""
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+def _resolve_async_transform(
+    transform_type: str,
+    custom_transform: Optional[Callable[[Dict[str, Any]], Any]]
+) -> Callable[[Dict[str, Any]], Any]:
+    if custom_transform:
+        if hasattr(custom_transform, _BATCH_FORMAT_ATTR):
+            raise ETLError("Batch transforms are not supported by arun_etl_pipeline")
+        return custom_transform
+    if transform_type == "double":
+        return _double_numeric_values
+    if transform_type == "none":
+        return _identity_transform
+    raise ETLError(f"Unsupported transform type: {transform_type}")
+
+
+async def _atransform_record(
+    record: Any,
+    transform_fn: Callable[[Dict[str, Any]], Any]
+) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ETLError("Each source record must be a dictionary")
+
+    try:
+        result = transform_fn(record)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    except Exception as exc:
+        raise ETLError(f"Transformation failed for record {record}") from exc
+
+
+async def _aiter_records(source: Any):
+    """Iterate an async iterable, a Source or a plain iterable of records."""
+    if hasattr(source, "__aiter__"):
+        async for record in source:
+            yield record
+        return
+
+    if _is_batch_source(source):
+        # Read batches in a worker thread so file I/O does not block the
+        # loop. Sources may hold thread-bound handles (SQLiteSource), so
+        # the iterator is always advanced on the same thread.
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        source_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="datavitals-source")
+        batches = source.iter_batches()
+        try:
+            while True:
+                batch = await loop.run_in_executor(source_thread, next, batches, _DONE)
+                if batch is _DONE:
+                    return
+                for record in _batch_to_records(batch):
+                    yield record
+        finally:
+            # Release the source's handles on its own thread too
+            source_thread.submit(getattr(batches, "close", lambda: None))
+            source_thread.shutdown(wait=False)
+        return
+
+    for record in source:
+        yield record
+        # Give the transform and load stages a chance to run
+        await asyncio.sleep(0)
+
+
+async def arun_etl_pipeline(
+    *,
+    source: Any,
+    transform_type: str = "none",
+    destination: Any = "memory",
+    custom_transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    concurrency: int = 10,
+    queue_size: int = 100,
+    chunksize: int = 1000,
+    destination_options: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Run the ETL pipeline on an asyncio event loop.
+
+    ``source`` may be an async iterable, a datavitals.sources.Source or any
+    iterable of dicts. ``custom_transform`` may be a regular function or a
+    coroutine function; at most ``concurrency`` transforms run at once.
+
+    The extract stage stops reading once ``queue_size`` records are waiting
+    to be loaded, so a slow destination applies backpressure instead of
+    letting memory grow. Output order matches the input order and records
+    reach the destination in batches of ``chunksize``. Returns the same
+    value as run_etl_pipeline; failures raise ETLError.
+    """
+
+    if source is None:
+        raise ETLError("Source data cannot be None")
+
+    if isinstance(source, (str, bytes, dict)) or not (
+            hasattr(source, "__aiter__") or hasattr(source, "__iter__")):
+        raise ETLError("Source data must be an iterable or async iterable of dictionaries")
+
+    for name, value in (("concurrency", concurrency), ("queue_size", queue_size),
+                        ("chunksize", chunksize)):
+        if not isinstance(value, int) or value <= 0:
+            raise ETLError(f"{name} must be a positive integer")
+
+    transform_fn = _resolve_async_transform(transform_type, custom_transform)
+
+    from .destinations import MemoryDestination, get_destination
+    sink = get_destination(destination, destination_options)
+
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+
+    # Sinks may hold thread-bound handles (sqlite3 and other DB-API
+    # connections), so every sink call runs on the same worker thread.
+    sink_thread = None
+    if not isinstance(sink, MemoryDestination):
+        from concurrent.futures import ThreadPoolExecutor
+        sink_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="datavitals-sink")
+
+    async def call_sink(method: Callable[..., Any], *args: Any) -> Any:
+        if sink_thread is None:
+            return method(*args)
+        result = await loop.run_in_executor(sink_thread, method, *args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def write(batch: List[Dict[str, Any]]) -> None:
+        try:
+            await call_sink(sink.write_batch, batch)
+        except ETLError:
+            raise
+        except Exception as exc:
+            raise ETLError(f"Loading into {type(sink).__name__} failed") from exc
+
+    async def transform(record: Any) -> Dict[str, Any]:
+        async with limit:
+            return await _atransform_record(record, transform_fn)
+
+    async def extract() -> None:
+        try:
+            async for record in _aiter_records(source):
+                # Tasks are queued in input order; put() blocks when the
+                # loader falls behind.
+                task = asyncio.ensure_future(transform(record))
+                try:
+                    await queue.put(task)
+                except BaseException:
+                    task.cancel()
+                    raise
+        except Exception as exc:
+            await queue.put(_ExtractFailed(exc))
+            return
+        await queue.put(_DONE)
+
+    async def load() -> None:
+        batch: List[Dict[str, Any]] = []
+        while True:
+            task = await queue.get()
+            if task is _DONE:
+                break
+            if isinstance(task, _ExtractFailed):
+                if isinstance(task.exc, ETLError):
+                    raise task.exc
+                raise ETLError("Extracting from source failed") from task.exc
+            batch.append(await task)
+            if len(batch) >= chunksize:
+                await write(batch)
+                batch = []
+        if batch:
+            await write(batch)
+
+    try:
+        await call_sink(sink.open)
+        extractor = asyncio.ensure_future(extract())
+        try:
+            await load()
+            await extractor
+        except BaseException:
+            extractor.cancel()
+            while not queue.empty():
+                pending = queue.get_nowait()
+                if isinstance(pending, asyncio.Future):
+                    pending.cancel()
+                    if pending.done() and not pending.cancelled():
+                        # Mark the exception as retrieved
+                        pending.exception()
+            await call_sink(sink.abort)
+            raise
+
+        try:
+            return await call_sink(sink.close)
+        except ETLError:
+            raise
+        except Exception as exc:
+            raise ETLError(f"Closing {type(sink).__name__} failed") from exc
+    finally:
+        if sink_thread is not None:
+            sink_thread.shutdown(wait=False)
@@ -0,0 +1,326 @@
+"""
+datavitals.checkpoint
+
+Provides checkpoint stores (JSON file, SQLite) that let ETL runs resume
+from the last committed batch, and the watermark bookkeeping behind
+incremental extraction.
+
+Author: Kamaleshkumar.K
+"""
+
+from datetime import date, datetime
+from collections import deque
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple, Union
+import json
+import os
+import sqlite3
+
+from .etl import ETLError, _is_batch_source, _is_dataframe, _iter_batches
+
+
+# -------------------------
+# Checkpoint stores
+# -------------------------
+class Checkpoint:
+    """
+    Base class for checkpoint stores.
+
+    A store keeps one small JSON-serializable state dict per ``key`` (one
+    key per job): load() returns it ({} when nothing was saved), save()
+    replaces it atomically and clear() forgets it.
+    """
+
+    def load(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def save(self, state: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class FileCheckpoint(Checkpoint):
+    """
+    Stores checkpoints in a local JSON file.
+
+    Several jobs can share one file under different keys. The file is
+    rewritten through a temporary file and os.replace, so a crash never
+    leaves a half-written state behind.
+    """
+
+    def __init__(self, path: str, *, key: str = "default") -> None:
+        if not key or not isinstance(key, str):
+            raise ETLError("Checkpoint key must be a non-empty string")
+        self.path = os.fspath(path)
+        self.key = key
+
+    def _read(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            raise ETLError(f"Invalid checkpoint file: {self.path}") from exc
+        if not isinstance(data, dict):
+            raise ETLError(f"Invalid checkpoint file: {self.path}")
+        return data
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, self.path)
+
+    def load(self) -> Dict[str, Any]:
+        return dict(self._read().get(self.key, {}))
+
+    def save(self, state: Dict[str, Any]) -> None:
+        data = self._read()
+        data[self.key] = state
+        self._write(data)
+
+    def clear(self) -> None:
+        data = self._read()
+        if data.pop(self.key, None) is not None:
+            self._write(data)
+
+
+class SQLiteCheckpoint(Checkpoint):
+    """
+    Stores checkpoints in a SQLite table, one row per key.
+
+    ``database`` is a file path or an open sqlite3 connection (which is
+    left open). Every save is its own transaction.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        *,
+        key: str = "default",
+        table: str = "datavitals_checkpoints"
+    ) -> None:
+        if not key or not isinstance(key, str):
+            raise ETLError("Checkpoint key must be a non-empty string")
+        if not table or not isinstance(table, str):
+            raise ETLError("Checkpoint table must be a non-empty string")
+        self.database = database
+        self.key = key
+        self.table = table
+
+    def _execute(self, sql: str, params: Tuple[Any, ...] = ()) -> Any:
+        from .destinations import _quote_identifier
+
+        owns_connection = not isinstance(self.database, sqlite3.Connection)
+        conn = sqlite3.connect(self.database) if owns_connection else self.database
+        table = _quote_identifier(self.table)
+        try:
+            with conn:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    "(key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+                )
+                return conn.execute(sql.format(table=table), params).fetchone()
+        finally:
+            if owns_connection:
+                conn.close()
+
+    def load(self) -> Dict[str, Any]:
+        row = self._execute("SELECT state FROM {table} WHERE key = ?", (self.key,))
+        if row is None:
+            return {}
+        try:
+            return json.loads(row[0])
+        except ValueError as exc:
+            raise ETLError(f"Invalid checkpoint state for key '{self.key}'") from exc
+
+    def save(self, state: Dict[str, Any]) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO {table} (key, state) VALUES (?, ?)",
+            (self.key, json.dumps(state)),
+        )
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM {table} WHERE key = ?", (self.key,))
+
+
+# -------------------------
+# Watermark values
+# -------------------------
+def _encode_watermark(value: Any) -> Any:
+    """Make a watermark value JSON-serializable."""
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if hasattr(value, "item"):
+        # NumPy scalar
+        return value.item()
+    return value
+
+
+def _decode_watermark(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])
+        if "date" in value:
+            return date.fromisoformat(value["date"])
+    return value
+
+
+def _newer(value: Any, since: Any) -> bool:
+    try:
+        return since is None or (value is not None and value > since)
+    except TypeError as exc:
+        raise ETLError(f"Cannot compare watermark value {value!r} with {since!r}") from exc
+
+
+def _higher(current: Any, value: Any) -> Any:
+    if value is None or value != value:
+        # None / NaN never move the watermark
+        return current
+    return value if current is None or value > current else current
+
+
+def _filter_batch(batch: Any, field: str, since: Any, apply: bool) -> Tuple[Any, Any]:
+    """Keep the records newer than ``since``; return them with their highest watermark."""
+    if _is_dataframe(batch):
+        if field not in batch.columns:
+            raise ETLError(f"Watermark field '{field}' not found in source")
+        if apply and since is not None:
+            try:
+                batch = batch[batch[field] > since]
+            except TypeError as exc:
+                raise ETLError(f"Cannot compare watermark field '{field}' with {since!r}") from exc
+        return batch, (batch[field].max() if len(batch) else None)
+
+    kept = []
+    high = None
+    for record in batch:
+        if not isinstance(record, dict):
+            # Left for the transform step to reject
+            kept.append(record)
+            continue
+        value = record.get(field)
+        if not apply or _newer(value, since):
+            kept.append(record)
+            high = _higher(high, value)
+    return kept, high
+
+
+# -------------------------
+# Checkpointed runs
+# -------------------------
+class _IncrementalRun:
+    """
+    Tracks the progress of one checkpointed and/or incremental run.
+
+    The state saved after every ``every`` loaded batches is:
+
+    - ``offset``: records of the (filtered) source already loaded
+    - ``since``: the lower watermark bound of the run in progress
+    - ``watermark``: the highest watermark value loaded so far
+    - ``position``: the destination's flush() token, used to resume it
+
+    A completed run resets offset and keeps the watermark, so the next
+    run extracts only records newer than it.
+    """
+
+    def __init__(
+        self,
+        checkpoint: Optional[Checkpoint],
+        every: int,
+        field: Optional[str],
+        since: Any
+    ) -> None:
+        if checkpoint is not None and not isinstance(checkpoint, Checkpoint):
+            raise ETLError("checkpoint must be a Checkpoint instance")
+        if not isinstance(every, int) or every <= 0:
+            raise ETLError("checkpoint_every must be a positive integer")
+        if field is not None and (not field or not isinstance(field, str)):
+            raise ETLError("watermark must be a field name")
+        if since is not None and field is None:
+            raise ETLError("since requires a watermark field")
+
+        state = checkpoint.load() if checkpoint is not None else {}
+        stored_since = _decode_watermark(state.get("since"))
+        offset = state.get("offset", 0)
+
+        self.checkpoint = checkpoint
+        self.every = every
+        self.field = field
+        self.watermark = _decode_watermark(state.get("watermark"))
+
+        if offset and (since is None or since == stored_since):
+            # Resume the interrupted run with its own bounds
+            self.since = stored_since
+            self.offset = offset
+            self.position = state.get("position")
+        else:
+            self.since = since if since is not None else (
+                self.watermark if field is not None else None
+            )
+            self.offset = 0
+            self.position = None
+
+        self.resuming = self.offset > 0
+        self._pending: deque = deque()
+        self._batches = 0
+
+    def extract(self, source: Any, chunksize: int) -> Iterator[Any]:
+        """Yield source batches after the checkpoint and newer than the watermark."""
+        apply = True
+        if _is_batch_source(source):
+            if self.field is not None and self.since is not None:
+                pushed = getattr(source, "filter_since", lambda *_: None)(
+                    self.field, self.since
+                )
+                if pushed is not None:
+                    source, apply = pushed, False
+            batches: Iterable[Any] = source.iter_batches()
+        else:
+            batches = _iter_batches(source, chunksize)
+
+        skip = self.offset
+        for batch in batches:
+            high = None
+            if self.field is not None:
+                batch, high = _filter_batch(batch, self.field, self.since, apply)
+
+            if skip:
+                if skip >= len(batch):
+                    skip -= len(batch)
+                    continue
+                batch = batch[skip:] if isinstance(batch, list) else batch.iloc[skip:]
+                skip = 0
+
+            if len(batch) == 0:
+                continue
+            self._pending.append((len(batch), high))
+            yield batch
+
+    def committed(self, destination: Any) -> None:
+        """Record that the oldest outstanding batch reached the destination."""
+        size, high = self._pending.popleft()
+        self.offset += size
+        self.watermark = _higher(self.watermark, high)
+        self._batches += 1
+        if self.checkpoint is not None and self._batches % self.every == 0:
+            self.position = destination.flush()
+            self._save(self.offset, self.since, self.position)
+
+    def finish(self) -> None:
+        if self.checkpoint is not None:
+            self._save(0, None, None)
+
+    def _save(self, offset: int, since: Any, position: Any) -> None:
+        self.checkpoint.save({
+            "offset": offset,
+            "since": _encode_watermark(since),
+            "watermark": _encode_watermark(self.watermark),
+            "position": position,
+        })
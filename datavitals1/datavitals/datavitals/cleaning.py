@@ -7,15 +7,697 @@ for reusable data engineering pipelines.
 Author: Kamaleshkumar.K
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, NamedTuple, Iterable, Iterator, Tuple
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import warnings
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional
+    pa = None
+    pc = None
+
 
 class DataCleaningError(Exception):
     """Custom exception for data cleaning errors."""
     pass
 
 
+# -------------------------
+# Cleaning plan
+# -------------------------
+# Number of values sampled to rule out numeric conversion
+# before paying for a full-column pd.to_numeric attempt.
+_NUMERIC_PROBE_SIZE = 64
+
+# String columns with at most this share of distinct values become
+# categoricals in the optimize_memory stage.
+_CATEGORY_MAX_RATIO = 0.5
+
+# Outcomes of numeric coercion remembered by SchemaCache. A text outcome
+# may also be a (_TEXT, value) pair holding a value that failed to parse.
+_NUMERIC = "numeric"
+_TEXT = "text"
+
+_UNPARSED_POSITION = re.compile(r"at position (\d+)")
+
+# Dtype produced by ``Series.astype(str)`` on this pandas version
+# (object on pandas < 3, the "str" StringDtype on pandas >= 3).
+_STR_DTYPE = pd.Series([""], dtype=object).astype(str).dtype
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+_ARROW_TRIM = (
+    pc is not None
+    and isinstance(_STR_DTYPE, pd.StringDtype)
+    and _STR_DTYPE.storage == "pyarrow"
+)
+
+
+class _ColumnPlan(NamedTuple):
+    """Work scheduled for a single column."""
+    position: int
+    trim: bool
+    fill: bool
+    fill_value: Any
+    coerce: bool
+    numeric_hint: Any = None
+
+
+def _string_columns(df: pd.DataFrame) -> set:
+    """Columns treated as strings by the trim step."""
+    with warnings.catch_warnings():
+        # pandas 3 still selects "str" columns for include=["object"]
+        # but warns about it; we rely on that behaviour on purpose.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return set(df.select_dtypes(include=["object"]).columns)
+
+
+def _build_plan(
+        df: pd.DataFrame,
+        *,
+        trim_strings: bool,
+        convert_numeric: bool,
+        fillna_map: Optional[Dict[str, Any]],
+        numeric_hints: Optional[List[Any]] = None
+) -> List[_ColumnPlan]:
+    """Inspect dtypes once and schedule the per-column work."""
+    string_columns = _string_columns(df) if trim_strings else set()
+    fillna_map = fillna_map or {}
+    numeric_hints = numeric_hints or [None] * len(df.columns)
+
+    plan = []
+    for position, col in enumerate(df.columns):
+        fill = col in fillna_map
+        column_plan = _ColumnPlan(
+            position=position,
+            trim=col in string_columns,
+            fill=fill,
+            fill_value=fillna_map[col] if fill else None,
+            coerce=convert_numeric,
+            numeric_hint=numeric_hints[position],
+        )
+        if column_plan.trim or column_plan.fill or column_plan.coerce:
+            plan.append(column_plan)
+    return plan
+
+
+def _trim_series(series: pd.Series) -> pd.Series:
+    """Equivalent of ``series.astype(str).str.strip()``."""
+    if isinstance(series.dtype, pd.StringDtype) and series.dtype == _STR_DTYPE:
+        # astype(str) would be a no-op
+        return series.str.strip()
+
+    if _ARROW_TRIM and series.dtype == object:
+        try:
+            values = pa.array(series.to_numpy(), type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed Python objects need str() on every cell
+            pass
+        else:
+            trimmed = pc.utf8_trim_whitespace(values)
+            return pd.Series(
+                pd.array(trimmed, dtype=_STR_DTYPE),
+                index=series.index,
+                name=series.name,
+            )
+
+    return series.astype(str).str.strip()
+
+
+def _numeric_sample(series: pd.Series) -> Optional[pd.Series]:
+    """Evenly spaced sample of a column, or None if it is already small."""
+    if len(series) <= _NUMERIC_PROBE_SIZE:
+        return None
+    step = len(series) // _NUMERIC_PROBE_SIZE
+    return series.iloc[::step]
+
+
+def _is_text_outcome(outcome: Any) -> bool:
+    return outcome == _TEXT or (isinstance(outcome, tuple) and outcome[0] == _TEXT)
+
+
+def _text_outcome(series: pd.Series, exc: Exception) -> Any:
+    """_TEXT, paired with the string pd.to_numeric failed on when it is known."""
+    match = _UNPARSED_POSITION.search(str(exc))
+    if match is not None and int(match.group(1)) < len(series):
+        value = series.iloc[int(match.group(1))]
+        if isinstance(value, str):
+            return (_TEXT, value)
+    return _TEXT
+
+
+def _coerce_numeric(
+        series: pd.Series,
+        hint: Any = None
+) -> Tuple[pd.Series, Any]:
+    """
+    Convert a column with pd.to_numeric, leaving it untouched on failure.
+
+    Returns the column and the outcome (_NUMERIC, a text outcome, or None
+    when the column is numeric already). A _NUMERIC hint skips the sample
+    probe. A text hint that remembers an unparseable value skips the full
+    conversion while that value is still in the column; otherwise (drift)
+    the full trial runs as without a hint.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_numeric_dtype(dtype):
+        # pd.to_numeric is a no-op for numeric and boolean columns
+        return series, None
+
+    text = hint if _is_text_outcome(hint) else _TEXT
+    if hint != _NUMERIC and (dtype == object or isinstance(dtype, pd.StringDtype)):
+        # A single unparseable value fails the whole column, so a cheap
+        # probe on a sample rules out most text columns.
+        sample = _numeric_sample(series)
+        if sample is not None:
+            try:
+                pd.to_numeric(sample)
+            except Exception:
+                return series, text
+        if isinstance(hint, tuple) and (series == hint[1]).any():
+            # Text missed by the sample: the value that failed before is
+            # still present, so the full conversion would fail again
+            return series, hint
+
+    try:
+        return pd.to_numeric(series), _NUMERIC
+    except Exception as exc:
+        # Skip columns that cannot be converted to numeric
+        return series, _text_outcome(series, exc)
+
+
+def _run_column_plan(
+        series: pd.Series,
+        column_plan: _ColumnPlan
+) -> Tuple[pd.Series, Any]:
+    """Trim, fill and coerce one column; returns it with its numeric outcome."""
+    outcome = None
+    if column_plan.trim:
+        series = _trim_series(series)
+    if column_plan.fill and series.hasnans:
+        series = series.fillna(column_plan.fill_value)
+    if column_plan.coerce:
+        series, outcome = _coerce_numeric(series, column_plan.numeric_hint)
+    return series, outcome
+
+
+def _apply_plan(
+        df: pd.DataFrame,
+        plan: List[_ColumnPlan],
+        workers: int = 1
+) -> Dict[int, Any]:
+    """
+    Run trim, fill and numeric coercion column by column, in place.
+
+    With workers > 1 the columns are cleaned in a thread pool; the pyarrow
+    and most pandas kernels release the GIL. Returns the numeric coercion
+    outcome of each planned column position.
+    """
+    # Columns are extracted up front so worker threads never touch df
+    columns = [df.iloc[:, column_plan.position] for column_plan in plan]
+
+    if workers > 1 and len(plan) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_column_plan, columns, plan))
+    else:
+        results = [_run_column_plan(col, column_plan)
+                   for col, column_plan in zip(columns, plan)]
+
+    outcomes = {}
+    for column_plan, original, (series, outcome) in zip(plan, columns, results):
+        if column_plan.coerce:
+            outcomes[column_plan.position] = outcome
+        if series is not original:
+            df.isetitem(column_plan.position, series)
+    return outcomes
+
+
+def _clean_partition(
+        part: pd.DataFrame,
+        plan: List[_ColumnPlan]
+) -> List[Tuple[pd.Series, Any]]:
+    """Process pool task: clean the columns of one row range."""
+    return [_run_column_plan(part.iloc[:, i], column_plan)
+            for i, column_plan in enumerate(plan)]
+
+
+def _apply_plan_partitioned(
+        df: pd.DataFrame,
+        plan: List[_ColumnPlan],
+        workers: int
+) -> Dict[int, Any]:
+    """
+    Same as _apply_plan, but splits the rows into ranges that are cleaned
+    in a process pool.
+
+    Only the columns with pending work are sent to the workers. A column
+    whose partitions disagree (numeric in one range, text in another) is
+    recomputed serially, so the result always matches the serial path.
+    """
+    dtypes = df.dtypes
+    active = [
+        column_plan for column_plan in plan
+        if column_plan.trim or column_plan.fill
+        or not pd.api.types.is_numeric_dtype(dtypes.iloc[column_plan.position])
+    ]
+    outcomes: Dict[int, Any] = {
+        column_plan.position: None for column_plan in plan if column_plan.coerce
+    }
+    if not active:
+        return outcomes
+
+    sub = df.iloc[:, [column_plan.position for column_plan in active]]
+    bounds = np.linspace(0, len(sub), workers + 1, dtype=int)
+    parts = [sub.iloc[start:stop]
+             for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_clean_partition, parts, itertools.repeat(active)))
+
+    for j, column_plan in enumerate(active):
+        pieces = [result[j][0] for result in results]
+        part_outcomes = [result[j][1] for result in results]
+        # Text partitions may remember different unparseable values
+        kinds = {_TEXT if _is_text_outcome(outcome) else outcome for outcome in part_outcomes}
+        piece_dtypes = {str(piece.dtype) for piece in pieces}
+
+        if len(kinds) == 1 and (
+                len(piece_dtypes) == 1 or piece_dtypes <= {"int64", "float64"}):
+            series = pd.concat(pieces)
+            outcome = part_outcomes[0]
+        else:
+            series, outcome = _run_column_plan(
+                df.iloc[:, column_plan.position], column_plan
+            )
+
+        if column_plan.coerce:
+            outcomes[column_plan.position] = outcome
+        df.isetitem(column_plan.position, series)
+    return outcomes
+
+
+# -------------------------
+# Schema cache
+# -------------------------
+def _schema_signature(df: pd.DataFrame) -> Tuple[Tuple[str, str], ...]:
+    """Column names and dtypes identifying a batch schema."""
+    return tuple((str(col), str(dtype)) for col, dtype in df.dtypes.items())
+
+
+class SchemaCache:
+    """
+    Remembers numeric coercion outcomes per batch schema.
+
+    Batches are keyed by their column-name + dtype signature and the most
+    recently used ``maxsize`` schemas are kept. On a hit, columns known to
+    be numeric are converted without probing, and columns known to be text
+    skip the full pd.to_numeric attempt once a sample, or a scan for the
+    value that failed to parse before, confirms they still hold
+    non-numeric values. Any other outcome falls back to a full trial and
+    the learned plan is updated, so results never differ from an uncached
+    run.
+
+    If ``path`` is given, the cache is loaded from that JSON file and
+    written back whenever a plan changes.
+    """
+
+    def __init__(self, maxsize: int = 128, path: Optional[str] = None) -> None:
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise DataCleaningError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.path = path
+        self._plans: "OrderedDict[tuple, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def _hints(self, signature: tuple) -> Optional[List[Any]]:
+        """Learned per-column outcomes for a schema, if any."""
+        with self._lock:
+            hints = self._plans.get(signature)
+            if hints is not None:
+                self._plans.move_to_end(signature)
+            return list(hints) if hints is not None else None
+
+    def _learn(self, signature: tuple, outcomes: Dict[int, Any]) -> None:
+        """Record numeric coercion outcomes for a schema."""
+        with self._lock:
+            hints = list(self._plans.get(signature, [None] * len(signature)))
+            for position, outcome in outcomes.items():
+                hints[position] = outcome
+
+            changed = self._plans.get(signature) != hints
+            self._plans[signature] = hints
+            self._plans.move_to_end(signature)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+            if changed and self.path:
+                self._save(self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Persist the cache as JSON."""
+        path = path or self.path
+        if not path:
+            raise DataCleaningError("No path given to save the schema cache")
+        with self._lock:
+            self._save(path)
+
+    def _save(self, path: str) -> None:
+        entries = [
+            {"signature": [list(pair) for pair in signature], "numeric": hints}
+            for signature, hints in self._plans.items()
+        ]
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(entries, fh)
+        os.replace(tmp_path, path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entries = json.load(fh)
+            for entry in entries[-self.maxsize:]:
+                signature = tuple(tuple(pair) for pair in entry["signature"])
+                # JSON stores (_TEXT, value) pairs as lists
+                self._plans[signature] = [
+                    tuple(hint) if isinstance(hint, list) else hint
+                    for hint in entry["numeric"]
+                ]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise DataCleaningError(f"Invalid schema cache file: {path}") from exc
+
+
+def _copy_on_write_enabled() -> bool:
+    """True when pandas copy-on-write makes shallow copies safe."""
+    if _PANDAS_MAJOR >= 3:
+        return True
+    return getattr(pd.options.mode, "copy_on_write", False) is True
+
+
+def _clean_values(
+        df: pd.DataFrame,
+        *,
+        drop_nulls: bool,
+        trim_strings: bool,
+        convert_numeric: bool,
+        fillna_map: Optional[Dict[str, Any]],
+        schema_cache: Optional[SchemaCache] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        stats: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """Run steps 1-4 on a frame the caller owns (its columns are replaced)."""
+    if stats is not None:
+        started = time.perf_counter()
+    signature = None
+    numeric_hints = None
+    if schema_cache is not None and convert_numeric:
+        signature = _schema_signature(df)
+        numeric_hints = schema_cache._hints(signature)
+
+    plan = _build_plan(
+        df,
+        trim_strings=trim_strings,
+        convert_numeric=convert_numeric,
+        fillna_map=fillna_map,
+        numeric_hints=numeric_hints,
+    )
+    if workers > 1 and executor == "process":
+        outcomes = _apply_plan_partitioned(df, plan, workers)
+    else:
+        outcomes = _apply_plan(df, plan, workers)
+
+    if signature is not None:
+        schema_cache._learn(signature, outcomes)
+
+    if stats is not None:
+        rows = len(df)
+        _add_step(stats, "values", started)
+        started = time.perf_counter()
+
+    if drop_nulls:
+        df = df.dropna(how="any")
+
+    if stats is not None:
+        _add_step(stats, "nulls", started)
+        stats["rows_dropped_nulls"] = stats.get("rows_dropped_nulls", 0) + rows - len(df)
+    return df
+
+
+def _add_step(stats: Dict[str, Any], step: str, started: float) -> None:
+    """Add the time since ``started`` to stats["step_seconds"][step]."""
+    seconds = stats.setdefault("step_seconds", {})
+    seconds[step] = seconds.get(step, 0.0) + time.perf_counter() - started
+
+
+def _compact_string_dtype() -> Any:
+    """Arrow-backed string dtype, or None if pyarrow is unavailable."""
+    if isinstance(_STR_DTYPE, pd.StringDtype) and _STR_DTYPE.storage == "pyarrow":
+        return _STR_DTYPE
+    if pa is not None:
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _downcast_series(series: pd.Series) -> pd.Series:
+    """Smallest lossless representation of a column (may return it as-is)."""
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return pd.to_numeric(series, downcast="integer")
+
+    if pd.api.types.is_float_dtype(dtype) and isinstance(dtype, np.dtype):
+        if dtype.itemsize > 4:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(dtype), values, equal_nan=True):
+                return pd.Series(narrowed, index=series.index, name=series.name)
+        return series
+
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        try:
+            distinct = series.nunique(dropna=False)
+        except TypeError:
+            # Unhashable values
+            return series
+        if distinct <= _CATEGORY_MAX_RATIO * len(series):
+            return series.astype("category")
+
+        string_dtype = _compact_string_dtype()
+        if dtype == object and string_dtype is not None \
+                and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return series.astype(string_dtype)
+
+    return series
+
+
+def _optimize_memory(df: pd.DataFrame) -> None:
+    """Downcast numeric columns and compact string columns, in place."""
+    for position in range(df.shape[1]):
+        original = df.iloc[:, position]
+        series = _downcast_series(original)
+        if series is not original:
+            df.isetitem(position, series)
+
+
+def _validate_parallelism(workers: int, executor: str) -> None:
+    if not isinstance(workers, int) or workers <= 0:
+        raise DataCleaningError("workers must be a positive integer")
+    if executor not in ("thread", "process"):
+        raise DataCleaningError(f"Unsupported executor: {executor}")
+
+
+def _validate_dedup(
+        df_columns: Optional[pd.Index],
+        dedup_keys: Optional[List[str]],
+        keep: Any,
+        dedup_method: str,
+        methods: Tuple[str, ...]
+) -> None:
+    if dedup_method not in methods:
+        raise DataCleaningError(f"Unsupported dedup method: {dedup_method}")
+    if keep not in ("first", "last", False):
+        raise DataCleaningError("keep must be 'first', 'last' or False")
+    if dedup_keys is not None:
+        if not isinstance(dedup_keys, list) or not dedup_keys:
+            raise DataCleaningError("dedup_keys must be a non-empty list of columns")
+        if df_columns is not None:
+            missing = [key for key in dedup_keys if key not in df_columns]
+            if missing:
+                raise DataCleaningError(f"Unknown dedup_keys columns: {missing}")
+
+
+# What pandas hashes missing values to
+_NULL_HASH = pd.util.hash_array(np.array([None], dtype=object))[0]
+_NAN_HASH = pd.util.hash_array(np.array([np.nan]))[0]
+
+# Multiplier used to fold column hashes into one row hash
+_ROW_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _numeric_hashes(series: pd.Series) -> np.ndarray:
+    """
+    Hashes of a numeric column that do not depend on its dtype.
+
+    A chunk where a column has nulls reads it as float, so integral floats
+    hash as the equal int64 (1.0 like 1); other floats hash as floats.
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        hashes = pd.util.hash_array(series.to_numpy(dtype=np.int64, na_value=0))
+        if series.hasnans:
+            hashes[series.isna().to_numpy()] = _NAN_HASH
+        return hashes
+
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    hashes = pd.util.hash_array(values)
+    with np.errstate(invalid="ignore"):
+        integral = (np.floor(values) == values) & (np.abs(values) < 2.0 ** 63)
+    if integral.any():
+        hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    return hashes
+
+
+def _arrow_string_hashes(series: pd.Series) -> np.ndarray:
+    """
+    hash_pandas_object for Arrow-backed strings, without converting them.
+
+    pandas turns the column into Python strings to hash it; dictionary
+    encoding in Arrow leaves only the distinct strings to convert.
+    """
+    values = pa.array(series.array)
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    encoded = pc.dictionary_encode(values)
+    strings = encoded.dictionary.to_numpy(zero_copy_only=False)
+    lookup = np.append(pd.util.hash_array(strings), _NULL_HASH)
+    return lookup[encoded.indices.fill_null(len(strings)).to_numpy()]
+
+
+def _object_hashes(series: pd.Series) -> np.ndarray:
+    """
+    Hashes of an object column holding values of more than one type.
+
+    pandas hashes such columns by str(), so 1 and "1" would collide.
+    Strings and nulls hash as in a text column and numbers as in a numeric
+    one; anything else (bools, lists, dicts...) by type name and str().
+    """
+    values = series.to_numpy(dtype=object)
+    nulls = series.isna().to_numpy()
+    text = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    numbers = np.fromiter(
+        (isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, (bool, np.bool_))
+         for v in values),
+        dtype=bool,
+        count=len(values),
+    ) & ~nulls
+    other = ~(nulls | text | numbers)
+
+    hashes = np.full(len(values), _NULL_HASH, dtype=np.uint64)
+    if text.any():
+        hashes[text] = pd.util.hash_array(values[text])
+    if numbers.any():
+        hashes[numbers] = _numeric_hashes(pd.Series(values[numbers].astype(np.float64)))
+    if other.any():
+        tagged = [f"{type(v).__name__}:{v}" for v in values[other]]
+        hashes[other] = pd.util.hash_array(np.array(tagged, dtype=object))
+    return hashes
+
+
+def _value_hashes(series: pd.Series) -> np.ndarray:
+    """One uint64 hash per value; equal numbers hash alike across dtypes."""
+    dtype = series.dtype
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype):
+        return _numeric_hashes(series)
+    if pc is not None and isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        return _arrow_string_hashes(series)
+    if dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+        return _object_hashes(series)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def _mix(hashes: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer, spreading combined hashes over all 64 bits."""
+    hashes = hashes ^ (hashes >> np.uint64(30))
+    hashes = hashes * np.uint64(0xBF58476D1CE4E5B9)
+    hashes = hashes ^ (hashes >> np.uint64(27))
+    hashes = hashes * np.uint64(0x94D049BB133111EB)
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+def _row_digests(df: pd.DataFrame, keys: Optional[List[str]]) -> np.ndarray:
+    """
+    One uint64 hash per row, over all columns or the key subset.
+
+    Numbers hash by value, not dtype, so rows of chunks that read a column
+    as int64 and as float64 still match.
+    """
+    subset = df if keys is None else df[keys]
+    digests = np.zeros(len(subset), dtype=np.uint64)
+    for _, series in subset.items():
+        digests = digests * _ROW_MULTIPLIER + _value_hashes(series)
+    return _mix(digests)
+
+
+def _drop_duplicate_rows(
+        df: pd.DataFrame,
+        *,
+        keys: Optional[List[str]],
+        keep: Any,
+        method: str
+) -> pd.DataFrame:
+    if method == "exact":
+        return df.drop_duplicates(subset=keys, keep=keep)
+
+    duplicated = pd.Series(_row_digests(df, keys)).duplicated(keep=keep).to_numpy()
+    return df[~duplicated]
+
+
+def _write_back(df: pd.DataFrame, cleaned_df: pd.DataFrame) -> None:
+    """
+    Replace the rows and columns of ``df`` with those of ``cleaned_df``,
+    whose index holds the positions of the kept rows in ``df``.
+    """
+    df.reset_index(drop=True, inplace=True)
+    if len(cleaned_df) < len(df):
+        dropped = np.setdiff1d(df.index, cleaned_df.index, assume_unique=True)
+        df.drop(index=dropped, inplace=True)
+    for position in range(cleaned_df.shape[1]):
+        df.isetitem(position, cleaned_df.iloc[:, position])
+    df.reset_index(drop=True, inplace=True)
+
+
+def _empty_result_error() -> DataCleaningError:
+    return DataCleaningError(
+        "Data cleaning resulted in an empty DataFrame. "
+        "Check input data or cleaning rules."
+    )
+
+
 def clean_dataframe(
         df: pd.DataFrame,
         *,
@@ -23,8 +705,17 @@ def clean_dataframe(
         drop_duplicates: bool = True,
         trim_strings: bool = True,
         convert_numeric: bool = True,
-        fillna_map: Optional[Dict[str, Any]] = None
-) -> pd.DataFrame:
+        fillna_map: Optional[Dict[str, Any]] = None,
+        inplace: bool = False,
+        stats: Optional[Dict[str, Any]] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        optimize_memory: bool = False,
+        dedup_keys: Optional[List[str]] = None,
+        keep: Any = "first",
+        dedup_method: str = "exact"
+) -> Optional[pd.DataFrame]:
     """
     Clean a pandas DataFrame using a standard, reusable strategy.
 
@@ -33,50 +724,428 @@ def clean_dataframe(
     2. Fill missing values using fillna_map
     3. Convert columns to numeric where possible
     4. Drop rows with nulls if drop_nulls=True
-    5. Drop duplicates if drop_duplicates=True
+    5. Shrink column dtypes if optimize_memory=True
+    6. Drop duplicates if drop_duplicates=True
+
+    Duplicates are judged on ``dedup_keys`` (all columns by default) and
+    ``keep`` selects the occurrence to retain, as in pandas. With
+    dedup_method="hash" rows are compared by a 64-bit hash from
+    pd.util.hash_pandas_object, which is faster on wide frames; two
+    different rows are only merged on a hash collision, and values of
+    different types (1 and "1") never hash alike. The streaming
+    cleaners (clean_chunks, clean_csv) also accept "exact" and "hash", but
+    always keep the first occurrence and add an approximate "bloom" mode.
+
+    Steps 1-3 are planned once from the column dtypes and applied in
+    a single pass, so each column is rewritten at most once.
+
+    With inplace=True the input frame is cleaned directly and None is
+    returned; if every row is dropped, DataCleaningError is raised and the
+    input is left as it was. Otherwise the input is left untouched; under pandas
+    copy-on-write only the columns that change are materialized.
+
+    If a ``stats`` dict is given it is filled with ``copy_bytes`` (bytes
+    duplicated by the up-front copy) and ``copy_bytes_saved`` (bytes that
+    the copy-free path avoided), the row counts ``rows_in``, ``rows_out``,
+    ``rows_dropped_nulls`` and ``rows_dropped_duplicates``, and
+    ``step_seconds``, the wall time of each step ("values" for steps 1-3,
+    "nulls", "optimize_memory", "duplicates"). Without a stats dict no
+    measurements are taken.
+
+    Passing a SchemaCache lets repeated batches with the same schema reuse
+    the numeric conversion outcomes learned on earlier batches.
+
+    optimize_memory=True downcasts numeric columns to the smallest lossless
+    width and turns low-cardinality string columns into categoricals (other
+    string columns become Arrow-backed when pyarrow is installed). With a
+    ``stats`` dict, ``memory_bytes_before`` and ``memory_bytes_after`` report
+    the frame size around that step.
+
+    With workers > 1, steps 1-3 run in parallel: executor="thread" cleans
+    column groups in a thread pool, executor="process" cleans row ranges in
+    a process pool. Nulls and duplicates are always dropped over the whole
+    frame, so the output is identical to the serial path.
     """
 
     if not isinstance(df, pd.DataFrame):
         raise DataCleaningError("Input must be a pandas DataFrame")
 
-    if df.empty:
-        return df.copy()
+    _validate_parallelism(workers, executor)
+    if drop_duplicates:
+        _validate_dedup(df.columns, dedup_keys, keep, dedup_method, ("exact", "hash"))
 
-    cleaned_df = df.copy()
+    deep_copy = not inplace and not _copy_on_write_enabled()
 
-    # 1️⃣ Trim strings
-    if trim_strings:
-        for col in cleaned_df.select_dtypes(include=["object"]).columns:
-            cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
+    if stats is not None:
+        # A deep copy duplicates the column buffers (object columns copy
+        # pointers only), which is exactly the shallow memory usage.
+        frame_bytes = int(df.memory_usage(index=True, deep=False).sum())
+        stats["copy_bytes"] = frame_bytes if deep_copy else 0
+        stats["copy_bytes_saved"] = 0 if deep_copy else frame_bytes
+        stats["rows_in"] = len(df)
+        stats["rows_dropped_nulls"] = 0
+        stats["rows_dropped_duplicates"] = 0
+        stats["step_seconds"] = {}
 
-    # 2️⃣ Fill missing values
-    if fillna_map:
-        for col, value in fillna_map.items():
-            if col in cleaned_df.columns:
-                cleaned_df[col] = cleaned_df[col].fillna(value)
+    if df.empty:
+        if stats is not None:
+            stats["rows_out"] = 0
+        return None if inplace else df.copy()
 
-    # 3️⃣ Convert numeric columns safely
-    if convert_numeric:
-        for col in cleaned_df.columns:
-            try:
-                cleaned_df[col] = pd.to_numeric(cleaned_df[col])
-            except Exception:
-                # Skip columns that cannot be converted to numeric
-                continue
+    cleaned_df = df.copy(deep=deep_copy)
+    if inplace:
+        # Work on a shallow copy indexed by row position and write it back
+        # once the result is known not to be empty.
+        cleaned_df.index = pd.RangeIndex(len(df))
 
-    # 4️⃣ Drop nulls
-    if drop_nulls:
-        cleaned_df = cleaned_df.dropna(how="any")
+    # 1️⃣ - 4️⃣ Trim strings, fill missing values, convert numeric columns,
+    # drop nulls
+    cleaned_df = _clean_values(
+        cleaned_df,
+        drop_nulls=drop_nulls,
+        trim_strings=trim_strings,
+        convert_numeric=convert_numeric,
+        fillna_map=fillna_map,
+        schema_cache=schema_cache,
+        workers=workers,
+        executor=executor,
+        stats=stats,
+    )
+
+    # 5️⃣ Shrink dtypes
+    if optimize_memory:
+        if stats is not None:
+            stats["memory_bytes_before"] = int(
+                cleaned_df.memory_usage(index=True, deep=True).sum()
+            )
+            started = time.perf_counter()
+        _optimize_memory(cleaned_df)
+        if stats is not None:
+            _add_step(stats, "optimize_memory", started)
+            stats["memory_bytes_after"] = int(
+                cleaned_df.memory_usage(index=True, deep=True).sum()
+            )
 
-    # 5️⃣ Drop duplicates
+    # 6️⃣ Drop duplicates
     if drop_duplicates:
-        cleaned_df = cleaned_df.drop_duplicates()
+        if stats is not None:
+            rows = len(cleaned_df)
+            started = time.perf_counter()
+        cleaned_df = _drop_duplicate_rows(
+            cleaned_df,
+            keys=dedup_keys,
+            keep=keep,
+            method=dedup_method,
+        )
+        if stats is not None:
+            _add_step(stats, "duplicates", started)
+            stats["rows_dropped_duplicates"] = rows - len(cleaned_df)
+
+    if stats is not None:
+        stats["rows_out"] = len(cleaned_df)
 
     if cleaned_df.empty:
-        raise DataCleaningError(
-            "Data cleaning resulted in an empty DataFrame. "
-            "Check input data or cleaning rules."
-        )
+        raise _empty_result_error()
+
+    if inplace:
+        _write_back(df, cleaned_df)
+        return None
 
     cleaned_df.reset_index(drop=True, inplace=True)
     return cleaned_df
+
+
+# -------------------------
+# Streaming cleaning
+# -------------------------
+class _RowDigestSet:
+    """
+    Remembers rows seen in earlier chunks as 64-bit digests.
+
+    Costs 8 bytes per distinct row instead of keeping the rows themselves.
+    Two different rows are only confused on a 64-bit hash collision.
+
+    Digests are kept in sorted runs, each more than twice the size of the
+    next newer one: a new chunk's run is merged into the newest runs until
+    that holds again. Every digest is merged O(log n) times and lookups
+    binary-search O(log n) runs, instead of re-sorting the whole set on
+    every chunk.
+    """
+
+    def __init__(self) -> None:
+        self._runs: List[np.ndarray] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _contains(self, digests: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(digests), dtype=bool)
+        for run in self._runs:
+            positions = np.searchsorted(run, digests)
+            positions[positions == len(run)] = 0
+            found |= run[positions] == digests
+        return found
+
+    def _add(self, digests: np.ndarray) -> None:
+        # Only called with digests that are new and distinct
+        run = np.sort(digests)
+        self._count += len(run)
+        while self._runs and len(self._runs[-1]) <= 2 * len(run):
+            run = np.sort(np.concatenate([self._runs.pop(), run]), kind="stable")
+        self._runs.append(run)
+
+    def first_occurrences(self, digests: np.ndarray) -> np.ndarray:
+        """Boolean mask of digests not seen before; records them as seen."""
+        # Duplicates inside the chunk itself
+        mask = ~pd.Series(digests).duplicated().to_numpy()
+
+        # Duplicates of rows from earlier chunks
+        mask &= ~self._contains(digests)
+
+        if mask.any():
+            self._add(digests[mask])
+        return mask
+
+
+class _BloomFilter(_RowDigestSet):
+    """
+    Approximate set of row digests with a fixed memory budget.
+
+    Sized for ``capacity`` distinct rows at the given false positive rate
+    (about 1.8 bytes per row at 0.1%). A false positive drops a row that
+    was not actually seen before; seen rows are never let through.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise DataCleaningError("bloom_capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise DataCleaningError("bloom_error_rate must be between 0 and 1")
+
+        n_bits = int(-capacity * np.log(error_rate) / np.log(2) ** 2)
+        self._n_bits = np.uint64(max(n_bits, 64))
+        self._n_hashes = max(1, round(int(self._n_bits) / capacity * np.log(2)))
+        self._bits = np.zeros((int(self._n_bits) + 7) // 8, dtype=np.uint8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, digests: np.ndarray) -> np.ndarray:
+        # Double hashing: bit i is (h1 + i * h2) mod m
+        h1 = digests
+        h2 = (digests >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self._n_hashes, dtype=np.uint64)[:, None]
+        return (h1 + steps * h2) % self._n_bits
+
+    def _contains(self, digests: np.ndarray) -> np.ndarray:
+        positions = self._positions(digests)
+        bits = (self._bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=0)
+
+    def _add(self, digests: np.ndarray) -> None:
+        positions = self._positions(digests).ravel()
+        np.bitwise_or.at(
+            self._bits,
+            positions >> np.uint64(3),
+            (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)),
+        )
+        self._count += len(digests)
+
+
+def _iter_clean_chunks(
+        chunks: Iterable[pd.DataFrame],
+        *,
+        copy: bool,
+        drop_nulls: bool,
+        drop_duplicates: bool,
+        trim_strings: bool,
+        convert_numeric: bool,
+        fillna_map: Optional[Dict[str, Any]],
+        schema_cache: Optional[SchemaCache],
+        dedup_keys: Optional[List[str]],
+        dedup_method: str,
+        bloom_capacity: int,
+        bloom_error_rate: float,
+        stats: Optional[Dict[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    if stats is not None:
+        stats.update(rows_in=0, rows_out=0, rows_dropped_nulls=0,
+                     rows_dropped_duplicates=0, step_seconds={})
+    seen = None
+    if drop_duplicates:
+        if dedup_method == "bloom":
+            seen = _BloomFilter(bloom_capacity, bloom_error_rate)
+        else:
+            seen = _RowDigestSet()
+    if schema_cache is None:
+        # Chunks of one stream almost always share a schema
+        schema_cache = SchemaCache(maxsize=8)
+    rows_in = 0
+    rows_out = 0
+
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise DataCleaningError("Each chunk must be a pandas DataFrame")
+
+        if chunk.empty:
+            continue
+        rows_in += len(chunk)
+
+        cleaned = _clean_values(
+            chunk.copy() if copy else chunk,
+            drop_nulls=drop_nulls,
+            trim_strings=trim_strings,
+            convert_numeric=convert_numeric,
+            fillna_map=fillna_map,
+            schema_cache=schema_cache,
+            stats=stats,
+        )
+
+        if seen is not None and not cleaned.empty:
+            if dedup_keys is not None:
+                _validate_dedup(cleaned.columns, dedup_keys, "first", dedup_method,
+                                ("exact", "hash", "bloom"))
+            if stats is not None:
+                rows = len(cleaned)
+                started = time.perf_counter()
+            cleaned = cleaned[seen.first_occurrences(_row_digests(cleaned, dedup_keys))]
+            if stats is not None:
+                _add_step(stats, "duplicates", started)
+                stats["rows_dropped_duplicates"] += rows - len(cleaned)
+
+        if stats is not None:
+            stats["rows_in"] = rows_in
+            stats["rows_out"] = rows_out + len(cleaned)
+
+        if cleaned.empty:
+            continue
+
+        # Continue the index so that concatenated chunks read as one frame
+        cleaned.index = pd.RangeIndex(rows_out, rows_out + len(cleaned))
+        rows_out += len(cleaned)
+        yield cleaned
+
+    # The empty-result check can only run once every chunk has been seen
+    if rows_in and not rows_out:
+        raise _empty_result_error()
+
+
+def clean_chunks(
+        chunks: Iterable[pd.DataFrame],
+        *,
+        drop_nulls: bool = True,
+        drop_duplicates: bool = True,
+        trim_strings: bool = True,
+        convert_numeric: bool = True,
+        fillna_map: Optional[Dict[str, Any]] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        dedup_keys: Optional[List[str]] = None,
+        dedup_method: str = "hash",
+        bloom_capacity: int = 10_000_000,
+        bloom_error_rate: float = 0.001,
+        stats: Optional[Dict[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Clean an iterable of DataFrame chunks with bounded memory.
+
+    Applies the same steps as clean_dataframe to each chunk and yields
+    the cleaned chunks lazily. Duplicates (on ``dedup_keys`` or all columns)
+    are removed across chunks by keeping a compact set of 64-bit row
+    digests; dedup_method="exact" is accepted as an alias of the default
+    "hash", so the same value works for clean_dataframe. The first
+    occurrence is always kept: rows already yielded cannot be taken back,
+    so there is no ``keep`` option. Concatenating the output gives the same
+    rows as clean_dataframe on the full data, provided every chunk infers
+    the same column dtypes.
+
+    For streams with too many distinct rows for an exact set, use
+    dedup_method="bloom": a Bloom filter sized by ``bloom_capacity`` and
+    ``bloom_error_rate`` bounds memory, at the cost of wrongly dropping
+    roughly that fraction of unique rows.
+
+    A ``stats`` dict is kept up to date with the running row counts and
+    step timings described in clean_dataframe.
+
+    DataCleaningError is raised after the last chunk if rows were read
+    but none survived cleaning.
+    """
+
+    if chunks is None or isinstance(chunks, (pd.DataFrame, str, bytes)):
+        raise DataCleaningError("Chunks must be an iterable of pandas DataFrames")
+    if drop_duplicates:
+        _validate_dedup(None, dedup_keys, "first", dedup_method, ("exact", "hash", "bloom"))
+
+    return _iter_clean_chunks(
+        chunks,
+        copy=True,
+        drop_nulls=drop_nulls,
+        drop_duplicates=drop_duplicates,
+        trim_strings=trim_strings,
+        convert_numeric=convert_numeric,
+        fillna_map=fillna_map,
+        schema_cache=schema_cache,
+        dedup_keys=dedup_keys,
+        dedup_method=dedup_method,
+        bloom_capacity=bloom_capacity,
+        bloom_error_rate=bloom_error_rate,
+        stats=stats,
+    )
+
+
+def _read_csv_chunks(
+        path: str,
+        chunksize: int,
+        read_csv_kwargs: Dict[str, Any]
+) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs) as reader:
+        yield from reader
+
+
+def clean_csv(
+        path: str,
+        *,
+        chunksize: int = 100_000,
+        drop_nulls: bool = True,
+        drop_duplicates: bool = True,
+        trim_strings: bool = True,
+        convert_numeric: bool = True,
+        fillna_map: Optional[Dict[str, Any]] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        dedup_keys: Optional[List[str]] = None,
+        dedup_method: str = "hash",
+        bloom_capacity: int = 10_000_000,
+        bloom_error_rate: float = 0.001,
+        stats: Optional[Dict[str, Any]] = None,
+        **read_csv_kwargs: Any
+) -> Iterator[pd.DataFrame]:
+    """
+    Read and clean a CSV file chunk by chunk.
+
+    Accepts the same options as clean_chunks, so duplicates are removed
+    across the whole file and the first occurrence is always kept; extra
+    keyword arguments are passed to pandas.read_csv.
+    """
+
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise DataCleaningError("chunksize must be a positive integer")
+    if drop_duplicates:
+        _validate_dedup(None, dedup_keys, "first", dedup_method, ("exact", "hash", "bloom"))
+
+    # Chunks from read_csv are not shared with the caller, so skip the copy
+    return _iter_clean_chunks(
+        _read_csv_chunks(path, chunksize, read_csv_kwargs),
+        copy=False,
+        drop_nulls=drop_nulls,
+        drop_duplicates=drop_duplicates,
+        trim_strings=trim_strings,
+        convert_numeric=convert_numeric,
+        fillna_map=fillna_map,
+        schema_cache=schema_cache,
+        dedup_keys=dedup_keys,
+        dedup_method=dedup_method,
+        bloom_capacity=bloom_capacity,
+        bloom_error_rate=bloom_error_rate,
+        stats=stats,
+    )
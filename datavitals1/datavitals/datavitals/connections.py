@@ -0,0 +1,242 @@
+"""
+datavitals.connections
+
+Provides a small thread-aware pool of DB-API connections with health
+checks, used by the SQL source and destination.
+
+Author: Kamaleshkumar.K
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+import sys
+import threading
+import time
+
+from .etl import ETLError
+
+
+# -------------------------
+# Connection pool
+# -------------------------
+class ConnectionPool:
+    """
+    A pool of DB-API connections.
+
+    ``connect`` is a callable returning a new connection. Connections are
+    checked out per thread: while a thread holds one, further checkouts
+    on that thread return the same connection, and no other thread uses
+    it until it is released. At most ``max_size`` connections are open;
+    a checkout waits up to ``timeout`` seconds for one to be released.
+
+    A connection idle for ``check_after`` seconds or more is checked with
+    the ``health_check`` query (or callable taking the connection) before
+    it is handed out, and replaced if the check fails. Released
+    connections are rolled back, so no transaction leaks into the next
+    checkout; connections that cannot be rolled back are discarded.
+
+    Drivers that tie a connection to the thread that created it (sqlite3
+    by default) need that disabled, e.g. ``check_same_thread=False``.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        health_check: Union[str, Callable[[Any], Any], None] = "SELECT 1",
+        check_after: float = 30.0
+    ) -> None:
+        if not callable(connect):
+            raise ETLError("connect must be a callable returning a DB-API connection")
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ETLError("max_size must be a positive integer")
+        if timeout is not None and timeout < 0:
+            raise ETLError("timeout must be non-negative")
+        if health_check is not None and not isinstance(health_check, str) \
+                and not callable(health_check):
+            raise ETLError("health_check must be a SQL string or a callable")
+
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check = health_check
+        self.check_after = check_after
+        self.closed = False
+        self._idle: deque = deque()
+        self._open = 0
+        self._available = threading.Condition(threading.Lock())
+        self._local = threading.local()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or checked out."""
+        return self._open
+
+    def acquire(self) -> Any:
+        """Check out this thread's connection; release() it when done."""
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+
+        conn = self._checkout()
+        self._local.held = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn: Any, *, discard: bool = False) -> None:
+        """Return a connection from acquire(); discard=True closes it instead."""
+        if getattr(self._local, "held", None) is not conn:
+            raise ETLError("Connection was not checked out by this thread")
+        self._local.depth -= 1
+        if self._local.depth and not discard:
+            return
+        self._local.held = None
+        self._local.depth = 0
+
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._available:
+            if discard or self.closed:
+                self._open -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._available.notify()
+        if discard or self.closed:
+            _close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Context manager form of acquire() / release()."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close the idle connections; checked-out ones close on release."""
+        with self._available:
+            self.closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._available.notify_all()
+        for conn in idle:
+            _close_quietly(conn)
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _checkout(self) -> Any:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            with self._available:
+                while True:
+                    if self.closed:
+                        raise ETLError("Connection pool is closed")
+                    if self._idle:
+                        # Most recently used first: likely still healthy
+                        conn, last_used = self._idle.pop()
+                        break
+                    if self._open < self.max_size:
+                        self._open += 1
+                        conn, last_used = None, None
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise ETLError(
+                            f"No connection available within {self.timeout}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._available.wait(remaining)
+
+            if conn is None:
+                return self._new_connection()
+            if time.monotonic() - last_used < self.check_after or self._healthy(conn):
+                return conn
+
+            # Broken connection: replace it
+            _close_quietly(conn)
+            return self._new_connection()
+
+    def _new_connection(self) -> Any:
+        try:
+            return self.connect()
+        except BaseException:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+
+    def _healthy(self, conn: Any) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            if callable(self.health_check):
+                return bool(self.health_check(conn))
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.health_check)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+# -------------------------
+# Helpers for SQL sources and destinations
+# -------------------------
+def _checkout(connection: Any) -> Tuple[Any, Callable[[], None]]:
+    """
+    Get a connection from a pool, a connection factory or a connection.
+
+    Returns it with the callable that gives it back: released to its
+    pool, closed when the factory made it, left open otherwise.
+    """
+    if isinstance(connection, ConnectionPool):
+        conn = connection.acquire()
+        return conn, lambda: connection.release(conn)
+    if callable(connection) and not hasattr(connection, "cursor"):
+        conn = connection()
+        return conn, conn.close
+    return connection, lambda: None
+
+
+def _driver_paramstyle(connection: Any, paramstyle: Optional[str] = None) -> str:
+    """The sql_builder paramstyle for a DB-API connection's driver module."""
+    if paramstyle is not None:
+        return paramstyle
+    module = sys.modules.get(type(connection).__module__.split(".")[0])
+    paramstyle = getattr(module, "paramstyle", None)
+    if paramstyle in ("qmark", "named", "pyformat"):
+        return paramstyle
+    if paramstyle == "format":
+        # format drivers (MySQLdb, pymysql, psycopg) also accept %(name)s
+        return "pyformat"
+    raise ETLError(
+        f"Cannot use paramstyle {paramstyle!r} of {type(connection).__module__}; "
+        "pass paramstyle= explicitly"
+    )
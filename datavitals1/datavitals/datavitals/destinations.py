@@ -0,0 +1,666 @@
+"""
+datavitals.destinations
+
+Provides pluggable, batch-oriented load targets (sinks) for the
+datavitals ETL pipeline: memory, CSV, Parquet, SQLite and any DB-API
+database.
+
+Author: Kamaleshkumar.K
+"""
+
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+import csv
+import os
+import sqlite3
+
+from .etl import ETLError, _batch_to_records, _is_dataframe
+from .sql_builder import _placeholder
+
+
+# -------------------------
+# Base destination
+# -------------------------
+class Destination:
+    """
+    Base class for ETL destinations.
+
+    The pipeline calls open() once, write_batch() for every transformed
+    batch (a list of dicts or a pandas DataFrame) and finally close(),
+    whose return value becomes the pipeline result. abort() is called
+    instead of close() when the run fails.
+
+    Checkpointed runs also call flush() before saving a checkpoint; it
+    makes everything written so far durable and returns a JSON-serializable
+    position. A resumed run calls resume(position) instead of open() and
+    must continue writing from that position.
+    """
+
+    def open(self) -> None:
+        pass
+
+    def write_batch(self, batch: Any) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> Any:
+        return None
+
+    def resume(self, position: Any) -> None:
+        raise ETLError(f"{type(self).__name__} cannot resume a checkpointed run")
+
+    def close(self) -> Any:
+        return None
+
+    def abort(self) -> None:
+        pass
+
+
+class MemoryDestination(Destination):
+    """Collects all records in a list (the default destination)."""
+
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def write_batch(self, batch: Any) -> None:
+        self.records.extend(_batch_to_records(batch))
+
+    def resume(self, position: Any) -> None:
+        # Records loaded before the checkpoint were lost with the failed
+        # run, so continuing would silently return partial output
+        raise ETLError(
+            "MemoryDestination cannot resume a checkpointed run; clear the "
+            "checkpoint or load into a durable destination"
+        )
+
+    def close(self) -> List[Dict[str, Any]]:
+        return self.records
+
+
+class CSVDestination(Destination):
+    """
+    Writes records to a CSV file through a large write buffer.
+
+    The header is taken from the first batch unless ``columns`` is given.
+    Returns the number of rows written.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        columns: Optional[List[str]] = None,
+        delimiter: str = ",",
+        buffer_size: int = 1024 * 1024,
+        encoding: str = "utf-8"
+    ) -> None:
+        self.path = path
+        self.columns = columns
+        self.delimiter = delimiter
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self.rows_written = 0
+        self._fh = None
+        self._writer = None
+
+    def open(self) -> None:
+        self._fh = open(
+            self.path, "w", newline="", encoding=self.encoding,
+            buffering=self.buffer_size
+        )
+
+    def write_batch(self, batch: Any) -> None:
+        if _is_dataframe(batch):
+            if self._writer is None and self.columns is None:
+                self.columns = list(batch.columns)
+            self._ensure_writer()
+            # Select by the frame's own labels (the header only holds their
+            # text) and end lines like csv.DictWriter does
+            labels = {str(col): col for col in batch.columns}
+            batch.to_csv(
+                self._fh, header=False, index=False, sep=self.delimiter,
+                columns=[col if col in batch.columns else labels.get(str(col), col)
+                         for col in self.columns],
+                lineterminator="\r\n"
+            )
+            self.rows_written += len(batch)
+            return
+
+        if not batch:
+            return
+        if self._writer is None and self.columns is None:
+            self.columns = list(dict.fromkeys(key for record in batch for key in record))
+        self._ensure_writer()
+        self._writer.writerows(batch)
+        self.rows_written += len(batch)
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._fh, fieldnames=self.columns, delimiter=self.delimiter
+            )
+            self._writer.writeheader()
+
+    def flush(self) -> Dict[str, int]:
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        return {"bytes": self._fh.buffer.tell(), "rows": self.rows_written}
+
+    def resume(self, position: Any) -> None:
+        if not position or not os.path.exists(self.path):
+            self.open()
+            return
+
+        # Drop anything written after the checkpoint, then append
+        with open(self.path, "r+b") as fh:
+            fh.truncate(position["bytes"])
+        with open(self.path, newline="", encoding=self.encoding) as fh:
+            header = next(csv.reader(fh, delimiter=self.delimiter), None)
+
+        self._fh = open(
+            self.path, "a", newline="", encoding=self.encoding,
+            buffering=self.buffer_size
+        )
+        self.rows_written = position["rows"]
+        if header is not None:
+            self.columns = header
+            self._writer = csv.DictWriter(
+                self._fh, fieldnames=self.columns, delimiter=self.delimiter
+            )
+
+    def close(self) -> int:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        return self.rows_written
+
+    def abort(self) -> None:
+        self.close()
+
+
+# Rows a Parquet destination holds back while inferring its schema
+_SCHEMA_SAMPLE_ROWS = 10_000
+
+
+class ParquetDestination(Destination):
+    """
+    Writes records to a Parquet file, one row group per batch.
+
+    Unless ``schema`` (a pyarrow.Schema) is given, the schema is inferred
+    from the first batches: they are held back while a column has only
+    nulls so far (up to ``_SCHEMA_SAMPLE_ROWS`` rows) and their types are
+    unified, e.g. int64 and double become double. Later batches are cast
+    to that schema; a batch that cannot be cast raises ETLError. Requires
+    pyarrow. Returns the number of rows written.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        schema: Any = None,
+        compression: str = "snappy"
+    ) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ETLError("The parquet destination requires pyarrow") from exc
+
+        self.path = path
+        self.schema = schema
+        self.compression = compression
+        self.rows_written = 0
+        self._writer = None
+        self._pending: List[Any] = []
+
+    def write_batch(self, batch: Any) -> None:
+        import pyarrow as pa
+
+        if _is_dataframe(batch):
+            table = pa.Table.from_pandas(batch, schema=self.schema, preserve_index=False)
+        else:
+            if not batch:
+                return
+            table = pa.Table.from_pylist(batch, schema=self.schema)
+
+        if self._writer is not None:
+            self._write(self._conform(table))
+            return
+
+        if self.schema is not None:
+            self._open_writer(self.schema)
+            self._write(table)
+            return
+
+        self._pending.append(table)
+        if self._schema_settled():
+            self._write_pending()
+
+    def _schema_settled(self) -> bool:
+        import pyarrow as pa
+
+        schema = pa.unify_schemas(
+            [table.schema for table in self._pending], promote_options="permissive"
+        )
+        if not any(pa.types.is_null(field.type) for field in schema):
+            return True
+        return sum(table.num_rows for table in self._pending) >= _SCHEMA_SAMPLE_ROWS
+
+    def _write_pending(self) -> None:
+        import pyarrow as pa
+
+        if not self._pending:
+            return
+        combined = pa.concat_tables(self._pending, promote_options="permissive")
+        self._open_writer(combined.schema)
+        offset = 0
+        for table in self._pending:
+            # Still one row group per batch
+            self._write(combined.slice(offset, table.num_rows))
+            offset += table.num_rows
+        self._pending = []
+
+    def _open_writer(self, schema: Any) -> None:
+        import pyarrow.parquet as pq
+
+        self.schema = schema
+        self._writer = pq.ParquetWriter(self.path, schema, compression=self.compression)
+
+    def _conform(self, table: Any) -> Any:
+        """Cast a batch to the file schema; missing columns become nulls."""
+        import pyarrow as pa
+
+        if table.schema == self.schema:
+            return table
+        try:
+            columns = [
+                table.column(field.name).cast(field.type)
+                if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+                for field in self.schema
+            ]
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as exc:
+            raise ETLError(
+                f"Batch does not match the Parquet schema {self.schema}; "
+                "pass schema= to the parquet destination"
+            ) from exc
+        return pa.Table.from_arrays(columns, schema=self.schema)
+
+    def _write(self, table: Any) -> None:
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+
+    def close(self) -> int:
+        self._write_pending()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return self.rows_written
+
+    def abort(self) -> None:
+        self._pending = []
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sqlite_type(value: Any) -> str:
+    if isinstance(value, bool) or isinstance(value, int):
+        return "INTEGER"
+    if isinstance(value, float):
+        return "REAL"
+    if isinstance(value, (bytes, bytearray)):
+        return "BLOB"
+    return "TEXT"
+
+
+class SQLiteDestination(Destination):
+    """
+    Bulk-loads records into a SQLite table.
+
+    Rows are buffered and inserted with executemany, committing one
+    transaction per ``batch_size`` rows. The table is created from the
+    first batch when it does not exist. ``database`` is a file path or an
+    open sqlite3 connection (which is left open). Returns the number of
+    rows inserted.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        table: str,
+        *,
+        batch_size: int = 10_000,
+        create_table: bool = True
+    ) -> None:
+        if not table or not isinstance(table, str):
+            raise ETLError("SQLite destination needs a table name")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ETLError("batch_size must be a positive integer")
+
+        self.database = database
+        self.table = table
+        self.batch_size = batch_size
+        self.create_table = create_table
+        self.rows_written = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._owns_connection = False
+        self._columns: Optional[List[str]] = None
+        self._insert_sql = ""
+        self._pending: List[tuple] = []
+
+    def open(self) -> None:
+        if isinstance(self.database, sqlite3.Connection):
+            self._conn = self.database
+        else:
+            self._conn = sqlite3.connect(self.database)
+            self._owns_connection = True
+
+    def write_batch(self, batch: Any) -> None:
+        records = _batch_to_records(batch)
+        if not records:
+            return
+
+        if self._columns is None:
+            self._prepare(records[0])
+
+        columns = self._columns
+        self._pending.extend(
+            tuple(record.get(col) for col in columns) for record in records
+        )
+        while len(self._pending) >= self.batch_size:
+            self._flush(self._pending[:self.batch_size])
+            del self._pending[:self.batch_size]
+
+    def _prepare(self, first: Dict[str, Any]) -> None:
+        self._columns = list(first)
+        quoted = [_quote_identifier(col) for col in self._columns]
+        table = _quote_identifier(self.table)
+
+        if self.create_table:
+            definitions = ", ".join(
+                f"{name} {_sqlite_type(first[col])}"
+                for name, col in zip(quoted, self._columns)
+            )
+            with self._conn:
+                self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definitions})")
+
+        placeholders = ", ".join("?" for _ in quoted)
+        self._insert_sql = (
+            f"INSERT INTO {table} ({', '.join(quoted)}) VALUES ({placeholders})"
+        )
+
+    def _flush(self, rows: List[tuple]) -> None:
+        # One transaction per batch
+        with self._conn:
+            self._conn.executemany(self._insert_sql, rows)
+        self.rows_written += len(rows)
+
+    def flush(self) -> Dict[str, int]:
+        if self._pending:
+            self._flush(self._pending)
+            self._pending = []
+        return {"rows": self.rows_written}
+
+    def resume(self, position: Any) -> None:
+        # Rows committed after the checkpoint are inserted again
+        self.open()
+        if position:
+            self.rows_written = position["rows"]
+
+    def close(self) -> int:
+        self.flush()
+        self._release()
+        return self.rows_written
+
+    def abort(self) -> None:
+        self._pending = []
+        self._release()
+
+    def _release(self) -> None:
+        if self._conn is not None and self._owns_connection:
+            self._conn.close()
+        self._conn = None
+
+
+_INSERT_METHODS = ("values", "executemany")
+
+
+def _quote_table(table: str) -> str:
+    # Schema-qualified names are quoted part by part
+    return ".".join(_quote_identifier(part) for part in table.split("."))
+
+
+def _row_bytes(row: tuple) -> int:
+    """Rough size of a row's values on the wire."""
+    return sum(
+        len(value) if isinstance(value, (str, bytes, bytearray)) else 8
+        for value in row
+    )
+
+
+@lru_cache(maxsize=64)
+def _insert_sql(table: str, columns: Tuple[str, ...], rows: int, paramstyle: str) -> str:
+    """INSERT statement for ``rows`` rows; parameters are named p0, p1, ..."""
+    names = iter(range(rows * len(columns)))
+    values = ", ".join(
+        "(" + ", ".join(_placeholder(paramstyle, f"p{next(names)}") for _ in columns) + ")"
+        for _ in range(rows)
+    )
+    quoted = ", ".join(_quote_identifier(col) for col in columns)
+    return f"INSERT INTO {_quote_table(table)} ({quoted}) VALUES {values}"
+
+
+def _bind_rows(rows: List[tuple], paramstyle: str) -> Any:
+    values = [value for row in rows for value in row]
+    if paramstyle == "qmark":
+        return values
+    return {f"p{i}": value for i, value in enumerate(values)}
+
+
+class SQLDestination(Destination):
+    """
+    Bulk-loads records into an existing table over any DB-API connection.
+
+    Rows are buffered and written in batches of up to ``batch_rows`` rows
+    or about ``batch_bytes`` bytes of values, whichever comes first; each
+    batch is committed as one transaction. method="values" sends
+    multi-row ``INSERT ... VALUES (...), (...)`` statements of up to
+    ``max_params`` parameters each, which saves round trips on network
+    databases; method="executemany" passes the batch to
+    cursor.executemany.
+
+    ``connection`` is an open connection (left open), a callable that
+    returns a new one (closed at the end) or a
+    datavitals.connections.ConnectionPool (checked out for the run).
+    Columns are taken from the first batch unless ``columns`` is given.
+    Returns the number of rows inserted.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        table: str,
+        *,
+        columns: Optional[List[str]] = None,
+        method: str = "values",
+        batch_rows: int = 10_000,
+        batch_bytes: Optional[int] = 8 * 1024 * 1024,
+        max_params: int = 999,
+        paramstyle: Optional[str] = None
+    ) -> None:
+        if connection is None:
+            raise ETLError("SQL destination needs a DB-API connection, factory or pool")
+        if not table or not isinstance(table, str):
+            raise ETLError("SQL destination needs a table name")
+        if columns is not None and (not isinstance(columns, list) or not columns):
+            raise ETLError("columns must be a non-empty list of column names")
+        if method not in _INSERT_METHODS:
+            raise ETLError(
+                f"Unsupported insert method: {method}. Use one of {list(_INSERT_METHODS)}"
+            )
+        for name, value in (("batch_rows", batch_rows), ("max_params", max_params)):
+            if not isinstance(value, int) or value <= 0:
+                raise ETLError(f"{name} must be a positive integer")
+        if batch_bytes is not None and (not isinstance(batch_bytes, int) or batch_bytes <= 0):
+            raise ETLError("batch_bytes must be a positive integer or None")
+        if paramstyle is not None and paramstyle not in ("qmark", "named", "pyformat"):
+            raise ETLError(f"Unsupported paramstyle: {paramstyle}")
+
+        self.connection = connection
+        self.table = table
+        self.columns = columns
+        self.method = method
+        self.batch_rows = batch_rows
+        self.batch_bytes = batch_bytes
+        self.max_params = max_params
+        self.paramstyle = paramstyle
+        self.rows_written = 0
+        self._conn: Any = None
+        self._release: Optional[Callable[[], None]] = None
+        self._pending: List[tuple] = []
+        self._pending_bytes = 0
+
+    def open(self) -> None:
+        from .connections import _checkout, _driver_paramstyle
+
+        self._conn, self._release = _checkout(self.connection)
+        try:
+            self.paramstyle = _driver_paramstyle(self._conn, self.paramstyle)
+        except ETLError:
+            self._give_back()
+            raise
+
+    def write_batch(self, batch: Any) -> None:
+        records = _batch_to_records(batch)
+        if not records:
+            return
+        if self.columns is None:
+            self.columns = list(records[0])
+
+        columns = self.columns
+        for record in records:
+            row = tuple(record.get(col) for col in columns)
+            self._pending.append(row)
+            if self.batch_bytes is not None:
+                self._pending_bytes += _row_bytes(row)
+                if self._pending_bytes >= self.batch_bytes:
+                    self.flush()
+                    continue
+            if len(self._pending) >= self.batch_rows:
+                self.flush()
+
+    def _write(self, rows: List[tuple]) -> None:
+        columns = tuple(self.columns)
+        cursor = self._conn.cursor()
+        try:
+            if self.method == "executemany":
+                sql = _insert_sql(self.table, columns, 1, self.paramstyle)
+                if self.paramstyle == "qmark":
+                    cursor.executemany(sql, rows)
+                else:
+                    cursor.executemany(sql, [_bind_rows([row], self.paramstyle) for row in rows])
+            else:
+                per_statement = self.max_params // len(columns)
+                if per_statement == 0:
+                    raise ETLError(
+                        f"max_params ({self.max_params}) is lower than the number of "
+                        f"columns ({len(columns)})"
+                    )
+                for start in range(0, len(rows), per_statement):
+                    chunk = rows[start:start + per_statement]
+                    sql = _insert_sql(self.table, columns, len(chunk), self.paramstyle)
+                    cursor.execute(sql, _bind_rows(chunk, self.paramstyle))
+            # One transaction per batch
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        self.rows_written += len(rows)
+
+    def flush(self) -> Dict[str, int]:
+        if self._pending:
+            rows = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+            self._write(rows)
+        return {"rows": self.rows_written}
+
+    def resume(self, position: Any) -> None:
+        # Rows committed after the checkpoint are inserted again
+        self.open()
+        if position:
+            self.rows_written = position["rows"]
+
+    def close(self) -> int:
+        try:
+            self.flush()
+        finally:
+            self._give_back()
+        return self.rows_written
+
+    def abort(self) -> None:
+        self._pending = []
+        self._pending_bytes = 0
+        if self._conn is not None:
+            try:
+                self._conn.rollback()
+            finally:
+                self._give_back()
+
+    def _give_back(self) -> None:
+        if self._release is not None:
+            self._release()
+        self._conn = None
+        self._release = None
+
+
+# -------------------------
+# Registry
+# -------------------------
+_DESTINATIONS: Dict[str, Callable[..., Destination]] = {
+    "memory": MemoryDestination,
+    "csv": CSVDestination,
+    "parquet": ParquetDestination,
+    "sqlite": SQLiteDestination,
+    "sql": SQLDestination,
+}
+
+
+def register_destination(name: str, factory: Callable[..., Destination]) -> None:
+    """
+    Register a destination factory under ``name``.
+
+    The factory is called with the pipeline's destination_options as
+    keyword arguments and must return a Destination.
+    """
+    if not name or not isinstance(name, str):
+        raise ETLError("Destination name must be a non-empty string")
+    if not callable(factory):
+        raise ETLError("Destination factory must be callable")
+    _DESTINATIONS[name] = factory
+
+
+def get_destination(
+    destination: Union[str, Destination],
+    options: Optional[Dict[str, Any]] = None
+) -> Destination:
+    """Build a Destination from a registered name, or pass one through."""
+    if isinstance(destination, Destination):
+        if options:
+            raise ETLError("destination_options cannot be used with a Destination instance")
+        return destination
+
+    factory = _DESTINATIONS.get(destination) if isinstance(destination, str) else None
+    if factory is None:
+        raise ETLError(f"Unsupported destination type: {destination}")
+
+    try:
+        return factory(**(options or {}))
+    except TypeError as exc:
+        raise ETLError(f"Invalid options for destination '{destination}': {exc}") from exc
@@ -0,0 +1,259 @@
+"""
+datavitals.metrics
+
+Provides optional run instrumentation for the ETL pipeline: per-stage
+wall and CPU time, throughput, batch latency histograms and memory
+usage, reported as a dict and through hook callbacks.
+
+Author: Kamaleshkumar.K
+"""
+
+from bisect import bisect_left
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
+import io
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from .etl import ETLError
+
+# Upper bounds (seconds) of the batch latency histogram buckets
+_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+
+def _bucket_label(bound: float) -> str:
+    return "inf" if bound == float("inf") else f"<={bound:g}s"
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _StageStats:
+    __slots__ = ("batches", "records", "wall", "cpu", "max_latency", "histogram")
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.records = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_latency = 0.0
+        self.histogram = [0] * len(_LATENCY_BUCKETS)
+
+    def add(self, records: int, wall: float, cpu: float) -> None:
+        self.batches += 1
+        self.records += records
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_latency:
+            self.max_latency = wall
+        self.histogram[bisect_left(_LATENCY_BUCKETS, wall)] += 1
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "records": self.records,
+            "wall_seconds": self.wall,
+            "cpu_seconds": self.cpu,
+            "records_per_second": self.records / self.wall if self.wall else None,
+            "max_batch_seconds": self.max_latency,
+            "latency_histogram": {
+                _bucket_label(bound): count
+                for bound, count in zip(_LATENCY_BUCKETS, self.histogram)
+            },
+        }
+
+
+class RunMetrics:
+    """
+    Collects instrumentation for one pipeline run.
+
+    Pass an instance as ``metrics=`` to run_etl_pipeline or Pipeline.run,
+    then call report(). Stages are timed per batch: the time a stage
+    spends waiting on the stage before it is excluded, so no time is
+    counted twice. CPU time is process-wide
+    (time.process_time); work done in worker processes is not included.
+    Cleaning stages also report the rows dropped by each step.
+
+    ``hooks`` are callables invoked as hook(event, data) on the calling
+    thread: "batch" after each stage batch, with the stage name, record
+    count and its wall/CPU seconds, and "end" with the final report.
+
+    profile=True runs the pipeline under cProfile and adds the top
+    functions by cumulative time to the report ("profile"); the full
+    pstats.Stats is kept in ``profile_stats``. trace_memory=True traces
+    Python allocations with tracemalloc and reports their peak. Both are
+    expensive and meant for investigation; plain metrics cost a few
+    timer reads per batch. Without a RunMetrics nothing is measured.
+    """
+
+    def __init__(
+        self,
+        *,
+        hooks: Optional[List[Callable[[str, Dict[str, Any]], None]]] = None,
+        profile: bool = False,
+        trace_memory: bool = False
+    ) -> None:
+        hooks = list(hooks or [])
+        if not all(callable(hook) for hook in hooks):
+            raise ETLError("Metrics hooks must be callable")
+        self.hooks = hooks
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_stats = None
+        self.stages: Dict[str, _StageStats] = {}
+        self.cleaning: Dict[str, Dict[str, Any]] = {}
+        self._report: Optional[Dict[str, Any]] = None
+        self._nested: List[List[float]] = []
+        self._profiler = None
+        self._started_tracing = False
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    # -------------------------
+    # Run lifecycle
+    # -------------------------
+    def _start(self) -> None:
+        self.stages.clear()
+        self._report = None
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        if self.profile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def _finish(self, status: str) -> Dict[str, Any]:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        loaded = self.stages.get("load")
+        records = loaded.records if loaded is not None else 0
+
+        report: Dict[str, Any] = {
+            "status": status,
+            "wall_seconds": wall,
+            "cpu_seconds": cpu,
+            "records": records,
+            "records_per_second": records / wall if wall else None,
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "stages": {name: stage.report() for name, stage in self.stages.items()},
+        }
+        for name, stats in self.cleaning.items():
+            report["stages"].setdefault(name, {}).update(stats)
+        self.cleaning = {}
+
+        if self._profiler is not None:
+            import pstats
+            self._profiler.disable()
+            buffer = io.StringIO()
+            self.profile_stats = pstats.Stats(self._profiler, stream=buffer)
+            self.profile_stats.sort_stats("cumulative").print_stats(25)
+            report["profile"] = buffer.getvalue()
+            self._profiler = None
+
+        if self.trace_memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                report["python_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                if self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+        self._report = report
+        self._emit("end", report)
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """The report of the last run."""
+        if self._report is None:
+            raise ETLError("No run has been recorded yet")
+        return self._report
+
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        for hook in self.hooks:
+            hook(event, data)
+
+    # -------------------------
+    # Stage timing
+    # -------------------------
+    def _record(self, name: str, records: int, wall: float, cpu: float) -> None:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _StageStats()
+        stage.add(records, wall, cpu)
+        if self.hooks:
+            self._emit("batch", {
+                "stage": name, "records": records,
+                "wall_seconds": wall, "cpu_seconds": cpu,
+            })
+
+    def _timed(self, name: str, batches: Iterable[Any]) -> Iterator[Any]:
+        """
+        Time each next() on ``batches`` as one batch of stage ``name``.
+
+        Time spent in nested (upstream) timed stages is subtracted.
+        """
+        iterator = iter(batches)
+        while True:
+            self._nested.append([0.0, 0.0])
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                batch = next(iterator)
+            except StopIteration:
+                self._close_step(name, None, wall, cpu)
+                return
+            except BaseException:
+                self._nested.pop()
+                raise
+            self._close_step(name, batch, wall, cpu)
+            yield batch
+
+    def _close_step(self, name: str, batch: Any, wall: float, cpu: float) -> None:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        inner_wall, inner_cpu = self._nested.pop()
+        if self._nested:
+            self._nested[-1][0] += wall
+            self._nested[-1][1] += cpu
+        if batch is not None:
+            self._record(name, len(batch), wall - inner_wall, cpu - inner_cpu)
+
+    def _destination(self, destination: Any) -> "_TimedDestination":
+        return _TimedDestination(destination, self)
+
+
+class _TimedDestination:
+    """Wraps a Destination to time its writes as the "load" stage."""
+
+    def __init__(self, destination: Any, metrics: RunMetrics) -> None:
+        self.destination = destination
+        self.metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.destination, name)
+
+    def write_batch(self, batch: Any) -> None:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        self.destination.write_batch(batch)
+        self.metrics._record(
+            "load", len(batch),
+            time.perf_counter() - wall, time.process_time() - cpu
+        )
@@ -0,0 +1,313 @@
+"""
+datavitals.pipeline
+
+Provides a composable multi-stage ETL pipeline: extract -> any number
+of map / filter / batch / cleaning stages -> load. Adjacent per-record
+stages are fused into a single pass and batches stream between stages,
+so no intermediate lists of the whole dataset are built.
+
+Author: Kamaleshkumar.K
+"""
+
+from typing import List, Dict, Any, Callable, Optional, Iterable, Iterator, Tuple, Union
+import inspect
+
+from .etl import (
+    ETLError,
+    _BATCH_FORMAT_ATTR,
+    _NATIVE,
+    _batch_to_records,
+    _convert_batch,
+    _is_batch_source,
+    _is_dataframe,
+    _iter_batches,
+    _load_batches,
+    _map_batches,
+    _resolve_transform,
+    _transform_batch,
+    _validate_batch_size,
+    _validate_executor,
+    _validate_iterable_source,
+)
+
+_MAP = "map"
+_FILTER = "filter"
+_BATCH = "batch"
+_CLEAN = "clean"
+
+
+# -------------------------
+# Stage execution
+# -------------------------
+def _apply_record_stages(
+    records: List[Any],
+    stages: List[Tuple[str, Callable[[Dict[str, Any]], Any]]]
+) -> List[Dict[str, Any]]:
+    """Run adjacent map/filter stages over each record in one pass."""
+    output = []
+    for record in records:
+        if not isinstance(record, dict):
+            raise ETLError("Each source record must be a dictionary")
+
+        current = record
+        try:
+            for kind, fn in stages:
+                if kind == _FILTER:
+                    if not fn(current):
+                        break
+                else:
+                    current = fn(current)
+            else:
+                output.append(current)
+        except Exception as exc:
+            raise ETLError(f"Transformation failed for record {record}") from exc
+    return output
+
+
+class _FusedStages:
+    """
+    A run of adjacent stateless stages, applied to one batch at a time.
+
+    Consecutive map/filter stages become a single loop over the records;
+    batch stages receive the batch in their declared format. Instances are
+    picklable when every stage function is, so a whole run executes as one
+    task in a thread or process pool.
+    """
+
+    def __init__(self, stages: List[Tuple[str, Callable[[Any], Any]]]) -> None:
+        self.groups: List[Tuple[str, Any]] = []
+        for kind, fn in stages:
+            if kind != _BATCH and self.groups and self.groups[-1][0] == _MAP:
+                self.groups[-1][1].append((kind, fn))
+            elif kind != _BATCH:
+                self.groups.append((_MAP, [(kind, fn)]))
+            else:
+                self.groups.append((_BATCH, fn))
+        setattr(self, _BATCH_FORMAT_ATTR, _NATIVE)
+
+    @property
+    def record_only(self) -> bool:
+        return all(kind == _MAP for kind, _ in self.groups)
+
+    def __call__(self, batch: Any) -> Any:
+        for kind, payload in self.groups:
+            if len(batch) == 0:
+                return []
+            if kind == _MAP:
+                batch = _apply_record_stages(_batch_to_records(batch), payload)
+            else:
+                batch = _transform_batch(batch, payload)
+                if not isinstance(batch, list) and not _is_dataframe(batch):
+                    # Arrow / NumPy results continue as records
+                    batch = _batch_to_records(batch)
+        return batch
+
+
+def _clean_batches(batches: Iterable[Any], options: Dict[str, Any]) -> Iterator[Any]:
+    """Clean a stream of batches with clean_chunks semantics."""
+    from .cleaning import clean_chunks
+
+    frames = (_convert_batch(batch, "pandas") for batch in batches)
+    return clean_chunks(frames, **options)
+
+
+# -------------------------
+# Pipeline
+# -------------------------
+class Pipeline:
+    """
+    A multi-stage ETL pipeline.
+
+    Build it from a source (any iterable of dicts or a
+    datavitals.sources.Source) and chain stages; every method returns a
+    new Pipeline, leaving the original unchanged::
+
+        result = (
+            Pipeline(records)
+            .map(parse)
+            .filter(lambda r: r["amount"] > 0)
+            .clean(dedup_keys=["id"])
+            .map("double")
+            .run(destination="csv", destination_options={"path": "out.csv"})
+        )
+
+    Nothing runs until run() or stream() is called. Records then flow
+    through the stages batch by batch: adjacent map/filter stages are
+    fused into one pass per record, and only the batches in flight are
+    held in memory.
+    """
+
+    def __init__(self, source: Any) -> None:
+        _validate_iterable_source(source)
+        self.source = source
+        self._stages: Tuple[Tuple[str, Any], ...] = ()
+
+    def _with(self, stage: Tuple[str, Any]) -> "Pipeline":
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline.source = self.source
+        pipeline._stages = self._stages + (stage,)
+        return pipeline
+
+    def map(self, transform: Union[str, Callable[[Any], Any]]) -> "Pipeline":
+        """
+        Add a transform stage.
+
+        ``transform`` is a per-record callable, a batch transform (see
+        batch_transform) or a built-in transform name ("double", "none").
+        """
+        if isinstance(transform, str):
+            # Batches are only columnar after a clean stage or from a Source
+            columnar = _is_batch_source(self.source) or any(
+                kind == _CLEAN for kind, _ in self._stages
+            )
+            transform = _resolve_transform(transform, None, columnar)
+        elif not callable(transform):
+            raise ETLError("Transform must be callable or a transform type name")
+
+        if hasattr(transform, _BATCH_FORMAT_ATTR):
+            return self._with((_BATCH, transform))
+        return self._with((_MAP, transform))
+
+    def filter(self, predicate: Callable[[Dict[str, Any]], Any]) -> "Pipeline":
+        """Add a stage that keeps only the records for which predicate is true."""
+        if not callable(predicate):
+            raise ETLError("Filter predicate must be callable")
+        return self._with((_FILTER, predicate))
+
+    def clean(self, **options: Any) -> "Pipeline":
+        """
+        Add a clean_dataframe stage.
+
+        Accepts the options of datavitals.cleaning.clean_chunks. Batches are
+        cleaned as DataFrames; duplicates are removed across the whole
+        stream and DataCleaningError is raised if no rows survive.
+        """
+        from .cleaning import clean_chunks
+
+        try:
+            inspect.signature(clean_chunks).bind(None, **options)
+        except TypeError as exc:
+            raise ETLError(f"Invalid clean options: {exc}") from exc
+        return self._with((_CLEAN, options))
+
+    def _segments(self) -> List[Any]:
+        """Group the stages into fused stateless runs and cleaning stages."""
+        segments: List[Any] = []
+        run: List[Tuple[str, Any]] = []
+        for kind, payload in self._stages:
+            if kind == _CLEAN:
+                if run:
+                    segments.append(_FusedStages(run))
+                    run = []
+                segments.append(payload)
+            else:
+                run.append((kind, payload))
+        if run:
+            segments.append(_FusedStages(run))
+        return segments
+
+    def _execute(
+        self,
+        executor: Optional[str],
+        max_workers: Optional[int],
+        chunksize: int,
+        metrics: Any = None,
+        streaming: bool = False
+    ) -> Iterator[Any]:
+        segments = self._segments()
+        fused = [segment for segment in segments if isinstance(segment, _FusedStages)]
+        for segment in fused or [_FusedStages([])]:
+            _validate_executor(executor, max_workers, chunksize, segment)
+
+        if _is_batch_source(self.source):
+            batches = self.source.iter_batches()
+        else:
+            # Streamed record-only pipelines start with small batches so the
+            # first results are available right away; batch and cleaning
+            # stages and destinations always receive full batches.
+            ramp_up = streaming and executor is None and all(
+                isinstance(segment, _FusedStages) and segment.record_only
+                for segment in segments
+            )
+            batches = _iter_batches(self.source, chunksize, ramp_up=ramp_up)
+
+        if metrics is not None:
+            batches = metrics._timed("extract", batches)
+
+        counts = {_MAP: 0, _CLEAN: 0}
+        for segment in segments:
+            if isinstance(segment, _FusedStages):
+                kind, name = _MAP, "transform"
+                batches = _map_batches(batches, segment, executor, max_workers)
+            else:
+                kind, name = _CLEAN, "clean"
+                if metrics is not None:
+                    segment = {"stats": {}, **segment}
+                batches = _clean_batches(batches, segment)
+
+            if metrics is not None:
+                # Repeated stage kinds are numbered: transform, transform_2, ...
+                counts[kind] += 1
+                if counts[kind] > 1:
+                    name = f"{name}_{counts[kind]}"
+                if kind == _CLEAN:
+                    metrics.cleaning[name] = segment["stats"]
+                batches = metrics._timed(name, batches)
+        return batches
+
+    def run(
+        self,
+        *,
+        destination: Any = "memory",
+        destination_options: Optional[Dict[str, Any]] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1000,
+        metrics: Any = None
+    ) -> Any:
+        """
+        Run the pipeline and load the result into ``destination``.
+
+        destination, destination_options, executor, max_workers, chunksize
+        and metrics behave as in run_etl_pipeline; with an executor each
+        fused run of stages is one task per batch. Cleaning stages run in
+        the calling process because they keep state across batches. With
+        metrics, every fused run and cleaning stage is timed separately
+        and cleaning stages report the rows dropped by each step.
+        """
+        from .destinations import get_destination
+        sink = get_destination(destination, destination_options)
+
+        if metrics is None:
+            return _load_batches(self._execute(executor, max_workers, chunksize), sink)
+
+        batches = self._execute(executor, max_workers, chunksize, metrics)
+        metrics._start()
+        try:
+            result = _load_batches(batches, metrics._destination(sink))
+        except BaseException:
+            metrics._finish("failed")
+            raise
+        metrics._finish("completed")
+        return result
+
+    def stream(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1000
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Run the pipeline lazily, yielding transformed records.
+
+        With batch_size set, lists of up to batch_size records are yielded
+        instead, as in stream_etl_pipeline.
+        """
+        _validate_batch_size(batch_size)
+        batches = self._execute(executor, max_workers, chunksize, streaming=True)
+        records = (record for batch in batches for record in _batch_to_records(batch))
+        if batch_size is None:
+            return records
+        return _iter_batches(records, batch_size)
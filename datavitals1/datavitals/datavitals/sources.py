@@ -0,0 +1,454 @@
+"""
+datavitals.sources
+
+Provides lazy, chunked extract adapters (sources) for the datavitals
+ETL pipeline: CSV, JSON Lines, Parquet, SQLite queries, queries on any
+DB-API connection and pandas DataFrames.
+
+Author: Kamaleshkumar.K
+"""
+
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Iterator, Sequence, Union
+import json
+import mmap
+import os
+import queue
+import sqlite3
+import threading
+
+from .etl import ETLError
+
+
+# -------------------------
+# Base source
+# -------------------------
+class Source:
+    """
+    Base class for ETL sources.
+
+    iter_batches() lazily yields batches, each either a list of dicts or
+    a pandas DataFrame. The pipeline never materializes the whole dataset;
+    columnar batches stay columnar until a transform or destination needs
+    dicts.
+    """
+
+    def iter_batches(self) -> Iterator[Any]:
+        raise NotImplementedError
+
+    def filter_since(self, field: str, value: Any) -> Optional["Source"]:
+        """
+        Return a source of the records whose ``field`` is greater than
+        ``value``, or None when the source cannot filter by itself (the
+        pipeline then filters the extracted records).
+        """
+        return None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over individual records."""
+        from .etl import _batch_to_records
+        for batch in self.iter_batches():
+            yield from _batch_to_records(batch)
+
+
+def _validate_chunksize(chunksize: int) -> None:
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise ETLError("chunksize must be a positive integer")
+
+
+def _validate_path(path: str) -> None:
+    if not isinstance(path, (str, os.PathLike)) or not os.path.exists(path):
+        raise ETLError(f"Source file not found: {path}")
+
+
+class CSVSource(Source):
+    """
+    Reads a CSV file as DataFrame chunks with pandas.read_csv.
+
+    The file is memory-mapped by default. Extra keyword arguments are
+    passed to pandas.read_csv.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        chunksize: int = 10_000,
+        memory_map: bool = True,
+        **read_csv_kwargs: Any
+    ) -> None:
+        _validate_path(path)
+        _validate_chunksize(chunksize)
+        self.path = path
+        self.chunksize = chunksize
+        self.memory_map = memory_map
+        self.read_csv_kwargs = read_csv_kwargs
+
+    def iter_batches(self) -> Iterator[Any]:
+        import pandas as pd
+
+        with pd.read_csv(
+            self.path,
+            chunksize=self.chunksize,
+            memory_map=self.memory_map,
+            **self.read_csv_kwargs
+        ) as reader:
+            yield from reader
+
+
+class JSONLinesSource(Source):
+    """
+    Reads a JSON Lines file through a read-only memory map.
+
+    Yields lists of up to ``chunksize`` dicts; blank lines are skipped.
+    """
+
+    def __init__(self, path: str, *, chunksize: int = 10_000) -> None:
+        _validate_path(path)
+        _validate_chunksize(chunksize)
+        self.path = path
+        self.chunksize = chunksize
+
+    def iter_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        if os.path.getsize(self.path) == 0:
+            # Empty files cannot be memory-mapped
+            return
+
+        with open(self.path, "rb") as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            batch = []
+            for line_number, line in enumerate(iter(mapped.readline, b""), start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    batch.append(json.loads(line))
+                except ValueError as exc:
+                    raise ETLError(
+                        f"Invalid JSON on line {line_number} of {self.path}"
+                    ) from exc
+                if len(batch) >= self.chunksize:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+
+class ParquetSource(Source):
+    """
+    Reads a Parquet file batch by batch with pyarrow (memory-mapped).
+
+    ``columns`` restricts the columns read. Yields DataFrames.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        chunksize: int = 65_536,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True
+    ) -> None:
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:
+            raise ETLError("The parquet source requires pyarrow") from exc
+
+        _validate_path(path)
+        _validate_chunksize(chunksize)
+        self.path = path
+        self.chunksize = chunksize
+        self.columns = columns
+        self.memory_map = memory_map
+
+    def iter_batches(self) -> Iterator[Any]:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(self.path, memory_map=self.memory_map)
+        try:
+            for record_batch in parquet_file.iter_batches(
+                batch_size=self.chunksize, columns=self.columns
+            ):
+                yield record_batch.to_pandas()
+        finally:
+            parquet_file.close()
+
+
+class SQLiteSource(Source):
+    """
+    Streams the rows of a SQLite query with cursor.fetchmany.
+
+    ``database`` is a file path or an open sqlite3 connection (which is
+    left open). Yields lists of up to ``chunksize`` dicts.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        query: str,
+        params: Union[Sequence[Any], Dict[str, Any]] = (),
+        *,
+        chunksize: int = 10_000
+    ) -> None:
+        if not query or not isinstance(query, str):
+            raise ETLError("SQLite source needs a query string")
+        _validate_chunksize(chunksize)
+        self.database = database
+        self.query = query
+        self.params = params
+        self.chunksize = chunksize
+
+    def filter_since(self, field: str, value: Any) -> "SQLiteSource":
+        """Push the watermark condition into the query."""
+        from .destinations import _quote_identifier
+
+        if isinstance(value, (date, datetime)):
+            # Matches the text format of sqlite3's default adapters
+            value = str(value)
+        column = _quote_identifier(field)
+        if isinstance(self.params, dict):
+            condition = f"{column} > :datavitals_since"
+            params: Any = {**self.params, "datavitals_since": value}
+        else:
+            condition = f"{column} > ?"
+            params = tuple(self.params) + (value,)
+        query = f"SELECT * FROM ({self.query}) WHERE {condition}"
+        return SQLiteSource(self.database, query, params, chunksize=self.chunksize)
+
+    def iter_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        owns_connection = not isinstance(self.database, sqlite3.Connection)
+        conn = sqlite3.connect(self.database) if owns_connection else self.database
+        try:
+            cursor = conn.execute(self.query, self.params)
+            columns = [description[0] for description in cursor.description or ()]
+            while True:
+                rows = cursor.fetchmany(self.chunksize)
+                if not rows:
+                    break
+                yield [dict(zip(columns, row)) for row in rows]
+            cursor.close()
+        finally:
+            if owns_connection:
+                conn.close()
+
+
+class _ReadAheadFailed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _read_ahead(batches: Iterator[Any], size: int) -> Iterator[Any]:
+    """
+    Pull batches on a background thread, up to ``size`` ahead of the consumer.
+
+    The batches iterator runs (and is closed) entirely on that thread, so
+    it may own thread-bound resources such as a connection it opened.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put(batch):
+                    break
+            else:
+                put(done)
+        except BaseException as exc:
+            put(_ReadAheadFailed(exc))
+        finally:
+            close = getattr(batches, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="datavitals-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, _ReadAheadFailed):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class SQLSource(Source):
+    """
+    Streams a query from any DB-API 2.0 connection.
+
+    The query is given as build_select_query arguments (``table``,
+    ``columns``, ``where``; a list value means IN, None means IS NULL) or
+    as a datavitals.sql_builder.QueryBuilder (``query``). Values are
+    always bound as parameters, in the driver's paramstyle unless
+    ``paramstyle`` is given.
+
+    ``connection`` is an open connection (left open), a callable that
+    returns a new one (opened per iteration and closed afterwards) or a
+    datavitals.connections.ConnectionPool (checked out per iteration).
+
+    Rows are fetched ``chunksize`` at a time with cursor.fetchmany. Many
+    drivers buffer the whole result client-side on execute; for those,
+    pass ``keyset`` (columns forming a unique sort key): every batch is
+    then its own ``ORDER BY key LIMIT chunksize`` query that seeks past
+    the previous batch, so memory stays flat whatever the driver does.
+
+    Batches are lists of dicts, or DataFrames with as_frame=True (for
+    clean_chunks / clean_dataframe). With prefetch=N, up to N batches are
+    fetched ahead on a background thread while the pipeline processes the
+    current one; the connection is then used from that thread, so pass a
+    connection factory or pool (or a connection that allows it).
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        *,
+        table: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        query: Any = None,
+        keyset: Optional[List[str]] = None,
+        chunksize: int = 10_000,
+        paramstyle: Optional[str] = None,
+        as_frame: bool = False,
+        prefetch: int = 0
+    ) -> None:
+        from .sql_builder import QueryBuilder, SQLBuilderError
+
+        if connection is None:
+            raise ETLError("SQL source needs a DB-API connection or connection factory")
+        _validate_chunksize(chunksize)
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ETLError("prefetch must be a non-negative integer")
+        if (table is None) == (query is None):
+            raise ETLError("SQL source needs either table= or query=")
+
+        try:
+            if query is None:
+                query = QueryBuilder(table)
+                if columns is not None:
+                    if not isinstance(columns, list):
+                        raise SQLBuilderError("Columns must be a list of strings")
+                    query = query.select(*columns)
+                if where is not None:
+                    if not isinstance(where, dict):
+                        raise SQLBuilderError("WHERE clause must be a dictionary")
+                    query = query.where(**where)
+            elif not isinstance(query, QueryBuilder):
+                raise ETLError("query must be a QueryBuilder")
+            elif columns is not None or where is not None:
+                raise ETLError("columns and where only apply with table=")
+
+            if keyset is not None:
+                if not isinstance(keyset, list) or not keyset:
+                    raise ETLError("keyset must be a non-empty list of columns")
+                if query._order_by or query._limit:
+                    raise ETLError("A keyset query sets its own ORDER BY and LIMIT")
+                query = query.order_by(*keyset).limit(chunksize)
+            if paramstyle is not None:
+                query.build(paramstyle=paramstyle)
+        except SQLBuilderError as exc:
+            raise ETLError(f"Invalid SQL source query: {exc}") from exc
+
+        self.connection = connection
+        self.query = query
+        self.keyset = keyset
+        self.chunksize = chunksize
+        self.paramstyle = paramstyle
+        self.as_frame = as_frame
+        self.prefetch = prefetch
+
+    def filter_since(self, field: str, value: Any) -> "SQLSource":
+        """Push the watermark condition into the query."""
+        source = SQLSource.__new__(SQLSource)
+        source.__dict__.update(self.__dict__)
+        source.query = self.query.where(field, ">", value)
+        return source
+
+    def iter_batches(self) -> Iterator[Any]:
+        batches = self._fetch()
+        if self.prefetch:
+            return _read_ahead(batches, self.prefetch)
+        return batches
+
+    def _fetch(self) -> Iterator[Any]:
+        from .connections import _checkout, _driver_paramstyle
+
+        conn, release = _checkout(self.connection)
+        try:
+            paramstyle = _driver_paramstyle(conn, self.paramstyle)
+            cursor = conn.cursor()
+            try:
+                if self.keyset is None:
+                    cursor.execute(*self.query.build(paramstyle=paramstyle))
+                    columns = [description[0] for description in cursor.description or ()]
+                    while True:
+                        rows = cursor.fetchmany(self.chunksize)
+                        if not rows:
+                            break
+                        yield self._batch(columns, rows)
+                else:
+                    yield from self._fetch_pages(cursor, paramstyle)
+            finally:
+                cursor.close()
+        finally:
+            release()
+
+    def _fetch_pages(self, cursor: Any, paramstyle: str) -> Iterator[Any]:
+        from .sql_builder import SQLBuilderError
+
+        last = None
+        while True:
+            try:
+                sql, params = self.query.after(last).build(paramstyle=paramstyle)
+            except SQLBuilderError as exc:
+                raise ETLError(f"Keyset columns must be selected: {exc}") from exc
+            cursor.execute(sql, params)
+            columns = [description[0] for description in cursor.description or ()]
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            yield self._batch(columns, rows)
+            if len(rows) < self.chunksize:
+                return
+            last = dict(zip(columns, rows[-1]))
+
+    def _batch(self, columns: List[str], rows: Sequence[Any]) -> Any:
+        if self.as_frame:
+            import pandas as pd
+            return pd.DataFrame.from_records(list(rows), columns=columns)
+        return [dict(zip(columns, row)) for row in rows]
+
+
+class DataFrameSource(Source):
+    """
+    Feeds an in-memory pandas DataFrame in row slices.
+
+    Slices are views, so no records are built unless a per-record
+    transform or the memory destination asks for them.
+    """
+
+    def __init__(self, df: Any, *, chunksize: int = 10_000) -> None:
+        if type(df).__name__ != "DataFrame":
+            raise ETLError("DataFrameSource needs a pandas DataFrame")
+        _validate_chunksize(chunksize)
+        self.df = df
+        self.chunksize = chunksize
+
+    def iter_batches(self) -> Iterator[Any]:
+        for start in range(0, len(self.df), self.chunksize):
+            yield self.df.iloc[start:start + self.chunksize]
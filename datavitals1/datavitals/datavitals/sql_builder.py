@@ -7,7 +7,53 @@ to avoid manual query writing errors.
 Author: Kamaleshkumar.K
 """
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union, Iterable, Iterator
+
+# DB-API paramstyles supported by the parameterized mode
+_PARAMSTYLES = ("qmark", "named", "pyformat")
+
+# Shapes of a WHERE condition (an IN-list is described by its length)
+_EQ = "="
+_NULL = "null"
+
+# Batch lookup strategies
+_LOOKUP_STRATEGIES = ("in", "values")
+
+# Comparison operators of QueryBuilder.where / having
+_OPERATORS = {
+    "=": "=", "!=": "<>", "<>": "<>", "<": "<", "<=": "<=", ">": ">", ">=": ">=",
+    "like": "LIKE", "not like": "NOT LIKE",
+    "in": "IN", "not in": "NOT IN",
+    "between": "BETWEEN", "not between": "NOT BETWEEN",
+    "is null": "IS NULL", "is not null": "IS NOT NULL",
+}
+_UNARY_OPERATORS = ("is null", "is not null")
+_LIST_OPERATORS = ("in", "not in")
+_RANGE_OPERATORS = ("between", "not between")
+
+_AGGREGATES = {
+    "count": "COUNT({})",
+    "count_distinct": "COUNT(DISTINCT {})",
+    "sum": "SUM({})",
+    "avg": "AVG({})",
+    "min": "MIN({})",
+    "max": "MAX({})",
+}
+
+_JOINS = {
+    "inner": "JOIN",
+    "left": "LEFT JOIN",
+    "right": "RIGHT JOIN",
+    "full": "FULL JOIN",
+    "cross": "CROSS JOIN",
+}
+
+# SQLite's historic default for SQLITE_MAX_VARIABLE_NUMBER; most other
+# databases accept far more parameters per statement
+_MAX_PARAMS = 999
+
+Query = Union[str, Tuple[str, Union[Tuple[Any, ...], Dict[str, Any]]]]
 
 
 class SQLBuilderError(Exception):
@@ -21,6 +67,8 @@ def _format_value(value: Any) -> str:
     (Basic protection against common mistakes)
     """
     if isinstance(value, str):
+        if "'" in value:
+            value = value.replace("'", "''")
         return f"'{value}'"
     if isinstance(value, bool):
         return "TRUE" if value else "FALSE"
@@ -29,45 +77,796 @@ def _format_value(value: Any) -> str:
     return str(value)
 
 
+# -------------------------
+# Validation
+# -------------------------
+def _validate_select(table: Any, columns: Any, where: Any) -> None:
+    if not table or not isinstance(table, str):
+        raise SQLBuilderError("Table name must be a non-empty string")
+
+    if columns is not None and not isinstance(columns, list):
+        raise SQLBuilderError("Columns must be a list of strings")
+
+    if where is not None and not isinstance(where, dict):
+        raise SQLBuilderError("WHERE clause must be a dictionary")
+
+
+def _validate_paramstyle(paramstyle: Optional[str]) -> None:
+    if paramstyle is not None and paramstyle not in _PARAMSTYLES:
+        raise SQLBuilderError(
+            f"Unsupported paramstyle: {paramstyle}. Use one of {list(_PARAMSTYLES)}"
+        )
+
+
+# -------------------------
+# Clause rendering
+# -------------------------
+def _split_where(
+    where: Dict[str, Any],
+    null_checks: bool
+) -> Tuple[Tuple[Tuple[str, Any], ...], List[Any]]:
+    """
+    Split a WHERE dict into its shape and its values.
+
+    The shape is a tuple of (column, shape) pairs: lists and tuples
+    become IN-lists (shape = their length); with null_checks, None
+    becomes ``IS NULL`` instead of ``= NULL``. The values are flattened
+    in placeholder order.
+    """
+    spec = []
+    values: List[Any] = []
+    for col, val in where.items():
+        if isinstance(val, (list, tuple)):
+            spec.append((col, len(val)))
+            values.extend(val)
+        elif val is None and null_checks:
+            spec.append((col, _NULL))
+        else:
+            spec.append((col, _EQ))
+            values.append(val)
+    return tuple(spec), values
+
+
+def _where_slots(spec: Iterable[Tuple[str, Any]]) -> List[Tuple[str, Optional[int]]]:
+    """One (column, index) pair per placeholder; index is None for scalars."""
+    slots: List[Tuple[str, Optional[int]]] = []
+    for col, shape in spec:
+        if shape == _EQ:
+            slots.append((col, None))
+        elif shape != _NULL:
+            slots.extend((col, i) for i in range(shape))
+    return slots
+
+
+def _conditions(spec: Iterable[Tuple[str, Any]], fill: Iterator[str]) -> List[str]:
+    """Render WHERE conditions, taking each placeholder (or literal) from ``fill``."""
+    conditions = []
+    for col, shape in spec:
+        if shape == _EQ:
+            conditions.append(f"{col} = {next(fill)}")
+        elif shape == _NULL:
+            conditions.append(f"{col} IS NULL")
+        elif shape == 0:
+            # Empty IN-list: matches nothing
+            conditions.append("1 = 0")
+        else:
+            conditions.append(f"{col} IN ({', '.join(next(fill) for _ in range(shape))})")
+    return conditions
+
+
+def _placeholder(paramstyle: str, name: str) -> str:
+    if paramstyle == "qmark":
+        return "?"
+    if paramstyle == "named":
+        return f":{name}"
+    return f"%({name})s"
+
+
+def _param_names(slots: List[Tuple[str, Optional[int]]]) -> Tuple[str, ...]:
+    """
+    Name the parameters after their columns (``id``, ``id_0``, ...), or
+    p0, p1, ... when a column name is not a valid identifier or two
+    names would clash.
+    """
+    if not all(isinstance(col, str) for col, _ in slots):
+        raise SQLBuilderError("WHERE keys must be column names")
+    names = tuple(col if index is None else f"{col}_{index}" for col, index in slots)
+    if all(name.isidentifier() for name in names) and len(set(names)) == len(names):
+        return names
+    return tuple(f"p{i}" for i in range(len(slots)))
+
+
+def _placeholders(paramstyle: str, names: Iterable[str]) -> Iterator[str]:
+    return (_placeholder(paramstyle, name) for name in names)
+
+
+def _bind(sql: str, names: Tuple[str, ...], values: List[Any], paramstyle: str) -> Query:
+    if paramstyle == "qmark":
+        return sql, tuple(values)
+    return sql, dict(zip(names, values))
+
+
+def _inline_condition(col: str, val: Any) -> str:
+    if isinstance(val, str):
+        # Hot path: strings are formatted here as in _format_value
+        if "'" in val:
+            val = val.replace("'", "''")
+        return f"{col} = '{val}'"
+    if isinstance(val, (list, tuple)):
+        if not val:
+            return "1 = 0"
+        return f"{col} IN ({', '.join(map(_format_value, val))})"
+    return f"{col} = {_format_value(val)}"
+
+
+def _render_select(
+    table: str,
+    columns: Iterable[str],
+    conditions: List[str],
+    limit: Optional[int]
+) -> str:
+    select_clause = "SELECT *" if not columns else "SELECT " + ", ".join(columns)
+    parts = [select_clause, f"FROM {table}"]
+    if conditions:
+        parts.append("WHERE " + " AND ".join(conditions))
+    if limit:
+        parts.append(f"LIMIT {limit}")
+    return " ".join(parts)
+
+
+# -------------------------
+# Parameterized templates
+# -------------------------
+@lru_cache(maxsize=1024)
+def _select_template(
+    table: str,
+    columns: Tuple[str, ...],
+    where: Tuple[Tuple[str, Any], ...],
+    limit: Optional[int],
+    paramstyle: str
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Build the SQL text and parameter names of a parameterized SELECT.
+
+    ``where`` is the shape from _split_where: NULL values are written as
+    ``IS NULL`` (``= NULL`` never matches) and take no parameter;
+    IN-lists take one parameter per value.
+    """
+    names = _param_names(_where_slots(where))
+    conditions = _conditions(where, _placeholders(paramstyle, names))
+    return _render_select(table, columns, conditions, limit), names
+
+
+def _render_lookup(
+    table: str,
+    columns: Tuple[str, ...],
+    key_columns: Tuple[str, ...],
+    rows: int,
+    where: Tuple[Tuple[str, Any], ...],
+    fill: Iterator[str]
+) -> str:
+    """Render a lookup that joins ``table`` with a VALUES list of ``rows`` keys."""
+    key_list = ", ".join(key_columns)
+    values = ", ".join(
+        "(" + ", ".join(next(fill) for _ in key_columns) + ")" for _ in range(rows)
+    )
+    selected = ", ".join(f"{table}.{col}" for col in columns) if columns else f"{table}.*"
+    join = " AND ".join(f"{table}.{col} = lookup_keys.{col}" for col in key_columns)
+
+    parts = [
+        f"WITH lookup_keys ({key_list}) AS (VALUES {values})",
+        f"SELECT {selected} FROM {table} JOIN lookup_keys ON {join}",
+    ]
+    if where:
+        parts.append("WHERE " + " AND ".join(_conditions(where, fill)))
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _lookup_template(
+    table: str,
+    columns: Tuple[str, ...],
+    key_columns: Tuple[str, ...],
+    rows: int,
+    where: Tuple[Tuple[str, Any], ...],
+    paramstyle: str
+) -> Tuple[str, Tuple[str, ...]]:
+    """Build the SQL text and parameter names of a parameterized VALUES lookup."""
+    slots = [(col, row) for row in range(rows) for col in key_columns]
+    names = _param_names(slots + _where_slots(where))
+    fill = _placeholders(paramstyle, names)
+    return _render_lookup(table, columns, key_columns, rows, where, fill), names
+
+
+# -------------------------
+# Query building
+# -------------------------
 def build_select_query(
     *,
     table: str,
     columns: Optional[List[str]] = None,
     where: Optional[Dict[str, Any]] = None,
-    limit: Optional[int] = None
-) -> str:
+    limit: Optional[int] = None,
+    paramstyle: Optional[str] = None,
+    max_params: int = _MAX_PARAMS
+) -> Query:
     """
     Build a dynamic SELECT SQL query.
-    """
 
-    if not table or not isinstance(table, str):
-        raise SQLBuilderError("Table name must be a non-empty string")
+    WHERE values are compared with ``=``; a list or tuple value becomes
+    ``col IN (...)`` (an empty one matches nothing).
 
-    if columns is not None and not isinstance(columns, list):
-        raise SQLBuilderError("Columns must be a list of strings")
+    By default WHERE values are inlined into the SQL text. With a DB-API
+    ``paramstyle`` ("qmark", "named" or "pyformat") a ``(sql, params)``
+    pair is returned instead, ready for ``cursor.execute(sql, params)``:
+    params is a tuple for qmark and a dict for named / pyformat. The SQL
+    text only depends on the table, columns, WHERE keys (and IN-list
+    lengths) and limit, so it is cached and identical for repeated
+    queries, letting the database reuse its prepared statement.
 
-    if where is not None and not isinstance(where, dict):
-        raise SQLBuilderError("WHERE clause must be a dictionary")
+    A parameterized query may bind at most ``max_params`` values (999 by
+    default, SQLite's historic limit); longer IN-lists raise
+    SQLBuilderError. Use build_batch_lookup to split a large list of keys
+    into several queries, or raise max_params for databases that accept
+    more parameters.
+    """
+
+    _validate_select(table, columns, where)
 
     if limit is not None and (not isinstance(limit, int) or limit <= 0):
         raise SQLBuilderError("LIMIT must be a positive integer")
 
-    select_clause = "SELECT *" if not columns else "SELECT " + ", ".join(columns)
-    from_clause = f"FROM {table}"
+    _validate_paramstyle(paramstyle)
+    where = where or {}
 
-    where_clause = ""
-    if where:
-        conditions = [
-            f"{col} = {_format_value(val)}"
-            for col, val in where.items()
+    if paramstyle is not None:
+        if not isinstance(max_params, int) or isinstance(max_params, bool) or max_params <= 0:
+            raise SQLBuilderError("max_params must be a positive integer")
+        spec, values = _split_where(where, True)
+        if len(values) > max_params:
+            raise SQLBuilderError(
+                f"Query needs {len(values)} parameters, more than max_params={max_params}; "
+                "use build_batch_lookup for long IN-lists"
+            )
+        sql, names = _select_template(table, tuple(columns or ()), spec, limit, paramstyle)
+        return _bind(sql, names, values, paramstyle)
+
+    conditions = [_inline_condition(col, val) for col, val in where.items()]
+    return _render_select(table, columns or (), conditions, limit)
+
+
+def _lookup_keys(keys: Any) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """Validate lookup keys; return the key columns and the distinct key tuples."""
+    if not isinstance(keys, list) or not all(isinstance(key, dict) and key for key in keys):
+        raise SQLBuilderError("Lookup keys must be a list of non-empty dictionaries")
+    if not keys:
+        return (), []
+
+    key_columns = tuple(keys[0])
+    if not all(isinstance(col, str) for col in key_columns):
+        raise SQLBuilderError("Lookup key columns must be column names")
+    if any(len(key) != len(key_columns) for key in keys):
+        raise SQLBuilderError("All lookup keys must have the same columns")
+    try:
+        rows = list(dict.fromkeys(tuple(key[col] for col in key_columns) for key in keys))
+    except KeyError as exc:
+        raise SQLBuilderError(f"Lookup key is missing column {exc}") from exc
+    except TypeError as exc:
+        raise SQLBuilderError("Lookup key values must be hashable") from exc
+    return key_columns, rows
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_batch_lookup(
+    *,
+    table: str,
+    keys: List[Dict[str, Any]],
+    columns: Optional[List[str]] = None,
+    where: Optional[Dict[str, Any]] = None,
+    strategy: str = "in",
+    max_params: int = _MAX_PARAMS,
+    paramstyle: Optional[str] = "qmark"
+) -> List[Query]:
+    """
+    Build the queries that fetch the rows matching a list of keys.
+
+    ``keys`` is a list of dicts with the same columns, e.g.
+    ``[{"id": 1}, {"id": 2}]`` or ``[{"region": "eu", "id": 7}, ...]``;
+    duplicates are removed. ``where`` adds fixed conditions to every
+    query. Each query uses at most ``max_params`` parameters (values,
+    when inlined), so N single-row lookups collapse into
+    ceil(N / max_params) round trips.
+
+    Strategies:
+
+    - "in": ``key IN (...)``. Composite keys are grouped on all but
+      their last column (``region = ? AND id IN (...)``), so this suits
+      keys that share their leading columns.
+    - "values": joins the table with a ``WITH lookup_keys (...) AS
+      (VALUES ...)`` list, one query per chunk whatever the keys.
+
+    Returns a list of queries in the format of build_select_query for
+    the given paramstyle (``(sql, params)`` pairs by default, SQL
+    strings with paramstyle=None). NULL key values match nothing, as
+    with ``=`` in SQL.
+    """
+    _validate_select(table, columns, where)
+    _validate_paramstyle(paramstyle)
+
+    if strategy not in _LOOKUP_STRATEGIES:
+        raise SQLBuilderError(
+            f"Unsupported lookup strategy: {strategy}. Use one of {list(_LOOKUP_STRATEGIES)}"
+        )
+    if not isinstance(max_params, int) or isinstance(max_params, bool) or max_params <= 0:
+        raise SQLBuilderError("max_params must be a positive integer")
+
+    key_columns, rows = _lookup_keys(keys)
+    where = where or {}
+    overlap = set(key_columns) & set(where)
+    if overlap:
+        raise SQLBuilderError(f"Columns {sorted(overlap)} are both lookup keys and WHERE keys")
+    if not rows:
+        return []
+
+    null_checks = paramstyle is not None
+    spec, extra = _split_where(where, null_checks)
+    fixed = len(extra)
+
+    if strategy == "in":
+        # Group composite keys on their leading columns. A NULL leading
+        # value would render as IS NULL and match rows, so such keys are
+        # dropped: like the other strategies, they match nothing.
+        groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        for row in rows:
+            if None not in row[:-1]:
+                groups.setdefault(row[:-1], []).append(row[-1])
+
+        size = max_params - fixed - (len(key_columns) - 1)
+        if size <= 0:
+            raise SQLBuilderError("max_params is too small for the WHERE and key columns")
+        return [
+            build_select_query(
+                table=table,
+                columns=columns,
+                where={**where, **dict(zip(key_columns, prefix)), key_columns[-1]: chunk},
+                paramstyle=paramstyle,
+                max_params=max_params,
+            )
+            for prefix, values in groups.items()
+            for chunk in _chunks(values, size)
         ]
-        where_clause = "WHERE " + " AND ".join(conditions)
 
-    limit_clause = f"LIMIT {limit}" if limit else ""
+    size = (max_params - fixed) // len(key_columns)
+    if size <= 0:
+        raise SQLBuilderError("max_params is too small for the WHERE and key columns")
+
+    queries: List[Query] = []
+    for chunk in _chunks(rows, size):
+        values = [value for row in chunk for value in row] + extra
+        if paramstyle is None:
+            fill = map(_format_value, values)
+            queries.append(_render_lookup(
+                table, tuple(columns or ()), key_columns, len(chunk), spec, fill
+            ))
+        else:
+            sql, names = _lookup_template(
+                table, tuple(columns or ()), key_columns, len(chunk), spec, paramstyle
+            )
+            queries.append(_bind(sql, names, values, paramstyle))
+    return queries
+
+
+# -------------------------
+# Query builder
+# -------------------------
+_MISSING = object()
+
+
+def _operator_condition(
+    col: Any,
+    op: Any,
+    value: Any
+) -> Tuple[Tuple[str, str, int], List[Any]]:
+    """Normalize one condition to its (column, operator, arity) shape and values."""
+    if not col or not isinstance(col, str):
+        raise SQLBuilderError("Condition column must be a non-empty string")
+    if not isinstance(op, str) or op.strip().lower() not in _OPERATORS:
+        raise SQLBuilderError(
+            f"Unsupported operator: {op}. Use one of {list(_OPERATORS)}"
+        )
+    op = op.strip().lower()
+
+    if op in _UNARY_OPERATORS:
+        if value is not _MISSING:
+            raise SQLBuilderError(f"Operator '{op}' takes no value")
+        return (col, op, 0), []
+    if value is _MISSING:
+        raise SQLBuilderError(f"Operator '{op}' needs a value")
+
+    if value is None and op in ("=", "!=", "<>"):
+        # = NULL never matches
+        return (col, "is null" if op == "=" else "is not null", 0), []
+    if op == "=" and isinstance(value, (list, tuple)):
+        op = "in"
+
+    if op in _LIST_OPERATORS:
+        if not isinstance(value, (list, tuple)):
+            raise SQLBuilderError(f"Operator '{op}' needs a list of values")
+        return (col, op, len(value)), list(value)
+    if op in _RANGE_OPERATORS:
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            raise SQLBuilderError(f"Operator '{op}' needs a (low, high) pair")
+        return (col, op, 2), list(value)
+    return (col, op, 1), [value]
+
+
+class _Slots:
+    """
+    Hands out placeholders while a query is rendered.
+
+    Every placeholder binds one entry of the query's flat value list;
+    ``order`` records which one, in SQL order. ``render`` turns (value
+    index, column) into the placeholder text.
+    """
+
+    def __init__(self, render: Callable[[int, str], str]) -> None:
+        self.render = render
+        self.order: List[Tuple[str, int]] = []
+        self.position = 0
+
+    def next(self, col: str) -> str:
+        self.position += 1
+        return self.at(col, self.position - 1)
+
+    def at(self, col: str, index: int) -> str:
+        self.order.append((col, index))
+        return self.render(index, col)
+
+
+def _render_operator(condition: Tuple[str, str, int], slots: _Slots) -> str:
+    col, op, arity = condition
+    sql_op = _OPERATORS[op]
+    if op in _UNARY_OPERATORS:
+        return f"{col} {sql_op}"
+    if op in _RANGE_OPERATORS:
+        return f"{col} {sql_op} {slots.next(col)} AND {slots.next(col)}"
+    if op in _LIST_OPERATORS:
+        if arity == 0:
+            # Empty list: IN matches nothing, NOT IN everything
+            return "1 = 0" if op == "in" else "1 = 1"
+        return f"{col} {sql_op} ({', '.join(slots.next(col) for _ in range(arity))})"
+    return f"{col} {sql_op} {slots.next(col)}"
+
+
+def _render_keyset(order_by: Tuple[Tuple[str, bool], ...], slots: _Slots) -> str:
+    """
+    Render the seek condition "rows after the given sort key".
+
+    One direction: a row-value comparison ``(a, b) > (?, ?)``. Mixed
+    directions: ``a > ? OR (a = ? AND b < ?)``.
+    """
+    base = slots.position
+    slots.position += len(order_by)
+    columns = [col for col, _ in order_by]
+
+    if len({desc for _, desc in order_by}) == 1:
+        op = "<" if order_by[0][1] else ">"
+        if len(columns) == 1:
+            return f"{columns[0]} {op} {slots.at(columns[0], base)}"
+        keys = ", ".join(slots.at(col, base + i) for i, col in enumerate(columns))
+        return f"({', '.join(columns)}) {op} ({keys})"
+
+    terms = []
+    for i, (col, desc) in enumerate(order_by):
+        parts = [f"{prev} = {slots.at(prev, base + j)}" for j, prev in enumerate(columns[:i])]
+        parts.append(f"{col} {'<' if desc else '>'} {slots.at(col, base + i)}")
+        terms.append(parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")")
+    return "(" + " OR ".join(terms) + ")"
+
+
+def _render_query(spec: Tuple[Any, ...], slots: _Slots) -> str:
+    table, columns, joins, where, keyset, group_by, having, order_by, limit, offset = spec
+
+    parts = ["SELECT " + (", ".join(columns) if columns else "*"), f"FROM {table}"]
+    for kind, other, on in joins:
+        parts.append(f"{_JOINS[kind]} {other}" + (f" ON {on}" if on else ""))
+
+    conditions = [_render_operator(condition, slots) for condition in where]
+    if keyset:
+        conditions.append(_render_keyset(order_by, slots))
+    if conditions:
+        parts.append("WHERE " + " AND ".join(conditions))
+
+    if group_by:
+        parts.append("GROUP BY " + ", ".join(group_by))
+    if having:
+        parts.append("HAVING " + " AND ".join(_render_operator(c, slots) for c in having))
+    if order_by:
+        parts.append("ORDER BY " + ", ".join(
+            f"{col} DESC" if desc else col for col, desc in order_by
+        ))
+    if limit:
+        parts.append(f"LIMIT {limit}")
+    if offset:
+        parts.append(f"OFFSET {offset}")
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _query_template(
+    spec: Tuple[Any, ...],
+    paramstyle: str
+) -> Tuple[str, Tuple[int, ...], Tuple[Tuple[int, str], ...]]:
+    """
+    Build a parameterized QueryBuilder query.
+
+    Returns the SQL, the value index bound by each placeholder (for
+    positional styles) and the parameter name of each value (for named
+    styles; a value used twice, as in keyset conditions, keeps one name).
+    """
+    recorder = _Slots(lambda index, col: "")
+    _render_query(spec, recorder)
+
+    seen: Dict[int, str] = {}
+    counts: Dict[str, int] = {}
+    slots: List[Tuple[str, Optional[int]]] = []
+    for col, index in recorder.order:
+        if index not in seen:
+            seen[index] = col
+            slots.append((col, counts.get(col)))
+            counts[col] = counts.get(col, 0) + 1
+    names = dict(zip(seen, _param_names(slots)))
+
+    final = _Slots(lambda index, col: _placeholder(paramstyle, names[index]))
+    sql = _render_query(spec, final)
+    return sql, tuple(index for _, index in final.order), tuple(names.items())
+
+
+class QueryBuilder:
+    """
+    A composable SELECT query.
+
+    Every method returns a new QueryBuilder, leaving the original
+    unchanged, so a base query can be shared and refined::
+
+        sql, params = (
+            QueryBuilder("orders")
+            .join("customers", on={"orders.customer_id": "customers.id"})
+            .where(status="paid")
+            .where("orders.created", ">=", "2024-01-01")
+            .select("customers.region")
+            .aggregate(total=("sum", "orders.amount"), orders=("count", "*"))
+            .group_by("customers.region")
+            .having("SUM(orders.amount)", ">", 1000)
+            .order_by("total DESC")
+            .build(paramstyle="qmark")
+        )
+
+    Keyset (seek) pagination fetches the page after a known row without
+    an OFFSET scan: order by a unique key, then pass the last row of the
+    previous page to after()::
+
+        page = QueryBuilder("events").order_by("created", "id").limit(500)
+        rows = run(page)
+        rows = run(page.after(rows[-1]))
+
+    Identifiers are not quoted or validated; only values are escaped
+    (inline) or bound as parameters.
+    """
+
+    def __init__(self, table: str) -> None:
+        if not table or not isinstance(table, str):
+            raise SQLBuilderError("Table name must be a non-empty string")
+        self.table = table
+        self._columns: Tuple[str, ...] = ()
+        self._joins: Tuple[Tuple[str, str, Optional[str]], ...] = ()
+        self._where: Tuple[Tuple[str, str, int], ...] = ()
+        self._where_values: Tuple[Any, ...] = ()
+        self._group_by: Tuple[str, ...] = ()
+        self._having: Tuple[Tuple[str, str, int], ...] = ()
+        self._having_values: Tuple[Any, ...] = ()
+        self._order_by: Tuple[Tuple[str, bool], ...] = ()
+        self._after: Any = None
+        self._limit: Optional[int] = None
+        self._offset: int = 0
+
+    def _with(self, **changes: Any) -> "QueryBuilder":
+        query = QueryBuilder.__new__(QueryBuilder)
+        query.__dict__.update(self.__dict__)
+        for name, value in changes.items():
+            setattr(query, f"_{name}", value)
+        return query
+
+    # -------------------------
+    # Clauses
+    # -------------------------
+    def select(self, *columns: str) -> "QueryBuilder":
+        """Set the selected columns or expressions (default: all columns)."""
+        if not all(col and isinstance(col, str) for col in columns):
+            raise SQLBuilderError("Columns must be non-empty strings")
+        return self._with(columns=tuple(columns))
+
+    def aggregate(self, **aggregates: Tuple[str, str]) -> "QueryBuilder":
+        """
+        Add aggregate columns, as alias=(function, column).
+
+        Functions: count, count_distinct, sum, avg, min, max; for
+        example ``total=("sum", "amount")`` adds ``SUM(amount) AS total``.
+        """
+        added = []
+        for alias, spec in aggregates.items():
+            if not isinstance(spec, tuple) or len(spec) != 2 or spec[0] not in _AGGREGATES:
+                raise SQLBuilderError(
+                    f"Aggregate '{alias}' must be (function, column) with a function "
+                    f"in {list(_AGGREGATES)}"
+                )
+            func, col = spec
+            if not col or not isinstance(col, str):
+                raise SQLBuilderError(f"Aggregate '{alias}' needs a column name")
+            added.append(f"{_AGGREGATES[func].format(col)} AS {alias}")
+        return self._with(columns=self._columns + tuple(added))
+
+    def join(
+        self,
+        table: str,
+        *,
+        on: Union[str, Dict[str, str], None] = None,
+        kind: str = "inner"
+    ) -> "QueryBuilder":
+        """
+        Join another table.
+
+        ``on`` is a SQL condition or a {left_column: right_column} dict of
+        equalities; ``kind`` is inner, left, right, full or cross (which
+        takes no condition).
+        """
+        if not table or not isinstance(table, str):
+            raise SQLBuilderError("Join table must be a non-empty string")
+        if kind not in _JOINS:
+            raise SQLBuilderError(f"Unsupported join kind: {kind}. Use one of {list(_JOINS)}")
+        if isinstance(on, dict):
+            on = " AND ".join(f"{left} = {right}" for left, right in on.items())
+        if kind == "cross" and on:
+            raise SQLBuilderError("A cross join takes no condition")
+        if kind != "cross" and (not on or not isinstance(on, str)):
+            raise SQLBuilderError("Join condition must be a non-empty string or dictionary")
+        return self._with(joins=self._joins + ((kind, table, on),))
+
+    @staticmethod
+    def _parse_conditions(args: Tuple[Any, ...], equals: Dict[str, Any]) -> Tuple[tuple, tuple]:
+        if len(args) not in (0, 2, 3):
+            raise SQLBuilderError("Conditions are (column, operator[, value]) or column=value")
+        parsed = [args if len(args) == 3 else (*args, _MISSING)] if args else []
+        parsed += [(col, "=", value) for col, value in equals.items()]
+
+        conditions = []
+        values: List[Any] = []
+        for col, op, value in parsed:
+            condition, condition_values = _operator_condition(col, op, value)
+            conditions.append(condition)
+            values.extend(condition_values)
+        return tuple(conditions), tuple(values)
+
+    def where(self, *args: Any, **equals: Any) -> "QueryBuilder":
+        """
+        Add WHERE conditions, ANDed with the existing ones.
+
+        Either ``where(column, operator, value)`` with an operator from
+        =, !=, <, <=, >, >=, like, not like, in, not in, between (value is
+        a (low, high) pair) and not between; ``where(column, "is null")``
+        / ``"is not null"``; or equalities as keyword arguments, where a
+        list means IN and None means IS NULL.
+        """
+        conditions, values = self._parse_conditions(args, equals)
+        return self._with(
+            where=self._where + conditions,
+            where_values=self._where_values + values,
+        )
+
+    def group_by(self, *columns: str) -> "QueryBuilder":
+        """Group the rows by the given columns or expressions."""
+        if not columns or not all(col and isinstance(col, str) for col in columns):
+            raise SQLBuilderError("GROUP BY columns must be non-empty strings")
+        return self._with(group_by=self._group_by + tuple(columns))
+
+    def having(self, *args: Any, **equals: Any) -> "QueryBuilder":
+        """Add HAVING conditions; same arguments as where()."""
+        conditions, values = self._parse_conditions(args, equals)
+        return self._with(
+            having=self._having + conditions,
+            having_values=self._having_values + values,
+        )
+
+    def order_by(self, *columns: str) -> "QueryBuilder":
+        """Add sort columns, e.g. ``order_by("created DESC", "id")``."""
+        order = []
+        for col in columns:
+            if not col or not isinstance(col, str):
+                raise SQLBuilderError("ORDER BY columns must be non-empty strings")
+            parts = col.rsplit(None, 1)
+            if len(parts) == 2 and parts[1].upper() in ("ASC", "DESC"):
+                order.append((parts[0], parts[1].upper() == "DESC"))
+            else:
+                order.append((col, False))
+        return self._with(order_by=self._order_by + tuple(order))
+
+    def limit(self, limit: int, *, offset: int = 0) -> "QueryBuilder":
+        """Limit the number of rows. Prefer after() over large offsets."""
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0:
+            raise SQLBuilderError("LIMIT must be a positive integer")
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise SQLBuilderError("OFFSET must be a non-negative integer")
+        return self._with(limit=limit, offset=offset)
+
+    def after(self, row: Union[Dict[str, Any], Tuple[Any, ...], List[Any], None]) -> "QueryBuilder":
+        """
+        Keep only the rows that sort after ``row`` (keyset pagination).
+
+        ``row`` is the last row of the previous page: a dict holding the
+        ORDER BY columns (qualified names such as ``events.id`` may be
+        given as ``id``) or a sequence of their values in ORDER BY order.
+        The ORDER BY columns must be non-null and end with a unique
+        column. None starts from the first page.
+        """
+        if row is not None and not isinstance(row, (dict, tuple, list)):
+            raise SQLBuilderError("after() takes a row dict or a sequence of sort key values")
+        return self._with(after=row)
+
+    # -------------------------
+    # Rendering
+    # -------------------------
+    def _keyset_values(self) -> Tuple[Any, ...]:
+        if self._after is None:
+            return ()
+        if not self._order_by:
+            raise SQLBuilderError("Keyset pagination needs order_by()")
+        row = self._after
+        if not isinstance(row, dict):
+            if len(row) != len(self._order_by):
+                raise SQLBuilderError(
+                    f"after() needs {len(self._order_by)} sort key values, got {len(row)}"
+                )
+            return tuple(row)
+
+        values = []
+        for col, _ in self._order_by:
+            short = col.rsplit(".", 1)[-1]
+            if col in row:
+                values.append(row[col])
+            elif short in row:
+                values.append(row[short])
+            else:
+                raise SQLBuilderError(f"after() row is missing sort column '{col}'")
+        return tuple(values)
+
+    def build(self, *, paramstyle: Optional[str] = None) -> Query:
+        """
+        Render the query.
+
+        Returns SQL with inlined values, or a ``(sql, params)`` pair for a
+        DB-API paramstyle, as build_select_query does. Parameterized SQL
+        is cached on the query's shape, so pages of a keyset scan and
+        repeated queries share one statement.
+        """
+        _validate_paramstyle(paramstyle)
+        keyset = self._keyset_values()
+        values = self._where_values + keyset + self._having_values
+        spec = (
+            self.table, self._columns, self._joins, self._where, bool(keyset),
+            self._group_by, self._having, self._order_by, self._limit, self._offset,
+        )
+
+        if paramstyle is None:
+            return _render_query(spec, _Slots(lambda index, col: _format_value(values[index])))
 
-    query = " ".join(
-        part for part in [select_clause, from_clause, where_clause, limit_clause]
-        if part
-    ).strip()
+        sql, order, names = _query_template(spec, paramstyle)
+        if paramstyle == "qmark":
+            return sql, tuple(values[index] for index in order)
+        return sql, {name: values[index] for index, name in names}
 
-    return query
+    def __str__(self) -> str:
+        return self.build()
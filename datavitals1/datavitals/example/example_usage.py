@@ -14,6 +14,7 @@ import pandas as pd
 
 from datavitals.cleaning import clean_dataframe
 from datavitals.etl import run_etl_pipeline
+from datavitals.sources import DataFrameSource
 from datavitals.sql_builder import build_select_query
 
 
@@ -46,7 +47,8 @@ def main():
     # --------------------------------------------------
     # 3️⃣ PREPARE DATA FOR ETL
     # --------------------------------------------------
-    source_data = cleaned_df.to_dict(orient="records")
+    # The DataFrame is read in slices; no up-front list of dicts is built
+    source_data = DataFrameSource(cleaned_df, chunksize=1000)
 
     # --------------------------------------------------
     # 4️⃣ RUN ETL PIPELINE
@@ -0,0 +1,167 @@
+"""
+Tests for datavitals.async_etl module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate the asyncio ETL runner including:
+              1. Async sources and async transforms
+              2. Bounded concurrency and ordered output
+              3. Backpressure from a slow destination
+              4. ETLError semantics
+              5. Thread-bound destinations and sources (sqlite)
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from datavitals.async_etl import arun_etl_pipeline
+from datavitals.destinations import Destination
+from datavitals.etl import ETLError
+from datavitals.sources import SQLiteSource
+
+
+async def _async_source(count):
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield {"id": i, "amount": i}
+
+
+def test_async_pipeline_bounds_concurrency_and_keeps_order():
+    """
+    Async transforms overlap up to the concurrency limit, output stays ordered.
+    """
+    state = {"running": 0, "peak": 0}
+
+    async def lookup(record):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        # Later records finish first
+        await asyncio.sleep(0.001 * (50 - record["id"] % 50))
+        state["running"] -= 1
+        return {**record, "enriched": True}
+
+    result = asyncio.run(arun_etl_pipeline(
+        source=_async_source(120),
+        custom_transform=lookup,
+        concurrency=8
+    ))
+
+    assert [record["id"] for record in result] == list(range(120))
+    assert all(record["enriched"] for record in result)
+    assert 1 < state["peak"] <= 8
+
+
+def test_async_pipeline_slow_destination_applies_backpressure():
+    """
+    The extractor never runs more than queue_size records ahead of the sink.
+    """
+    state = {"extracted": 0, "loaded": 0, "max_ahead": 0}
+
+    async def source():
+        for i in range(200):
+            state["extracted"] += 1
+            state["max_ahead"] = max(
+                state["max_ahead"], state["extracted"] - state["loaded"]
+            )
+            yield {"id": i}
+
+    class SlowSink(Destination):
+        def write_batch(self, batch):
+            import time
+            time.sleep(0.002)
+            state["loaded"] += len(batch)
+
+        def close(self):
+            return state["loaded"]
+
+    loaded = asyncio.run(arun_etl_pipeline(
+        source=source(),
+        destination=SlowSink(),
+        queue_size=10,
+        chunksize=5
+    ))
+
+    assert loaded == 200
+    assert state["max_ahead"] <= 10 + 5 + 2
+
+
+def test_async_pipeline_errors():
+    """
+    Failing transforms and invalid records raise ETLError.
+    """
+    async def fail_on_three(record):
+        if record["id"] == 3:
+            raise ValueError("lookup failed")
+        return record
+
+    with pytest.raises(ETLError, match="'id': 3"):
+        asyncio.run(arun_etl_pipeline(
+            source=_async_source(10),
+            custom_transform=fail_on_three
+        ))
+
+    with pytest.raises(ETLError):
+        asyncio.run(arun_etl_pipeline(source=[{"id": 1}, "bad"]))
+
+    with pytest.raises(ETLError):
+        asyncio.run(arun_etl_pipeline(source="not_a_list"))
+
+
+def test_async_pipeline_accepts_plain_iterables():
+    """
+    Regular lists work with the built-in transforms.
+    """
+    result = asyncio.run(arun_etl_pipeline(
+        source=[{"id": 1, "amount": 100}],
+        transform_type="double"
+    ))
+
+    assert result == [{"id": 2, "amount": 200}]
+
+
+def test_async_pipeline_loads_into_sqlite(tmp_path):
+    """
+    sqlite3 connections are thread-bound: the sink is opened, written and
+    closed on one thread.
+    """
+    path = str(tmp_path / "out.db")
+
+    loaded = asyncio.run(arun_etl_pipeline(
+        source=_async_source(25),
+        transform_type="double",
+        destination="sqlite",
+        destination_options={"database": path, "table": "items"},
+        chunksize=10
+    ))
+
+    assert loaded == 25
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT id FROM items ORDER BY id").fetchall()
+    assert [row[0] for row in rows] == [i * 2 for i in range(25)]
+
+
+def test_async_pipeline_reads_sqlite_source(tmp_path):
+    """
+    A SQLiteSource is read on one thread, even while transforms use the default pool.
+    """
+    path = str(tmp_path / "in.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER, amount INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, i) for i in range(100)])
+    conn.close()
+
+    async def enrich(record):
+        loop = asyncio.get_running_loop()
+        amount = await loop.run_in_executor(None, lambda: record["amount"] * 3)
+        return {**record, "amount": amount}
+
+    result = asyncio.run(arun_etl_pipeline(
+        source=SQLiteSource(path, "SELECT * FROM t ORDER BY id", chunksize=10),
+        custom_transform=enrich,
+        concurrency=8,
+    ))
+
+    assert [record["id"] for record in result] == list(range(100))
+    assert result[-1]["amount"] == 297
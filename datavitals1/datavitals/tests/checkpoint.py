@@ -0,0 +1,161 @@
+"""
+Tests for datavitals.checkpoint module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate checkpointed and incremental ETL runs including:
+              1. JSON file and SQLite checkpoint stores
+              2. Resuming a failed run from the last committed batch
+                 (and refusing to resume into the memory destination)
+              3. Watermark-based incremental extraction
+"""
+
+import csv
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from datavitals.checkpoint import FileCheckpoint, SQLiteCheckpoint
+from datavitals.etl import run_etl_pipeline, ETLError
+from datavitals.sources import SQLiteSource
+
+
+@pytest.fixture
+def orders():
+    return [{"id": i, "amount": i * 10} for i in range(1, 11)]
+
+
+def test_checkpoint_stores_round_trip(tmp_path):
+    """
+    Both stores keep one state per key and can be cleared.
+    """
+    for store_cls, target in (
+        (FileCheckpoint, str(tmp_path / "state.json")),
+        (SQLiteCheckpoint, str(tmp_path / "state.db")),
+    ):
+        first = store_cls(target, key="orders")
+        second = store_cls(target, key="customers")
+
+        assert first.load() == {}
+        first.save({"offset": 5})
+        second.save({"offset": 7})
+
+        assert store_cls(target, key="orders").load() == {"offset": 5}
+        first.clear()
+        assert first.load() == {}
+        assert second.load() == {"offset": 7}
+
+
+def test_failed_run_resumes_from_last_checkpoint(tmp_path, orders):
+    """
+    A rerun skips the batches already loaded and completes the CSV file once.
+    """
+    path = tmp_path / "out.csv"
+    checkpoint = FileCheckpoint(str(tmp_path / "state.json"), key="orders")
+    seen = []
+
+    def fail_on_seven(record):
+        seen.append(record["id"])
+        if record["id"] == 7:
+            raise ValueError("boom")
+        return record
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(
+            source=orders,
+            custom_transform=fail_on_seven,
+            destination="csv",
+            destination_options={"path": str(path)},
+            checkpoint=checkpoint,
+            chunksize=3
+        )
+    assert checkpoint.load()["offset"] == 6
+
+    seen.clear()
+    rows = run_etl_pipeline(
+        source=orders,
+        custom_transform=lambda record: record,
+        destination="csv",
+        destination_options={"path": str(path)},
+        checkpoint=checkpoint,
+        chunksize=3
+    )
+
+    with open(path, newline="") as fh:
+        written = [int(row["id"]) for row in csv.DictReader(fh)]
+
+    assert rows == 10
+    assert written == list(range(1, 11))
+    assert checkpoint.load()["offset"] == 0
+
+
+def test_memory_destination_refuses_to_resume(tmp_path, orders):
+    """
+    Records held in memory by a failed run are lost, so resuming into the
+    memory destination raises instead of returning partial output.
+    """
+    checkpoint = FileCheckpoint(str(tmp_path / "state.json"), key="orders")
+
+    def fail_on_seven(record):
+        if record["id"] == 7:
+            raise ValueError("boom")
+        return record
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(
+            source=orders, custom_transform=fail_on_seven,
+            checkpoint=checkpoint, chunksize=3
+        )
+    assert checkpoint.load()["offset"] == 6
+
+    with pytest.raises(ETLError, match="cannot resume"):
+        run_etl_pipeline(source=orders, checkpoint=checkpoint, chunksize=3)
+
+    checkpoint.clear()
+    assert run_etl_pipeline(source=orders, checkpoint=checkpoint, chunksize=3) == orders
+
+
+def test_watermark_runs_only_process_new_records(tmp_path):
+    """
+    Each run extracts only records newer than the previous run's watermark.
+    """
+    checkpoint = SQLiteCheckpoint(str(tmp_path / "state.db"), key="events")
+    events = [
+        {"id": i, "updated_at": datetime(2024, 1, i)} for i in range(1, 4)
+    ]
+
+    first = run_etl_pipeline(source=events, watermark="updated_at", checkpoint=checkpoint)
+    assert [record["id"] for record in first] == [1, 2, 3]
+
+    events.append({"id": 4, "updated_at": datetime(2024, 1, 4)})
+    second = run_etl_pipeline(source=events, watermark="updated_at", checkpoint=checkpoint)
+    assert [record["id"] for record in second] == [4]
+    assert checkpoint.load()["watermark"] == {"datetime": "2024-01-04T00:00:00"}
+
+    explicit = run_etl_pipeline(
+        source=events, watermark="updated_at", since=datetime(2024, 1, 2)
+    )
+    assert [record["id"] for record in explicit] == [3, 4]
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(source=events, since=datetime(2024, 1, 2))
+
+
+def test_sqlite_source_filters_watermark_in_query(tmp_path):
+    """
+    SQLiteSource pushes the watermark condition into its query.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (id INTEGER, updated_at TEXT)")
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?)",
+        [(i, f"2024-01-0{i} 00:00:00") for i in range(1, 6)]
+    )
+    source = SQLiteSource(conn, "SELECT * FROM events WHERE id > ? ORDER BY id", (1,))
+
+    result = run_etl_pipeline(
+        source=source, watermark="updated_at", since=datetime(2024, 1, 3)
+    )
+
+    assert [record["id"] for record in result] == [4, 5]
@@ -8,12 +8,26 @@ Purpose      : Validate real-world cleaning behaviour including:
               2. Duplicate removal
               3. String trimming
               4. Numeric conversion
+              5. Chunked / streaming cleaning
+              6. In-place cleaning
+              7. Schema (dtype plan) caching
+              8. Parallel cleaning
+              9. Memory-compact dtypes
+             10. Key-subset, hash and approximate deduplication
+             11. Per-step row and timing statistics
 """
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from datavitals.cleaning import clean_dataframe, DataCleaningError
+from datavitals.cleaning import (
+    clean_dataframe,
+    clean_chunks,
+    clean_csv,
+    DataCleaningError,
+    SchemaCache,
+)
 
 
 def test_cleaning_removes_nulls_and_duplicates(sample_raw_data):
@@ -79,3 +93,397 @@ def test_cleaning_raises_error_on_empty_result():
     df = pd.DataFrame({"col1": [None, None], "col2": [None, None]})
     with pytest.raises(DataCleaningError):
         clean_dataframe(df)
+
+
+def test_cleaning_trims_and_converts_in_single_pass():
+    """
+    Trimmed numeric strings are converted, text columns stay text.
+    """
+    df = pd.DataFrame({
+        "id": [" 1", "2 ", " 3 "],
+        "name": [" Alice ", "Bob", " Eve"],
+    })
+
+    cleaned_df = clean_dataframe(df)
+
+    assert cleaned_df["id"].tolist() == [1, 2, 3]
+    assert pd.api.types.is_integer_dtype(cleaned_df["id"])
+    assert cleaned_df["name"].tolist() == ["Alice", "Bob", "Eve"]
+
+
+def test_cleaning_skips_text_columns_beyond_probe():
+    """
+    Long text columns are ruled out by the numeric probe without errors.
+    """
+    df = pd.DataFrame({
+        "code": ["A%d" % i for i in range(500)],
+        "value": [str(i) for i in range(500)],
+    })
+
+    cleaned_df = clean_dataframe(df)
+
+    assert cleaned_df["code"].iloc[0] == "A0"
+    assert pd.api.types.is_integer_dtype(cleaned_df["value"])
+    assert len(cleaned_df) == 500
+
+
+def test_clean_chunks_matches_full_clean():
+    """
+    Cleaning chunk by chunk gives the same rows as cleaning the whole frame,
+    including duplicates that span chunk boundaries.
+    """
+    df = pd.DataFrame({
+        "id": [1, 2, 2, 3, 1, 4, None, 4],
+        "name": [" A", "B", "B", "C", " A", "D", "E", "D "],
+    })
+    chunks = [df.iloc[i:i + 3] for i in range(0, len(df), 3)]
+
+    streamed = pd.concat(list(clean_chunks(chunks)))
+
+    pd.testing.assert_frame_equal(streamed, clean_dataframe(df))
+
+
+def test_clean_chunks_dedups_across_many_chunks():
+    """
+    Duplicates are found against every earlier chunk, not just recent ones.
+    """
+    df = pd.DataFrame({"id": [i % 150 for i in range(600)], "value": [i % 150 for i in range(600)]})
+    chunks = [df.iloc[i:i + 7] for i in range(0, len(df), 7)]
+
+    streamed = pd.concat(list(clean_chunks(chunks)))
+
+    pd.testing.assert_frame_equal(streamed, clean_dataframe(df))
+    assert len(streamed) == 150
+
+
+def test_clean_chunks_raises_after_last_chunk_when_empty():
+    """
+    The empty-result error is raised only once all chunks are consumed.
+    """
+    chunks = [pd.DataFrame({"col1": [None]}), pd.DataFrame({"col1": [None]})]
+
+    with pytest.raises(DataCleaningError):
+        list(clean_chunks(chunks))
+
+
+def test_clean_csv_reads_in_chunks(tmp_path):
+    """
+    clean_csv streams a CSV file through the cleaning steps.
+    """
+    path = tmp_path / "data.csv"
+    pd.DataFrame({
+        "id": [1, 2, 2, 3],
+        "salary": ["1000", "2000", "2000", "3000"],
+    }).to_csv(path, index=False)
+
+    chunks = list(clean_csv(str(path), chunksize=2))
+
+    assert len(chunks) == 2
+    assert pd.concat(chunks)["id"].tolist() == [1, 2, 3]
+
+    with pytest.raises(DataCleaningError):
+        clean_csv(str(path), chunksize=0)
+
+
+def test_clean_chunks_dedups_across_chunks_with_different_dtypes():
+    """
+    A column read as int64 in one chunk and float64 in another (e.g. it
+    had a null that was filled) still matches duplicates across chunks.
+    """
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "score": [5, 7]}),
+        pd.DataFrame({"id": [1, 3], "score": [5.0, None]}),
+    ]
+    assert chunks[0]["score"].dtype != chunks[1]["score"].dtype
+
+    streamed = pd.concat(list(clean_chunks(chunks, fillna_map={"score": 0})))
+    full = clean_dataframe(pd.concat(chunks, ignore_index=True), fillna_map={"score": 0})
+
+    assert streamed["id"].tolist() == full["id"].tolist() == [1, 2, 3]
+    assert streamed["score"].tolist() == full["score"].tolist() == [5, 7, 0]
+
+
+def test_cleaning_inplace_mutates_input():
+    """
+    inplace=True cleans the caller's frame and returns None.
+    """
+    df = pd.DataFrame({
+        "id": [1, 2, 2, None],
+        "name": [" A", "B", "B", "C"],
+    })
+    expected = clean_dataframe(df)
+    stats = {}
+
+    result = clean_dataframe(df, inplace=True, stats=stats)
+
+    assert result is None
+    pd.testing.assert_frame_equal(df, expected)
+    assert stats["copy_bytes"] == 0
+    assert stats["copy_bytes_saved"] > 0
+
+
+def test_cleaning_inplace_leaves_input_when_result_is_empty():
+    """
+    inplace=True only writes to the caller's frame once the result is
+    known not to be empty.
+    """
+    df = pd.DataFrame({"id": ["1", None], "name": [None, " B"]})
+    original = df.copy()
+
+    with pytest.raises(DataCleaningError):
+        clean_dataframe(df, inplace=True)
+
+    pd.testing.assert_frame_equal(df, original)
+
+
+@pytest.mark.parametrize("dedup_method", ["exact", "hash"])
+def test_cleaning_inplace_with_repeated_index_labels(dedup_method):
+    """
+    Rows are written back by position, so repeated labels are harmless.
+    """
+    df = pd.DataFrame(
+        {"id": [1, 1, 2, None], "name": ["A", "A", " B", "C"]},
+        index=[7, 7, 7, 7],
+    )
+
+    clean_dataframe(df, inplace=True, dedup_method=dedup_method)
+
+    assert df["id"].tolist() == [1, 2]
+    assert df["name"].tolist() == ["A", "B"]
+    assert df.index.tolist() == [0, 1]
+
+
+def test_cleaning_leaves_input_untouched():
+    """
+    The default mode never modifies the caller's frame.
+    """
+    df = pd.DataFrame({"id": [1, 2], "name": [" A", "B "]})
+    original = df.copy()
+
+    cleaned_df = clean_dataframe(df, drop_nulls=False, drop_duplicates=False)
+    cleaned_df.iloc[0, 0] = 100
+
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_schema_cache_reuses_plan_and_handles_drift(tmp_path):
+    """
+    A learned plan is reused for the same schema, persisted to disk, and
+    a column that drifts from text to numeric is still converted.
+    """
+    path = str(tmp_path / "schema.json")
+    cache = SchemaCache(path=path)
+
+    batch = pd.DataFrame({"code": ["A1", "B2"], "amount": ["10", "20"]})
+    first = clean_dataframe(batch, schema_cache=cache)
+    assert len(cache) == 1
+
+    reloaded = SchemaCache(path=path)
+    assert len(reloaded) == 1
+    second = clean_dataframe(batch, schema_cache=reloaded)
+    pd.testing.assert_frame_equal(first, second)
+
+    drifted = pd.DataFrame({"code": ["1", "2"], "amount": ["10", "20"]})
+    cleaned_df = clean_dataframe(drifted, schema_cache=reloaded)
+    assert cleaned_df["code"].tolist() == [1, 2]
+
+
+def test_schema_cache_skips_full_conversion_of_known_text(monkeypatch):
+    """
+    A column learned as text skips the full pd.to_numeric trial while the
+    value that failed to parse is still present, even when the sample misses it.
+    """
+    values = np.arange(200_000).astype(str).astype(object)
+    values[1] = "n/a"  # outside the evenly spaced sample
+    df = pd.DataFrame({"code": values})
+
+    sizes = []
+    to_numeric = pd.to_numeric
+
+    def counting_to_numeric(arg, *args, **kwargs):
+        sizes.append(len(arg))
+        return to_numeric(arg, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "to_numeric", counting_to_numeric)
+    cache = SchemaCache()
+
+    first = clean_dataframe(df, schema_cache=cache, drop_duplicates=False)
+    assert sizes == [64, 200_000]
+
+    sizes.clear()
+    second = clean_dataframe(df, schema_cache=cache, drop_duplicates=False)
+    assert sizes == [64]
+    pd.testing.assert_frame_equal(first, second)
+
+    # Drift: once the text value is gone, the full trial runs again
+    sizes.clear()
+    drifted = df.copy()
+    drifted.iloc[1, 0] = "1"
+    cleaned_df = clean_dataframe(drifted, schema_cache=cache, drop_duplicates=False)
+    assert sizes == [64, 200_000]
+    assert pd.api.types.is_integer_dtype(cleaned_df["code"])
+
+
+def test_schema_cache_evicts_least_recently_used():
+    """
+    Only the most recently used schemas are kept.
+    """
+    cache = SchemaCache(maxsize=2)
+    for name in ["a", "b", "c"]:
+        clean_dataframe(pd.DataFrame({name: ["1"]}), schema_cache=cache)
+
+    assert len(cache) == 2
+
+    with pytest.raises(DataCleaningError):
+        SchemaCache(maxsize=0)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_cleaning_matches_serial(executor):
+    """
+    Parallel cleaning returns exactly the serial result, including a column
+    that is numeric in one row range and text in another.
+    """
+    df = pd.DataFrame({
+        "id": [str(i % 7) for i in range(40)],
+        "mixed": ["1"] * 30 + ["x"] * 10,
+        "name": [" n%d " % (i % 5) for i in range(40)],
+        "value": [float(i % 3) for i in range(40)],
+    })
+
+    result = clean_dataframe(df, workers=3, executor=executor)
+
+    pd.testing.assert_frame_equal(result, clean_dataframe(df))
+
+
+def test_parallel_cleaning_rejects_bad_options():
+    """
+    Invalid workers or executor values raise DataCleaningError.
+    """
+    df = pd.DataFrame({"id": [1, 2]})
+
+    with pytest.raises(DataCleaningError):
+        clean_dataframe(df, workers=0)
+
+    with pytest.raises(DataCleaningError):
+        clean_dataframe(df, workers=2, executor="cluster")
+
+
+def test_cleaning_optimize_memory_downcasts_losslessly():
+    """
+    optimize_memory shrinks dtypes without changing any value.
+    """
+    df = pd.DataFrame({
+        "id": list(range(100)),
+        "ratio": [i / 2 for i in range(100)],
+        "precise": [i / 3 for i in range(100)],
+        "status": [" active", "inactive "] * 50,
+    })
+    stats = {}
+
+    cleaned_df = clean_dataframe(df, optimize_memory=True, stats=stats)
+
+    assert cleaned_df["id"].dtype == "int8"
+    assert cleaned_df["ratio"].dtype == "float32"
+    assert cleaned_df["precise"].dtype == "float64"
+    assert isinstance(cleaned_df["status"].dtype, pd.CategoricalDtype)
+    assert cleaned_df["status"].tolist()[:2] == ["active", "inactive"]
+    assert stats["memory_bytes_after"] < stats["memory_bytes_before"]
+
+
+@pytest.mark.parametrize("dedup_method", ["exact", "hash"])
+def test_cleaning_dedup_on_keys_keeps_last(dedup_method):
+    """
+    dedup_keys and keep select which duplicates are removed.
+    """
+    df = pd.DataFrame({
+        "id": [1, 2, 1, 3],
+        "version": [1, 1, 2, 1],
+    })
+
+    cleaned_df = clean_dataframe(
+        df, dedup_keys=["id"], keep="last", dedup_method=dedup_method
+    )
+
+    assert cleaned_df["id"].tolist() == [2, 1, 3]
+    assert cleaned_df["version"].tolist() == [1, 2, 1]
+
+    with pytest.raises(DataCleaningError):
+        clean_dataframe(df, dedup_keys=["missing"], dedup_method=dedup_method)
+
+
+@pytest.mark.parametrize("dedup_method", ["exact", "hash"])
+def test_cleaning_dedup_keeps_values_of_different_types(dedup_method):
+    """
+    1 and "1" in a mixed object column are different values, as in pandas.
+    """
+    df = pd.DataFrame({"key": pd.Series([1, "1", 1.0, "1"], dtype=object)})
+
+    cleaned_df = clean_dataframe(
+        df,
+        trim_strings=False,
+        convert_numeric=False,
+        dedup_method=dedup_method,
+    )
+
+    assert cleaned_df["key"].tolist() == [1, "1"]
+
+    chunks = [df.iloc[:2], pd.DataFrame({"key": [1, 2]})]
+    cleaned = pd.concat(list(clean_chunks(
+        chunks, trim_strings=False, convert_numeric=False
+    )))
+
+    assert cleaned["key"].tolist() == [1, "1", 2]
+
+
+def test_clean_chunks_bloom_dedup_across_chunks():
+    """
+    The approximate Bloom filter mode removes duplicates across chunks.
+    """
+    chunks = [
+        pd.DataFrame({"id": [1, 2, 3], "value": [10, 20, 30]}),
+        pd.DataFrame({"id": [3, 4, 1], "value": [31, 40, 11]}),
+    ]
+
+    cleaned = pd.concat(list(clean_chunks(
+        chunks,
+        dedup_keys=["id"],
+        dedup_method="bloom",
+        bloom_capacity=1000,
+    )))
+
+    assert cleaned["id"].tolist() == [1, 2, 3, 4]
+
+    # "exact" is accepted as an alias of the digest set, as in clean_dataframe
+    exact = pd.concat(list(clean_chunks(chunks, dedup_keys=["id"], dedup_method="exact")))
+    assert exact["id"].tolist() == [1, 2, 3, 4]
+
+    with pytest.raises(DataCleaningError):
+        clean_chunks(chunks, dedup_method="sorted")
+
+
+def test_cleaning_stats_report_rows_dropped_per_step():
+    """
+    stats records the rows removed by each step, also across chunks.
+    """
+    df = pd.DataFrame({
+        "name": ["a", "b", "d", "a", "c", "c"],
+        "score": [1, 2, None, 1, 5, 5],
+    })
+    stats = {}
+
+    clean_dataframe(df, stats=stats)
+
+    assert stats["rows_in"] == 6
+    assert stats["rows_dropped_nulls"] == 1
+    assert stats["rows_dropped_duplicates"] == 2
+    assert stats["rows_out"] == 3
+    assert set(stats["step_seconds"]) == {"values", "nulls", "duplicates"}
+
+    chunk_stats = {}
+    list(clean_chunks([df.iloc[:3], df.iloc[3:]], stats=chunk_stats))
+
+    assert chunk_stats["rows_in"] == 6
+    assert chunk_stats["rows_dropped_nulls"] == 1
+    assert chunk_stats["rows_dropped_duplicates"] == 2
+    assert chunk_stats["rows_out"] == 3
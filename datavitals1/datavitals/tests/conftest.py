@@ -0,0 +1,36 @@
+"""
+Shared pytest fixtures for the datavitals tests
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Provide the sample data used across test modules:
+              1. A raw DataFrame with nulls and duplicates (cleaning)
+              2. A list of source records (ETL, destinations, metrics)
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_raw_data():
+    """
+    Provides a sample raw DataFrame for multiple test modules.
+    """
+    import pandas as pd
+
+    data = {
+        "id": [1, 2, 2, 3, None],
+        "name": ["Alice", "Bob", "Bob", None, "Eve"],
+        "salary": ["1000", "2000", "2000", "3000", "4000"]
+    }
+
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def sample_source_data():
+    return [
+        {"id": 1, "amount": 100},
+        {"id": 2, "amount": 200},
+        {"id": 3, "amount": 300}
+    ]
@@ -0,0 +1,94 @@
+"""
+Tests for datavitals.connections module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate the DB-API connection pool including:
+              1. Per-thread checkout and reuse
+              2. Size limit and checkout timeout
+              3. Health checks and rollback on release
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from datavitals.connections import ConnectionPool
+from datavitals.etl import ETLError
+
+
+def _connect():
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+def test_pool_checks_out_one_connection_per_thread():
+    """
+    A thread gets the same connection on nested checkouts; other threads get their own.
+    """
+    pool = ConnectionPool(_connect, max_size=2)
+
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(pool.acquire()))
+        thread.start()
+        thread.join()
+        assert seen[0] is not outer
+        assert pool.size == 2
+
+    # Released connections are reused
+    with pool.connection() as again:
+        assert again is outer
+    pool.close()
+
+    with pytest.raises(ETLError):
+        pool.acquire()
+
+
+def test_pool_waits_for_a_free_connection():
+    """
+    Checkouts beyond max_size time out with ETLError.
+    """
+    pool = ConnectionPool(_connect, max_size=1, timeout=0.05)
+    held = pool.acquire()
+
+    errors = []
+
+    def checkout():
+        try:
+            pool.acquire()
+        except ETLError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=checkout)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
+
+    pool.release(held)
+    with pytest.raises(ETLError):
+        pool.release(held)
+
+
+def test_pool_replaces_unhealthy_connections_and_rolls_back():
+    """
+    Broken idle connections are replaced; open transactions are rolled back on release.
+    """
+    pool = ConnectionPool(_connect, max_size=1, check_after=0)
+
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pool.connection() as same:
+        assert same is conn
+        assert same.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+
+    conn.close()
+    with pool.connection() as fresh:
+        assert fresh is not conn
+        assert fresh.execute("SELECT 1").fetchone() == (1,)
+    assert pool.size == 1
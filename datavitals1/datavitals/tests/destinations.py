@@ -0,0 +1,261 @@
+"""
+Tests for datavitals.destinations module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate ETL destinations including:
+              1. CSV and Parquet file sinks
+              2. SQLite bulk loading in batched transactions
+              3. Destination registry and custom sinks
+              4. DB-API bulk loading with row / byte sized batches
+"""
+
+import csv
+import sqlite3
+
+import pytest
+
+from datavitals.connections import ConnectionPool
+from datavitals.etl import run_etl_pipeline, ETLError
+from datavitals.destinations import (
+    CSVDestination,
+    Destination,
+    SQLDestination,
+    SQLiteDestination,
+    register_destination,
+)
+
+
+def test_csv_destination_writes_all_rows(tmp_path, sample_source_data):
+    """
+    The CSV sink writes a header and every transformed row.
+    """
+    path = tmp_path / "out.csv"
+
+    written = run_etl_pipeline(
+        source=sample_source_data,
+        transform_type="double",
+        destination="csv",
+        destination_options={"path": str(path)},
+        chunksize=2
+    )
+
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+
+    assert written == 3
+    assert rows[0] == {"id": "2", "amount": "200"}
+    assert len(rows) == 3
+
+
+def test_csv_destination_writes_dataframe_batches(tmp_path):
+    """
+    DataFrame batches share the header's line endings and may use non-string labels.
+    """
+    pd = pytest.importorskip("pandas")
+    path = tmp_path / "out.csv"
+    sink = CSVDestination(str(path))
+
+    sink.open()
+    sink.write_batch(pd.DataFrame({0: [1, 2], "amount": [10, 20]}))
+    sink.write_batch(pd.DataFrame({0: [3], "amount": [30]}))
+    assert sink.close() == 3
+
+    assert path.read_bytes() == b"0,amount\r\n1,10\r\n2,20\r\n3,30\r\n"
+
+
+def test_parquet_destination_writes_row_groups(tmp_path, sample_source_data):
+    """
+    The Parquet sink writes one row group per batch.
+    """
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+
+    written = run_etl_pipeline(
+        source=sample_source_data,
+        destination="parquet",
+        destination_options={"path": str(path)},
+        chunksize=2
+    )
+
+    parquet_file = pq.ParquetFile(str(path))
+    assert written == 3
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.read().to_pylist() == sample_source_data
+
+
+def test_parquet_destination_infers_schema_past_leading_nulls(tmp_path):
+    """
+    A null in the first record does not fix the column type to null, and
+    batches reaching the sink are full chunks.
+    """
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    source = [{"id": 1, "amount": None, "note": None}] + [
+        {"id": i, "amount": i * 100, "note": f"n{i}" if i > 12 else None}
+        for i in range(2, 26)
+    ]
+
+    written = run_etl_pipeline(
+        source=source,
+        transform_type="double",
+        destination="parquet",
+        destination_options={"path": str(path)},
+        chunksize=10
+    )
+
+    parquet_file = pq.ParquetFile(str(path))
+    row_groups = [parquet_file.metadata.row_group(i).num_rows
+                  for i in range(parquet_file.metadata.num_row_groups)]
+    rows = parquet_file.read().to_pylist()
+    assert written == 25
+    assert row_groups == [10, 10, 5]
+    assert str(parquet_file.schema_arrow.field("note").type) == "string"
+    assert rows[0] == {"id": 2, "amount": None, "note": None}
+    assert rows[-1] == {"id": 50, "amount": 5000, "note": "n25"}
+
+
+def test_sqlite_destination_commits_in_batches(sample_source_data):
+    """
+    The SQLite sink creates the table and inserts all rows with executemany.
+    """
+    conn = sqlite3.connect(":memory:")
+
+    written = run_etl_pipeline(
+        source=sample_source_data,
+        destination=SQLiteDestination(conn, "payments", batch_size=2)
+    )
+
+    rows = conn.execute("SELECT id, amount FROM payments ORDER BY id").fetchall()
+    assert written == 3
+    assert rows[0] == (1, 100)
+    assert len(rows) == 3
+
+
+def test_custom_destination_registry(sample_source_data):
+    """
+    Registered destinations receive batches, not single records.
+    """
+    class BatchCounter(Destination):
+        def __init__(self, sizes):
+            self.sizes = sizes
+
+        def write_batch(self, batch):
+            self.sizes.append(len(batch))
+
+        def close(self):
+            return sum(self.sizes)
+
+    sizes = []
+    register_destination("batch_counter", BatchCounter)
+
+    result = run_etl_pipeline(
+        source=sample_source_data,
+        destination="batch_counter",
+        destination_options={"sizes": sizes},
+        chunksize=2
+    )
+
+    assert result == 3
+    assert sizes == [2, 1]
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(
+            source=sample_source_data,
+            destination="csv",
+            destination_options={"unknown_option": 1}
+        )
+
+
+class _CountingConnection:
+    """sqlite3 connection proxy that counts statements and commits."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.statements = 0
+        self.commits = 0
+
+    def cursor(self):
+        counter = self
+        cursor = self.conn.cursor()
+
+        class Cursor:
+            def execute(self, sql, params=()):
+                counter.statements += 1
+                return cursor.execute(sql, params)
+
+            def executemany(self, sql, rows):
+                counter.statements += 1
+                return cursor.executemany(sql, rows)
+
+            def close(self):
+                cursor.close()
+
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+
+@pytest.mark.parametrize("method", ["values", "executemany"])
+def test_sql_destination_bulk_loads_in_batches(method):
+    """
+    Rows are inserted in batches sized by rows and bytes, one commit per batch.
+    """
+    raw = sqlite3.connect(":memory:")
+    raw.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+    conn = _CountingConnection(raw)
+    records = [{"id": i, "name": "x" * 10} for i in range(25)]
+
+    written = run_etl_pipeline(
+        source=records,
+        destination=SQLDestination(
+            conn, "t", method=method, batch_rows=10, max_params=8, paramstyle="qmark"
+        ),
+    )
+
+    assert written == 25
+    assert raw.execute("SELECT COUNT(*), SUM(id) FROM t").fetchone() == (25, 300)
+    assert conn.commits == 3
+    # max_params=8 allows 4 two-column rows per VALUES statement
+    assert conn.statements == (3 + 3 + 2 if method == "values" else 3)
+
+    # Each row is about 18 bytes: a 40 byte budget commits every 3 rows
+    conn.commits = 0
+    run_etl_pipeline(source=records, destination=SQLDestination(
+        conn, "t", batch_bytes=40, paramstyle="qmark"
+    ))
+    assert conn.commits == 9
+
+
+def test_sql_destination_uses_connection_pool(tmp_path):
+    """
+    The "sql" destination checks a connection out of a pool for the run.
+    """
+    path = str(tmp_path / "out.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER, amount INTEGER)")
+
+    pool = ConnectionPool(lambda: sqlite3.connect(path), max_size=1)
+    records = [{"id": i, "amount": i * 10} for i in range(1, 6)]
+    written = run_etl_pipeline(
+        source=records,
+        transform_type="double",
+        destination="sql",
+        destination_options={"connection": pool, "table": "t", "paramstyle": "named"},
+    )
+
+    assert written == 5
+    with pool.connection() as conn:
+        assert conn.execute("SELECT SUM(amount) FROM t").fetchone() == (300,)
+    assert pool.size == 1
+
+    with pytest.raises(ETLError):
+        SQLDestination(pool, "t", method="copy")
@@ -8,19 +8,20 @@ Purpose      : Validate ETL pipeline including:
               2. Empty input handling
               3. Custom transformation functions
               4. Error handling
+              5. Streaming (lazy) execution
+              6. Parallel transform execution
+              7. Batch (columnar) transforms
+              8. Error-tolerant runs with dead-letter collection
 """
 
 import pytest
-from datavitals.etl import run_etl_pipeline, ETLError
-
-
-@pytest.fixture
-def sample_source_data():
-    return [
-        {"id": 1, "amount": 100},
-        {"id": 2, "amount": 200},
-        {"id": 3, "amount": 300}
-    ]
+from datavitals.etl import (
+    run_etl_pipeline,
+    stream_etl_pipeline,
+    batch_transform,
+    DeadLetterQueue,
+    ETLError,
+)
 
 
 def test_etl_pipeline_doubles_values(sample_source_data):
@@ -119,3 +120,227 @@ def test_etl_pipeline_unsupported_destination(sample_source_data):
             transform_type="double",
             destination="unknown_destination"
         )
+
+
+def test_stream_pipeline_is_lazy():
+    """
+    The streaming pipeline pulls records from a generator one at a time.
+    """
+    pulled = []
+
+    def generate():
+        for i in range(1, 1000001):
+            pulled.append(i)
+            yield {"id": i, "amount": i * 10}
+
+    stream = stream_etl_pipeline(source=generate(), transform_type="double")
+
+    first = next(stream)
+
+    assert first == {"id": 2, "amount": 20}
+    assert len(pulled) == 1
+
+
+def test_stream_pipeline_yields_batches(sample_source_data):
+    """
+    batch_size groups transformed records into fixed-size lists.
+    """
+    batches = list(stream_etl_pipeline(
+        source=iter(sample_source_data),
+        transform_type="double",
+        batch_size=2
+    ))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[1][0]["amount"] == 600
+
+
+def test_stream_pipeline_errors():
+    """
+    Invalid sources fail immediately; invalid records fail when reached.
+    """
+    with pytest.raises(ETLError):
+        stream_etl_pipeline(source="not_an_iterable")
+
+    with pytest.raises(ETLError):
+        stream_etl_pipeline(source=[], batch_size=0)
+
+    stream = stream_etl_pipeline(source=[{"id": 1}, "bad"])
+    assert next(stream) == {"id": 1}
+    with pytest.raises(ETLError):
+        next(stream)
+
+
+def _scale_amount(record):
+    """Module-level transform so it can be pickled for process pools."""
+    if record["amount"] < 0:
+        raise ValueError("negative amount")
+    return {**record, "amount": record["amount"] * 10}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_etl_pipeline_parallel_preserves_order(executor):
+    """
+    Parallel execution returns records in input order.
+    """
+    source = [{"id": i, "amount": i} for i in range(250)]
+
+    result = run_etl_pipeline(
+        source=source,
+        custom_transform=_scale_amount,
+        executor=executor,
+        max_workers=3,
+        chunksize=16
+    )
+
+    assert [record["id"] for record in result] == list(range(250))
+    assert result[-1]["amount"] == 2490
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_etl_pipeline_parallel_error_identifies_record(executor):
+    """
+    A failing transform in a worker still raises ETLError naming the record.
+    """
+    source = [{"id": i, "amount": 1} for i in range(20)]
+    source[13] = {"id": 13, "amount": -1}
+
+    with pytest.raises(ETLError, match="'id': 13"):
+        run_etl_pipeline(
+            source=source,
+            custom_transform=_scale_amount,
+            executor=executor,
+            chunksize=4
+        )
+
+
+def test_etl_pipeline_process_requires_picklable_transform(sample_source_data):
+    """
+    Lambdas cannot be sent to worker processes.
+    """
+    with pytest.raises(ETLError):
+        run_etl_pipeline(
+            source=sample_source_data,
+            custom_transform=lambda record: record,
+            executor="process"
+        )
+
+
+@batch_transform
+def _add_bonus(df):
+    """Module-level pandas batch transform."""
+    df["bonus"] = df["amount"] * 0.1
+    return df
+
+
+def test_etl_pipeline_pandas_batch_transform(sample_source_data):
+    """
+    A batch transform receives whole DataFrames and may run in a pool.
+    """
+    result = run_etl_pipeline(
+        source=sample_source_data,
+        custom_transform=_add_bonus,
+        executor="process",
+        chunksize=2
+    )
+
+    assert [record["bonus"] for record in result] == [10.0, 20.0, 30.0]
+    assert result[0]["id"] == 1
+
+
+@pytest.mark.parametrize("batch_format", ["numpy", "arrow", "records"])
+def test_etl_pipeline_other_batch_formats(sample_source_data, batch_format):
+    """
+    numpy, arrow and records batch formats round-trip to records.
+    """
+    if batch_format == "arrow":
+        pytest.importorskip("pyarrow")
+
+    def count(batch):
+        if batch_format == "records":
+            return [{"n": len(batch)}]
+        if batch_format == "numpy":
+            return {"n": [len(batch["id"])]}
+        return [{"n": batch.num_rows}]
+
+    result = run_etl_pipeline(
+        source=sample_source_data,
+        custom_transform=batch_transform(count, batch_format=batch_format),
+        chunksize=10
+    )
+
+    assert result == [{"n": 3}]
+
+
+def test_etl_pipeline_batch_transform_errors(sample_source_data):
+    """
+    Batch transform failures are wrapped in ETLError.
+    """
+    @batch_transform(batch_format="records")
+    def broken(batch):
+        raise ValueError("boom")
+
+    with pytest.raises(ETLError, match="'id': 1"):
+        run_etl_pipeline(source=sample_source_data, custom_transform=broken)
+
+    with pytest.raises(ETLError):
+        batch_transform(broken, batch_format="xml")
+
+
+def _invert_amount(record):
+    return {**record, "amount": 1 / record["amount"]}
+
+
+@batch_transform
+def _invert_amounts(df):
+    if (df["amount"] == 0).any():
+        raise ZeroDivisionError("amount is zero")
+    df["amount"] = 1 / df["amount"]
+    return df
+
+
+def test_etl_pipeline_on_error_modes():
+    """
+    Bad records are skipped or collected instead of failing the run.
+    """
+    source = [{"id": 1, "amount": 2}, "bad", {"id": 3, "amount": 0}, {"id": 4, "amount": 4}]
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(source=source, custom_transform=_invert_amount)
+
+    skipped = run_etl_pipeline(source=source, custom_transform=_invert_amount, on_error="skip")
+    assert [record["id"] for record in skipped] == [1, 4]
+
+    for transform, executor in ((_invert_amount, None), (_invert_amounts, "thread")):
+        dead_letter = DeadLetterQueue(maxsize=1)
+        result = run_etl_pipeline(
+            source=source,
+            custom_transform=transform,
+            on_error="dead_letter",
+            dead_letter=dead_letter,
+            executor=executor,
+            chunksize=2
+        )
+
+        assert [record["amount"] for record in result] == [0.5, 0.25]
+        assert dead_letter.processed == 4
+        assert dead_letter.failed == 2
+        assert dead_letter.dropped == 1
+        assert dead_letter.records[0]["record"] == "bad"
+        assert isinstance(dead_letter.records[0]["error"], ETLError)
+
+    dead_letter = DeadLetterQueue()
+    streamed = list(stream_etl_pipeline(
+        source=iter(source),
+        custom_transform=_invert_amount,
+        on_error="dead_letter",
+        dead_letter=dead_letter
+    ))
+    assert len(streamed) == 2
+    assert isinstance(dead_letter.records[1]["error"], ZeroDivisionError)
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(source=source, on_error="dead_letter")
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(source=source, on_error="ignore")
@@ -0,0 +1,56 @@
+"""
+Tests for datavitals package imports
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate import-time behaviour including:
+              1. sql_builder and etl load without pandas or concurrent.futures
+              2. Lazy package attributes load pandas only for cleaning
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    """Run code in a fresh interpreter (this one has pandas loaded already)."""
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=ROOT
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
+def test_sql_builder_and_etl_load_without_pandas():
+    """
+    Importing and using sql_builder and etl must not import pandas, NumPy or,
+    for serial runs, concurrent.futures.
+    """
+    loaded = _run(
+        "import sys\n"
+        "import datavitals.sql_builder, datavitals.etl\n"
+        "from datavitals import build_select_query, run_etl_pipeline\n"
+        "build_select_query(table='t', where={'id': 1})\n"
+        "run_etl_pipeline(source=[{'id': 1}], transform_type='double')\n"
+        "print('pandas' in sys.modules, 'numpy' in sys.modules,"
+        " 'concurrent.futures' in sys.modules)\n"
+    )
+    assert loaded == ["False", "False", "False"]
+
+
+def test_package_attributes_are_loaded_lazily():
+    """
+    import datavitals is cheap; pandas is imported when cleaning is first used.
+    """
+    loaded = _run(
+        "import sys\n"
+        "import datavitals\n"
+        "print('pandas' in sys.modules, 'datavitals.cleaning' in sys.modules)\n"
+        "datavitals.clean_dataframe\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    assert loaded == ["False", "False", "True"]
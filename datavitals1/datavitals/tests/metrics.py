@@ -0,0 +1,82 @@
+"""
+Tests for datavitals.metrics module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate run instrumentation including:
+              1. Per-stage timings, throughput and latency histograms
+              2. Hook callbacks
+              3. Cleaning statistics in pipeline reports
+              4. Profiling and memory tracing
+"""
+
+import pytest
+
+from datavitals.etl import run_etl_pipeline, ETLError
+from datavitals.metrics import RunMetrics
+from datavitals.pipeline import Pipeline
+
+
+def test_run_report_covers_every_stage(sample_source_data):
+    """
+    The report has extract, transform and load timings for each batch.
+    """
+    events = []
+    metrics = RunMetrics(hooks=[lambda event, data: events.append((event, data))])
+
+    run_etl_pipeline(
+        source=sample_source_data,
+        transform_type="double",
+        chunksize=1,
+        metrics=metrics
+    )
+    report = metrics.report()
+
+    assert report["status"] == "completed"
+    assert report["records"] == 3
+    assert set(report["stages"]) == {"extract", "transform", "load"}
+    for stage in report["stages"].values():
+        assert stage["records"] == 3
+        assert stage["batches"] == 3
+        assert stage["wall_seconds"] >= 0
+        assert sum(stage["latency_histogram"].values()) == stage["batches"]
+    assert report["wall_seconds"] >= report["stages"]["transform"]["wall_seconds"]
+
+    assert events[-1] == ("end", report)
+    batch_events = [data for event, data in events if event == "batch"]
+    assert {data["stage"] for data in batch_events} == {"extract", "transform", "load"}
+
+
+def test_run_report_is_written_on_failure(sample_source_data):
+    """
+    A failed run still produces a report.
+    """
+    metrics = RunMetrics()
+
+    with pytest.raises(ETLError):
+        run_etl_pipeline(
+            source=sample_source_data,
+            custom_transform=lambda record: 1 / 0,
+            metrics=metrics
+        )
+
+    assert metrics.report()["status"] == "failed"
+
+
+def test_pipeline_report_includes_cleaning_steps(sample_source_data):
+    """
+    Pipeline stages are timed separately and cleaning reports dropped rows.
+    """
+    metrics = RunMetrics(profile=True, trace_memory=True)
+
+    Pipeline(sample_source_data).map(lambda r: {**r, "id": 0, "amount": 0}) \
+        .clean().map("double").run(metrics=metrics, chunksize=2)
+    report = metrics.report()
+
+    assert set(report["stages"]) == {"extract", "transform", "clean", "transform_2", "load"}
+    clean = report["stages"]["clean"]
+    assert clean["rows_in"] == 3
+    assert clean["rows_dropped_duplicates"] == 2
+    assert report["records"] == 1
+    assert "cumulative" in report["profile"]
+    assert report["python_peak_bytes"] > 0
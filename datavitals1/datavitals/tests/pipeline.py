@@ -0,0 +1,132 @@
+"""
+Tests for datavitals.pipeline module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate the multi-stage pipeline including:
+              1. Chained map / filter / batch stages
+              2. Fused, lazy execution of per-record stages
+              3. Cleaning as a pipeline stage
+              4. Destinations and executors
+              5. Error handling
+"""
+
+import pandas as pd
+import pytest
+
+from datavitals.etl import ETLError, batch_transform
+from datavitals.pipeline import Pipeline
+from datavitals.sources import DataFrameSource
+
+
+def _add_tax(record):
+    return {**record, "tax": record["amount"] // 10}
+
+
+@batch_transform
+def _add_total(df):
+    df["total"] = df["amount"] + df["tax"]
+    return df
+
+
+@pytest.fixture
+def orders():
+    return [{"id": i, "amount": i * 100} for i in range(1, 11)]
+
+
+def test_pipeline_chains_stages(orders):
+    """
+    Map, filter and batch stages run in order; the base pipeline is unchanged.
+    """
+    base = Pipeline(orders)
+    pipeline = base.map(_add_tax).filter(lambda r: r["id"] % 2 == 0).map(_add_total)
+
+    result = pipeline.run(chunksize=3)
+
+    assert [record["id"] for record in result] == [2, 4, 6, 8, 10]
+    assert result[0] == {"id": 2, "amount": 200, "tax": 20, "total": 220}
+    assert base.run() == orders
+
+
+def test_pipeline_fuses_record_stages_lazily():
+    """
+    Each record passes through every per-record stage before the next is read.
+    """
+    calls = []
+
+    def source():
+        for i in range(1_000_000):
+            calls.append(("read", i))
+            yield {"id": i}
+
+    def first(record):
+        calls.append(("first", record["id"]))
+        return record
+
+    def second(record):
+        calls.append(("second", record["id"]))
+        return record
+
+    stream = Pipeline(source()).map(first).filter(lambda r: True).map(second).stream()
+
+    assert next(stream) == {"id": 0}
+    assert calls == [("read", 0), ("first", 0), ("second", 0)]
+
+
+def test_pipeline_clean_stage_dedups_across_batches():
+    """
+    The cleaning stage trims, converts and removes duplicates across batches.
+    """
+    raw = [{"name": f" user{i % 4} ", "score": str(i % 4)} for i in range(12)]
+
+    result = Pipeline(raw).clean().map("double").run(chunksize=5)
+
+    assert result == [
+        {"name": "user0", "score": 0},
+        {"name": "user1", "score": 2},
+        {"name": "user2", "score": 4},
+        {"name": "user3", "score": 6},
+    ]
+
+
+def test_pipeline_runs_with_executor_and_destination(tmp_path, orders):
+    """
+    Fused stages run in a worker pool and load into a registered destination.
+    """
+    df = pd.DataFrame(orders)
+    path = tmp_path / "orders.csv"
+
+    rows = (
+        Pipeline(DataFrameSource(df, chunksize=4))
+        .map(_add_tax)
+        .map(_add_total)
+        .run(destination="csv", destination_options={"path": str(path)},
+             executor="thread", max_workers=2)
+    )
+
+    assert rows == 10
+    written = pd.read_csv(path)
+    assert written["total"].tolist() == [record["amount"] * 11 // 10 for record in orders]
+
+    batches = list(Pipeline(orders).map(_add_tax).stream(batch_size=4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+
+
+def test_pipeline_errors(orders):
+    """
+    Invalid stages and failing records raise ETLError.
+    """
+    with pytest.raises(ETLError):
+        Pipeline(None)
+
+    with pytest.raises(ETLError):
+        Pipeline(orders).map("triple")
+
+    with pytest.raises(ETLError):
+        Pipeline(orders).clean(unknown_option=True)
+
+    with pytest.raises(ETLError, match="'id': 3"):
+        Pipeline(orders).map(lambda r: 1 / (r["id"] - 3)).run()
+
+    with pytest.raises(ETLError):
+        Pipeline(orders).map(lambda r: r).run(executor="process")
@@ -0,0 +1,177 @@
+"""
+Tests for datavitals.sources module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate ETL sources including:
+              1. CSV, JSON Lines and Parquet file readers
+              2. SQLite query streaming
+              3. DataFrame slicing without dict conversion
+              4. DB-API query streaming with fetchmany, keyset pages and read-ahead
+"""
+
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from datavitals.cleaning import clean_chunks
+from datavitals.etl import run_etl_pipeline, stream_etl_pipeline, ETLError
+from datavitals.sources import (
+    CSVSource,
+    DataFrameSource,
+    JSONLinesSource,
+    ParquetSource,
+    SQLiteSource,
+    SQLSource,
+)
+
+
+@pytest.fixture
+def sample_frame():
+    return pd.DataFrame({"id": [1, 2, 3, 4, 5], "amount": [10, 20, 30, 40, 50]})
+
+
+def test_csv_source_reads_chunks(tmp_path, sample_frame):
+    """
+    CSV files are read lazily as DataFrame chunks.
+    """
+    path = tmp_path / "in.csv"
+    sample_frame.to_csv(path, index=False)
+
+    source = CSVSource(str(path), chunksize=2)
+    result = run_etl_pipeline(source=source, transform_type="double")
+
+    assert [len(batch) for batch in source.iter_batches()] == [2, 2, 1]
+    assert result[0] == {"id": 2, "amount": 20}
+    assert len(result) == 5
+
+
+def test_jsonl_source_streams_records(tmp_path):
+    """
+    JSON Lines files are read through a memory map, skipping blank lines.
+    """
+    path = tmp_path / "in.jsonl"
+    lines = [json.dumps({"id": i, "amount": i * 10}) for i in range(1, 4)]
+    path.write_text("\n".join(lines[:2]) + "\n\n" + lines[2] + "\n", encoding="utf-8")
+
+    records = list(stream_etl_pipeline(
+        source=JSONLinesSource(str(path), chunksize=2),
+        transform_type="double"
+    ))
+
+    assert records == [
+        {"id": 2, "amount": 20},
+        {"id": 4, "amount": 40},
+        {"id": 6, "amount": 60},
+    ]
+
+    with pytest.raises(ETLError):
+        JSONLinesSource(str(tmp_path / "missing.jsonl"))
+
+
+def test_parquet_source_reads_batches(tmp_path, sample_frame):
+    """
+    Parquet files are read batch by batch.
+    """
+    pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "in.parquet"
+    sample_frame.to_parquet(path, index=False)
+
+    source = ParquetSource(str(path), chunksize=2, columns=["amount"])
+    result = run_etl_pipeline(source=source)
+
+    assert result == [{"amount": value} for value in [10, 20, 30, 40, 50]]
+
+
+def test_sqlite_source_uses_fetchmany():
+    """
+    SQLite query results are streamed in chunks of dicts.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER, amount INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, i * 10) for i in range(7)])
+
+    source = SQLiteSource(conn, "SELECT * FROM t WHERE id >= ?", (2,), chunksize=3)
+
+    assert [len(batch) for batch in source.iter_batches()] == [3, 2]
+    assert list(source)[0] == {"id": 2, "amount": 20}
+
+
+@pytest.fixture
+def orders_db(tmp_path):
+    path = str(tmp_path / "orders.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, name TEXT, amount INTEGER)")
+    conn.executemany(
+        "INSERT INTO orders VALUES (?, ?, ?)",
+        [(i, f" user{i % 3} ", i * 10) for i in range(1, 26)],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_sql_source_streams_builder_queries(orders_db):
+    """
+    DB-API queries are built with sql_builder and streamed with fetchmany or keyset pages.
+    """
+    conn = sqlite3.connect(orders_db)
+
+    source = SQLSource(conn, table="orders", where={"name": [" user1 ", " user2 "]}, chunksize=5)
+    assert [len(batch) for batch in source.iter_batches()] == [5, 5, 5, 2]
+
+    source = SQLSource(conn, table="orders", columns=["id", "amount"], keyset=["id"], chunksize=10)
+    assert [len(batch) for batch in source.iter_batches()] == [10, 10, 5]
+    result = run_etl_pipeline(source=source, transform_type="double")
+    assert result[:2] == [{"id": 2, "amount": 20}, {"id": 4, "amount": 40}]
+    assert len(result) == 25
+
+    # Watermark filters are pushed into the query
+    assert len(run_etl_pipeline(source=source, watermark="id", since=20)) == 5
+
+    with pytest.raises(ETLError):
+        list(SQLSource(conn, table="orders", columns=["amount"], keyset=["id"],
+                       chunksize=10).iter_batches())
+    with pytest.raises(ETLError):
+        SQLSource(conn, table="orders", where="id = 1")
+
+
+def test_sql_source_reads_ahead_into_dataframes(orders_db):
+    """
+    With a connection factory, batches are fetched ahead on a background thread.
+    """
+    source = SQLSource(
+        lambda: sqlite3.connect(orders_db), table="orders",
+        keyset=["id"], chunksize=10, as_frame=True, prefetch=2,
+    )
+    frames = list(clean_chunks(source.iter_batches()))
+
+    assert [len(frame) for frame in frames] == [10, 10, 5]
+    assert frames[0]["name"].iloc[0] == "user1"
+
+    batches = SQLSource(lambda: sqlite3.connect(orders_db), table="orders",
+                        chunksize=5, prefetch=1).iter_batches()
+    assert len(next(batches)) == 5
+    batches.close()
+
+    with pytest.raises(sqlite3.OperationalError):
+        list(SQLSource(lambda: sqlite3.connect(orders_db), table="missing",
+                       prefetch=1).iter_batches())
+
+
+def test_dataframe_source_keeps_batches_columnar(sample_frame):
+    """
+    DataFrame sources hand slices (not dicts) to batch-aware stages.
+    """
+    source = DataFrameSource(sample_frame, chunksize=2)
+
+    batches = list(source.iter_batches())
+    result = run_etl_pipeline(source=source, transform_type="double")
+
+    assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+    assert [record["amount"] for record in result] == [20, 40, 60, 80, 100]
+
+    with pytest.raises(ETLError):
+        DataFrameSource([{"id": 1}])
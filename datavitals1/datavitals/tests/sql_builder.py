@@ -9,10 +9,21 @@ Purpose      : Validate SQL Builder including:
               3. Limit clause
               4. Edge cases like empty columns
               5. Error handling
+              6. Parameterized (sql, params) output and template caching
+              7. IN-lists, parameter limits and batched key lookups
+              8. QueryBuilder operators, joins, aggregates and keyset pagination
 """
 
+import sqlite3
+
 import pytest
-from datavitals.sql_builder import build_select_query, SQLBuilderError
+from datavitals.sql_builder import (
+    build_select_query,
+    build_batch_lookup,
+    QueryBuilder,
+    SQLBuilderError,
+    _select_template,
+)
 
 
 def test_basic_select_query():
@@ -105,3 +116,260 @@ def test_invalid_limit_type():
     """
     with pytest.raises(SQLBuilderError):
         build_select_query(table="users", limit=-5)
+
+
+def test_inline_strings_are_escaped():
+    """
+    Quotes inside string values must be escaped in inline mode.
+    """
+    query = build_select_query(table="users", where={"name": "O'Brien"})
+
+    assert query == "SELECT * FROM users WHERE name = 'O''Brien'"
+
+
+def test_parameterized_query_against_sqlite():
+    """
+    qmark and named output run on sqlite3; repeated shapes reuse the cached SQL.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER, name TEXT, team TEXT)")
+    conn.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)",
+        [(1, "O'Brien", "a"), (2, "Bob", None), (3, "Cara", "a")],
+    )
+
+    sql, params = build_select_query(
+        table="users", columns=["id"], where={"name": "O'Brien", "team": "a"},
+        paramstyle="qmark"
+    )
+    assert sql == "SELECT id FROM users WHERE name = ? AND team = ?"
+    assert params == ("O'Brien", "a")
+    assert conn.execute(sql, params).fetchall() == [(1,)]
+
+    sql, params = build_select_query(
+        table="users", columns=["id"], where={"name": "Bob", "team": None},
+        paramstyle="named"
+    )
+    assert sql == "SELECT id FROM users WHERE name = :name AND team IS NULL"
+    assert params == {"name": "Bob"}
+    assert conn.execute(sql, params).fetchall() == [(2,)]
+
+    sql, params = build_select_query(
+        table="users", where={"team": "a"}, limit=5, paramstyle="pyformat"
+    )
+    assert sql == "SELECT * FROM users WHERE team = %(team)s LIMIT 5"
+    assert params == {"team": "a"}
+
+    _select_template.cache_clear()
+    for user_id in range(3):
+        sql, params = build_select_query(
+            table="users", where={"id": user_id}, paramstyle="qmark"
+        )
+        assert params == (user_id,)
+    assert _select_template.cache_info().hits == 2
+
+    with pytest.raises(SQLBuilderError):
+        build_select_query(table="users", where={"id": 1}, paramstyle="format")
+
+
+def test_list_values_become_in_lists():
+    """
+    List values are rendered as IN (...), inline and parameterized.
+    """
+    query = build_select_query(table="users", where={"id": [1, 2], "team": "a"})
+    assert query == "SELECT * FROM users WHERE id IN (1, 2) AND team = 'a'"
+
+    sql, params = build_select_query(
+        table="users", where={"id": [1, 2], "team": "a"}, paramstyle="named"
+    )
+    assert sql == "SELECT * FROM users WHERE id IN (:id_0, :id_1) AND team = :team"
+    assert params == {"id_0": 1, "id_1": 2, "team": "a"}
+
+    assert build_select_query(table="users", where={"id": []}) == \
+        "SELECT * FROM users WHERE 1 = 0"
+
+
+def test_parameterized_in_list_respects_max_params():
+    """
+    An IN-list beyond SQLite's parameter limit raises instead of failing at execute time.
+    """
+    ids = list(range(1000))
+
+    with pytest.raises(SQLBuilderError, match="build_batch_lookup"):
+        build_select_query(table="users", where={"id": ids, "team": "a"}, paramstyle="qmark")
+
+    sql, params = build_select_query(
+        table="users", where={"id": ids}, paramstyle="qmark", max_params=1000
+    )
+    assert len(params) == 1000
+
+    # Inlined values bind no parameters
+    assert build_select_query(table="users", where={"id": ids}).endswith("998, 999)")
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER)")
+    sql, params = build_select_query(table="users", where={"id": ids[:999]}, paramstyle="qmark")
+    assert conn.execute(sql, params).fetchall() == []
+
+    with pytest.raises(SQLBuilderError):
+        build_select_query(table="users", where={"id": 1}, paramstyle="qmark", max_params=0)
+
+
+def test_batch_lookup_passes_max_params_to_in_lists():
+    """
+    A max_params above SQLite's default is honoured by the "in" strategy.
+    """
+    queries = build_batch_lookup(
+        table="t", keys=[{"id": i} for i in range(3000)], max_params=2000
+    )
+
+    assert [len(params) for _, params in queries] == [2000, 1000]
+
+
+@pytest.mark.parametrize("paramstyle", ["qmark", None])
+def test_batch_lookup_null_keys_match_nothing(paramstyle):
+    """
+    Every strategy treats NULL key values as matching nothing.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE orders (region TEXT, id INTEGER)")
+    conn.executemany("INSERT INTO orders VALUES (?, ?)", [(None, 1), ("eu", 2), ("eu", None)])
+    keys = [{"region": None, "id": 1}, {"region": "eu", "id": 2}, {"region": "eu", "id": None}]
+
+    for strategy in ("in", "values"):
+        found = []
+        for query in build_batch_lookup(table="orders", keys=keys, strategy=strategy,
+                                        paramstyle=paramstyle):
+            if paramstyle is None:
+                found.extend(conn.execute(query).fetchall())
+            else:
+                found.extend(conn.execute(*query).fetchall())
+        assert found == [("eu", 2)], strategy
+
+
+@pytest.mark.parametrize("strategy", ["in", "values"])
+def test_batch_lookup_against_sqlite(strategy):
+    """
+    Batched lookups return the same rows as one query per key, in few round trips.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE orders (region TEXT, id INTEGER, amount INTEGER)")
+    rows = [(region, i, i * 10) for region in ("eu", "us") for i in range(50)]
+    conn.executemany("INSERT INTO orders VALUES (?, ?, ?)", rows)
+
+    keys = [{"region": "eu", "id": i} for i in range(0, 50, 2)]
+    keys += [{"region": "us", "id": 7}, {"region": "us", "id": 7}, {"region": "eu", "id": 99}]
+    queries = build_batch_lookup(
+        table="orders", keys=keys, columns=["id", "amount"],
+        where={"amount": [i * 10 for i in range(40)]},
+        strategy=strategy, max_params=100,
+    )
+
+    found = set()
+    for sql, params in queries:
+        assert len(params) <= 100
+        found.update(conn.execute(sql, params).fetchall())
+
+    expected = {(i, i * 10) for i in range(0, 40, 2)} | {(7, 70)}
+    assert found == expected
+    # eu keys share one IN-list, the us key needs its own query
+    assert len(queries) == {"in": 2, "values": 1}[strategy]
+
+    assert build_batch_lookup(table="orders", keys=[]) == []
+    with pytest.raises(SQLBuilderError):
+        build_batch_lookup(table="orders", keys=[{"id": 1}, {"region": "eu"}])
+    with pytest.raises(SQLBuilderError):
+        build_batch_lookup(table="orders", keys=[{"id": 1}], where={"id": 2})
+
+
+@pytest.fixture
+def events_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT, score INTEGER)")
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?, ?)",
+        [(i, "ab"[i % 2], i % 7) for i in range(1, 101)],
+    )
+    conn.execute("CREATE TABLE kinds (kind TEXT, label TEXT)")
+    conn.executemany("INSERT INTO kinds VALUES (?, ?)", [("a", "Alpha"), ("b", "Beta")])
+    return conn
+
+
+def test_query_builder_operators_joins_and_aggregates(events_db):
+    """
+    Operators, joins, GROUP BY / HAVING and ORDER BY render and run on sqlite3.
+    """
+    base = QueryBuilder("events")
+    query = (
+        base
+        .join("kinds", on={"events.kind": "kinds.kind"})
+        .where("score", "between", (2, 4))
+        .where("kinds.label", "like", "A%")
+        .where("id", "not in", [3])
+        .where("events.kind", "is not null")
+        .select("kinds.label")
+        .aggregate(n=("count", "*"), top=("max", "score"))
+        .group_by("kinds.label")
+        .having("COUNT(*)", ">=", 1)
+        .order_by("n DESC")
+    )
+
+    assert str(query) == (
+        "SELECT kinds.label, COUNT(*) AS n, MAX(score) AS top FROM events "
+        "JOIN kinds ON events.kind = kinds.kind "
+        "WHERE score BETWEEN 2 AND 4 AND kinds.label LIKE 'A%' AND id NOT IN (3) "
+        "AND events.kind IS NOT NULL "
+        "GROUP BY kinds.label HAVING COUNT(*) >= 1 ORDER BY n DESC"
+    )
+    sql, params = query.build(paramstyle="qmark")
+    assert params == (2, 4, "A%", 3, 1)
+    expected = events_db.execute(
+        "SELECT COUNT(*), MAX(score) FROM events "
+        "WHERE kind = 'a' AND score BETWEEN 2 AND 4 AND id != 3"
+    ).fetchone()
+    assert events_db.execute(sql, params).fetchall() == [("Alpha",) + expected]
+
+    # The builder is immutable
+    assert str(base) == "SELECT * FROM events"
+    assert str(base.where(kind=None, id=[1, 2])) == \
+        "SELECT * FROM events WHERE kind IS NULL AND id IN (1, 2)"
+
+    with pytest.raises(SQLBuilderError):
+        base.where("score", "~", 1)
+    with pytest.raises(SQLBuilderError):
+        base.where("score", "between", 1)
+    with pytest.raises(SQLBuilderError):
+        base.aggregate(total=("median", "score"))
+    with pytest.raises(SQLBuilderError):
+        base.join("kinds")
+
+
+@pytest.mark.parametrize("paramstyle", [None, "qmark", "named"])
+def test_query_builder_keyset_pagination(events_db, paramstyle):
+    """
+    Paging with after() visits every row once, in order, without OFFSET.
+    """
+    base = QueryBuilder("events").order_by("score DESC", "id").limit(13)
+    rows = []
+    page = base
+    while True:
+        query = page.build(paramstyle=paramstyle)
+        sql, params = (query, ()) if paramstyle is None else query
+        assert "OFFSET" not in sql
+        chunk = events_db.execute(sql, params).fetchall()
+        if not chunk:
+            break
+        rows.extend(chunk)
+        last = chunk[-1]
+        page = base.after({"id": last[0], "score": last[2]})
+
+    assert rows == events_db.execute(
+        "SELECT * FROM events ORDER BY score DESC, id"
+    ).fetchall()
+
+    one_direction = QueryBuilder("events").order_by("score", "id").after((3, 10))
+    assert one_direction.build(paramstyle="qmark") == (
+        "SELECT * FROM events WHERE (score, id) > (?, ?) ORDER BY score, id", (3, 10)
+    )
+    with pytest.raises(SQLBuilderError):
+        QueryBuilder("events").after((1,)).build()
@@ -0,0 +1,128 @@
+"""
+Tests for datavitals.vitals module
+
+Author       : Kamaleshkumar.K
+Project Name : datavitals
+Purpose      : Validate data quality profiles including:
+              1. Per-column nulls, distinct counts, min/max and parse failures
+              2. Duplicate-row rate
+              3. Chunked profiles and merging partition profiles
+              4. Distinct-count and duplicate estimates on large inputs
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datavitals.cleaning import DataCleaningError
+from datavitals.vitals import DataProfile, profile_dataframe, profile_chunks
+
+
+def _frame():
+    return pd.DataFrame({
+        "id": [1, 2, 2, 3, None],
+        "name": [" alice", "bob", "bob", None, "carol"],
+        "amount": ["10", "20", "20", "n/a", "30"],
+        "mixed": [1, "a", "a", 2.5, None],
+    })
+
+
+def test_profile_reports_column_vitals():
+    """
+    Nulls, distinct values, min/max and numeric-parse failures are reported per column.
+    """
+    report = profile_dataframe(_frame()).report()
+    columns = report["columns"]
+
+    assert report["rows"] == 5
+    assert columns["id"]["nulls"] == 1
+    assert columns["id"]["null_rate"] == pytest.approx(0.2)
+    assert columns["id"]["distinct"] == 3
+    assert (columns["id"]["min"], columns["id"]["max"]) == (1.0, 3.0)
+
+    assert columns["name"]["count"] == 4
+    assert columns["name"]["distinct"] == 3
+    assert (columns["name"]["min"], columns["name"]["max"]) == (" alice", "carol")
+
+    assert columns["amount"]["numeric_parse_failures"] == 1
+    assert columns["amount"]["numeric_parse_failure_rate"] == pytest.approx(0.2)
+    assert columns["id"]["numeric_parse_failures"] == 0
+
+    # Values that cannot be compared have no min/max
+    assert columns["mixed"]["min"] is None and columns["mixed"]["max"] is None
+
+
+def test_profile_reports_duplicate_rows():
+    """
+    Rows equal to an earlier row count as duplicates.
+    """
+    report = profile_dataframe(_frame()).report()
+
+    assert report["duplicate_rows"] == 1
+    assert report["duplicate_rate"] == pytest.approx(0.2)
+
+
+def test_chunked_and_merged_profiles_match_one_pass():
+    """
+    Profiling chunks, or merging profiles of partitions, gives the one-pass result.
+    """
+    df = _frame()
+    expected = profile_dataframe(df).report()
+
+    chunks = [df.iloc[:2], df.iloc[2:]]
+    assert profile_chunks(chunks).report() == expected
+
+    # Partition profiles are picklable, so parallel workers can return them
+    left = profile_dataframe(df.iloc[:3])
+    right = pickle.loads(pickle.dumps(profile_dataframe(df.iloc[3:])))
+    assert left.merge(right).report() == expected
+
+
+def test_int_and_float_chunks_count_the_same_values():
+    """
+    A chunk read as float (because of nulls) does not double the distinct count.
+    """
+    profile = profile_chunks([
+        pd.DataFrame({"x": [1, 2]}),
+        pd.DataFrame({"x": [1.0, None]}),
+    ])
+    column = profile.report()["columns"]["x"]
+
+    assert column["distinct"] == 2
+    assert column["dtype"] == "int64, float64"
+    assert profile.report()["duplicate_rows"] == 1
+
+
+def test_estimates_on_large_inputs():
+    """
+    Past the exact range, distinct counts and the duplicate rate stay close to exact.
+    """
+    rng = np.random.default_rng(7)
+    rows = 200_000
+    ids = rng.integers(0, 150_000, rows)
+    df = pd.DataFrame({"id": ids, "kind": np.where(ids % 2, "odd", "even")})
+    chunks = [df.iloc[start:start + 50_000] for start in range(0, rows, 50_000)]
+
+    report = profile_chunks(chunks, precision=12).report()
+    exact_distinct = len(np.unique(ids))
+    exact_duplicates = int(df.duplicated().sum())
+
+    assert report["columns"]["id"]["distinct"] == pytest.approx(exact_distinct, rel=0.05)
+    assert report["columns"]["kind"]["distinct"] == 2
+    assert report["duplicate_rate"] == pytest.approx(exact_duplicates / rows, abs=0.02)
+
+
+def test_profile_validates_input():
+    """
+    Invalid inputs and incompatible merges raise DataCleaningError.
+    """
+    with pytest.raises(DataCleaningError):
+        profile_dataframe([{"a": 1}])
+    with pytest.raises(DataCleaningError):
+        profile_chunks(pd.DataFrame({"a": [1]}))
+    with pytest.raises(DataCleaningError):
+        DataProfile(precision=2)
+    with pytest.raises(DataCleaningError):
+        DataProfile(precision=12).merge(DataProfile(precision=14))